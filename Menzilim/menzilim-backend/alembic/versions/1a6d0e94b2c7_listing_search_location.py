@@ -0,0 +1,75 @@
+"""Full-text search document and map location on listings
+
+Revision ID: 1a6d0e94b2c7
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+Stored generated columns on listings, each with its index:
+
+- search_vector: tsvector for full-text search (app/utils/text_search.py), GIN
+- location: projected point for map clustering and /listings/nearby
+  (app/utils/geo.py), GiST
+
+ADD COLUMN IF NOT EXISTS and CREATE INDEX CONCURRENTLY IF NOT EXISTS leave
+databases created by create_all() with the current models as they are.
+Adding the columns rewrites the table once per column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1a6d0e94b2c7"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Expressions as of this revision (app/utils/text_search.py, app/utils/geo.py).
+# Frozen here: changing them later needs a new revision that rebuilds the column.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce(title, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce(city, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc') || ' ' || translate(coalesce(district, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce(address, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce(description, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'D') || "
+    "setweight(to_tsvector('english'::regconfig, translate(coalesce(title, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, translate(coalesce(description, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'D') || "
+    "setweight(to_tsvector('russian'::regconfig, translate(coalesce(title, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'A') || "
+    "setweight(to_tsvector('russian'::regconfig, translate(coalesce(description, ''), 'ƏəİIıÖöÜüĞğŞşÇç', 'eeiiioouuggsscc')), 'D')"
+)
+LOCATION_SQL = "point(longitude * 0.761538, latitude)"
+
+# (column, type, generated expression, index, index method)
+COLUMNS = [
+    ("search_vector", "tsvector", SEARCH_VECTOR_SQL, "ix_listings_search_vector", "gin"),
+    ("location", "point", LOCATION_SQL, "ix_listings_location", "gist"),
+]
+
+
+def upgrade() -> None:
+    for column, type_, expression, _, _ in COLUMNS:
+        op.execute(
+            f"ALTER TABLE listings ADD COLUMN IF NOT EXISTS {column} {type_} "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+    with op.get_context().autocommit_block():
+        for column, _, _, index, method in COLUMNS:
+            op.create_index(
+                index,
+                "listings",
+                [column],
+                postgresql_using=method,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for _, _, _, index, _ in reversed(COLUMNS):
+            op.drop_index(
+                index, table_name="listings", postgresql_concurrently=True, if_exists=True
+            )
+    for column, _, _, _, _ in reversed(COLUMNS):
+        op.execute(f"ALTER TABLE listings DROP COLUMN IF EXISTS {column}")
@@ -0,0 +1,73 @@
+"""Composite indexes for listing, favorite and notification list queries
+
+Revision ID: 3f9c2d71a4e8
+Revises: 1a6d0e94b2c7
+Create Date: 2026-10-19 12:00:00.000000
+
+Indexes are built CONCURRENTLY (no write lock on a live table) and with
+IF NOT EXISTS, so databases created by create_all() with the current models
+are left as they are. scripts/check_query_plans.py asserts the list queries
+use them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2d71a4e8"
+down_revision: Union[str, None] = "1a6d0e94b2c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ("ix_listings_status_boosted_created", "listings",
+     ["status", "is_boosted", "created_at", "id"], None),
+    ("ix_listings_status_boosted_price", "listings",
+     ["status", "is_boosted", "price", "id"], None),
+    ("ix_listings_status_unboosted_price", "listings",
+     ["status", sa.text("(NOT is_boosted)"), "price", "id"], None),
+    ("ix_listings_status_boosted_views", "listings",
+     ["status", "is_boosted", "views_count", "id"], None),
+    ("ix_listings_agent_boosted_created", "listings",
+     ["agent_id", "is_boosted", "created_at", "id"], None),
+    ("ix_favorites_user_created", "favorites",
+     ["user_id", "created_at", "id"], None),
+    ("ix_notifications_user_created", "notifications",
+     ["user_id", "created_at", "id"], None),
+    ("ix_notifications_user_unread", "notifications",
+     ["user_id"], "NOT is_read"),
+]
+
+# Leading columns of the composites above
+REPLACED_INDEXES = [
+    ("ix_listings_status", "listings", ["status"]),
+    ("ix_listings_agent_id", "listings", ["agent_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,43 @@
+"""Index on listings.updated_at for the search index sync
+
+Revision ID: 5e2b8c0d7a13
+Revises: c4a7e2d91f05
+Create Date: 2026-10-19 18:00:00.000000
+
+Every worker with SEARCH_INDEX_ENABLED re-reads listings WHERE updated_at >=
+:since every SEARCH_INDEX_SYNC_SECONDS; without an index each sync scans the
+table. Not partial: status changes and boost expiry also bump updated_at and
+the sync must see listings that left the active set. Built CONCURRENTLY and
+IF NOT EXISTS, as in 3f9c2d71a4e8.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2b8c0d7a13"
+down_revision: Union[str, None] = "c4a7e2d91f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_listings_updated_at",
+            "listings",
+            ["updated_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_listings_updated_at",
+            table_name="listings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
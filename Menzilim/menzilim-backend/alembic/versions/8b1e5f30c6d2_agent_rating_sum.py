@@ -0,0 +1,46 @@
+"""Running rating sum on agents
+
+Revision ID: 8b1e5f30c6d2
+Revises: 3f9c2d71a4e8
+Create Date: 2026-10-19 15:30:00.000000
+
+agents.rating_sum holds the sum of the agent's review ratings, so review
+writes update the average without re-reading every review. Backfills
+rating_sum, total_reviews and rating from the reviews table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e5f30c6d2"
+down_revision: Union[str, None] = "3f9c2d71a4e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: create_all() at startup may have added the column already
+    op.execute("ALTER TABLE agents ADD COLUMN IF NOT EXISTS rating_sum integer NOT NULL DEFAULT 0")
+    op.execute(
+        """
+        UPDATE agents AS a
+        SET rating_sum = t.rating_sum,
+            total_reviews = t.total_reviews,
+            rating = CASE WHEN t.total_reviews > 0
+                          THEN round(t.rating_sum::numeric / t.total_reviews, 2)::float
+                          ELSE 0 END
+        FROM (
+            SELECT agents.id, coalesce(sum(reviews.rating), 0) AS rating_sum,
+                   count(reviews.id) AS total_reviews
+            FROM agents LEFT JOIN reviews ON reviews.agent_id = agents.id
+            GROUP BY agents.id
+        ) AS t
+        WHERE a.id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE agents DROP COLUMN IF EXISTS rating_sum")
@@ -0,0 +1,43 @@
+"""Partial index for the boost expiry sweep
+
+Revision ID: c4a7e2d91f05
+Revises: 8b1e5f30c6d2
+Create Date: 2026-10-19 17:00:00.000000
+
+app/services/boost_expiry.py looks up boosted listings by boost_expires_at;
+only boosted rows are indexed. Built CONCURRENTLY and IF NOT EXISTS, as in
+3f9c2d71a4e8.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a7e2d91f05"
+down_revision: Union[str, None] = "8b1e5f30c6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_listings_boost_expires",
+            "listings",
+            ["boost_expires_at"],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("is_boosted"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_listings_boost_expires",
+            table_name="listings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
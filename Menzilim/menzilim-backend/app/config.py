@@ -43,6 +43,28 @@ class Settings(BaseSettings):
     APPLE_VERIFY_URL: str = "https://buy.itunes.apple.com/verifyReceipt"
     APPLE_SANDBOX_VERIFY_URL: str = "https://sandbox.itunes.apple.com/verifyReceipt"
 
+    # In-memory listing search index (per worker, see app/services/search_index.py)
+    SEARCH_INDEX_ENABLED: bool = False
+    SEARCH_INDEX_SYNC_SECONDS: int = 30
+
+    # Listing view counter: "memory" (per worker) or "redis" (shared)
+    VIEW_COUNTER_BACKEND: str = "memory"
+    VIEW_FLUSH_SECONDS: int = 10
+    VIEW_DEDUP_SECONDS: int = 1800
+
+    # Agent rating totals are recomputed from reviews this often (drift repair)
+    AGENT_RATING_RECONCILE_SECONDS: int = 3600
+
+    # Per-user favorite ids for is_favorited (per worker, see app/services/favorite_cache.py);
+    # "redis" shares add/remove invalidations between workers
+    FAVORITE_CACHE_BACKEND: str = "memory"
+    FAVORITE_CACHE_SECONDS: int = 30
+    FAVORITE_CACHE_MAX_USERS: int = 10000
+
+    # Expired listing boosts are cleared this often, up to BOOST_EXPIRY_BATCH rows per UPDATE
+    BOOST_EXPIRY_SECONDS: int = 60
+    BOOST_EXPIRY_BATCH: int = 1000
+
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
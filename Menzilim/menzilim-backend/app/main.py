@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -7,7 +8,7 @@ from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
-from app.database import engine, Base
+from app.database import engine, Base, async_session_factory
 from app.routers import (
     auth,
     users,
@@ -20,6 +21,11 @@ from app.routers import (
     notifications,
     payments,
 )
+from app.services.agent_rating import agent_rating
+from app.services.boost_expiry import boost_expiry
+from app.services.favorite_cache import favorite_cache
+from app.services.search_index import search_index
+from app.services.view_counter import view_counter
 
 settings = get_settings()
 
@@ -41,9 +47,27 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created/verified.")
 
+    # Build the in-memory search index in the background; SQL search serves until it is ready
+    search_index_task = None
+    if settings.SEARCH_INDEX_ENABLED:
+        search_index_task = asyncio.create_task(search_index.run(async_session_factory))
+
+    view_counter_task = asyncio.create_task(view_counter.run(async_session_factory))
+    agent_rating_task = asyncio.create_task(agent_rating.run(async_session_factory))
+    boost_expiry_task = asyncio.create_task(boost_expiry.run(async_session_factory))
+
     yield
 
     # Shutdown
+    if search_index_task is not None:
+        search_index_task.cancel()
+    view_counter_task.cancel()
+    agent_rating_task.cancel()
+    boost_expiry_task.cancel()
+    # Let a flush interrupted mid-write put its views back before the final flush
+    await asyncio.gather(view_counter_task, return_exceptions=True)
+    await view_counter.close(async_session_factory)
+    await favorite_cache.close()
     await engine.dispose()
     logger.info("Menzilim API shut down.")
 
@@ -32,7 +32,9 @@ class Agent(Base):
     company_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     license_number: Mapped[str | None] = mapped_column(String(100), nullable=True)
     level: Mapped[int] = mapped_column(Integer, default=1)
+    # rating = rating_sum / total_reviews, maintained by app/services/agent_rating.py
     rating: Mapped[float] = mapped_column(Float, default=0.0)
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     total_reviews: Mapped[int] = mapped_column(Integer, default=0)
     total_listings: Mapped[int] = mapped_column(Integer, default=0)
     total_sales: Mapped[int] = mapped_column(Integer, default=0)
@@ -53,8 +55,9 @@ class Agent(Base):
     listings: Mapped[list["Listing"]] = relationship(
         "Listing", back_populates="agent", lazy="selectin"
     )
+    # Not loaded with the agent: an agent can have thousands of reviews
     reviews: Mapped[list["Review"]] = relationship(
-        "Review", back_populates="agent", lazy="selectin"
+        "Review", back_populates="agent", lazy="raise", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -36,6 +36,8 @@ class Favorite(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "listing_id", name="uq_user_listing_favorite"),
+        # "My favorites", newest first
+        Index("ix_favorites_user_created", "user_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
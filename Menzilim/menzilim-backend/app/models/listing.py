@@ -4,6 +4,8 @@ from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    Computed,
+    Index,
     String,
     Boolean,
     Integer,
@@ -14,11 +16,14 @@ from sqlalchemy import (
     Numeric,
     Enum as SAEnum,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy.dialects.postgresql import UUID, JSON, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.geo import LISTING_LOCATION_SQL, Point
+from app.utils.text_search import LISTING_SEARCH_VECTOR_SQL
 
 
 class ListingType(str, enum.Enum):
@@ -66,6 +71,26 @@ class BoostType(str, enum.Enum):
 
 class Listing(Base):
     __tablename__ = "listings"
+    __table_args__ = (
+        Index("ix_listings_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_listings_location", "location", postgresql_using="gist"),
+        # List pages: status filter + boosted-first sort + id tiebreak (see
+        # app/utils/pagination.py). Scanned backward for descending sorts;
+        # ascending ones sort on NOT is_boosted to keep a single direction.
+        Index("ix_listings_status_boosted_created", "status", "is_boosted", "created_at", "id"),
+        Index("ix_listings_status_boosted_price", "status", "is_boosted", "price", "id"),
+        Index(
+            "ix_listings_status_unboosted_price", "status", text("(NOT is_boosted)"), "price", "id"
+        ),
+        Index("ix_listings_status_boosted_views", "status", "is_boosted", "views_count", "id"),
+        Index("ix_listings_agent_boosted_created", "agent_id", "is_boosted", "created_at", "id"),
+        # Search index sync (app/services/search_index.py): rows changed since the last sync
+        Index("ix_listings_updated_at", "updated_at"),
+        # Boost expiry sweep (app/services/boost_expiry.py): only boosted rows
+        Index(
+            "ix_listings_boost_expires", "boost_expires_at", postgresql_where=text("is_boosted")
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -80,7 +105,6 @@ class Listing(Base):
         UUID(as_uuid=True),
         ForeignKey("agents.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -106,6 +130,12 @@ class Listing(Base):
     address: Mapped[str | None] = mapped_column(String(500), nullable=True)
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Projected point for the GiST spatial index (see app/utils/geo.py)
+    location: Mapped[str | None] = mapped_column(
+        Point,
+        Computed(LISTING_LOCATION_SQL, persisted=True),
+        deferred=True,
+    )
     rooms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     area_sqm: Mapped[float | None] = mapped_column(Float, nullable=True)
     floor: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -119,7 +149,6 @@ class Listing(Base):
     status: Mapped[ListingStatus] = mapped_column(
         SAEnum(ListingStatus, name="listing_status", create_constraint=True),
         default=ListingStatus.PENDING,
-        index=True,
     )
     views_count: Mapped[int] = mapped_column(Integer, default=0)
     is_boosted: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -136,12 +165,19 @@ class Listing(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    # Full-text search document, maintained by Postgres (see app/utils/text_search.py)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(LISTING_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="listings")
     agent: Mapped["Agent | None"] = relationship("Agent", back_populates="listings")
+    # Not loaded with the listing: is_favorited comes from app/services/favorite_cache.py
     favorites: Mapped[list["Favorite"]] = relationship(
-        "Favorite", back_populates="listing", lazy="selectin"
+        "Favorite", back_populates="listing", lazy="raise", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@ import uuid
 import enum
 from datetime import datetime
 
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Index, Enum as SAEnum, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,12 @@ class NotificationType(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Notification list, newest first
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+        # Unread badge count
+        Index("ix_notifications_user_unread", "user_id", postgresql_where=text("NOT is_read")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
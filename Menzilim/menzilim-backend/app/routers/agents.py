@@ -1,8 +1,7 @@
 import uuid
-import math
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,7 +11,9 @@ from app.models.agent import Agent
 from app.models.listing import Listing, ListingStatus
 from app.schemas.agent import AgentResponse, AgentUpdateRequest, AgentListResponse
 from app.schemas.listing import ListingResponse, ListingListResponse
-from app.utils.dependencies import get_current_user, pagination_params
+from app.services.favorite_cache import favorite_cache
+from app.utils.dependencies import cursor_pagination_params, get_current_user, get_optional_user_id
+from app.utils.pagination import boosted_first, paginate
 
 router = APIRouter(prefix="/agents", tags=["Agents"])
 
@@ -22,7 +23,7 @@ async def list_agents(
     sort_by: str = Query("rating", enum=["rating", "level", "total_sales", "total_reviews"]),
     sort_order: str = Query("desc", enum=["asc", "desc"]),
     is_premium: bool | None = None,
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
     db: AsyncSession = Depends(get_db),
 ):
     """List all agents with sorting and pagination."""
@@ -31,36 +32,21 @@ async def list_agents(
     if is_premium is not None:
         query = query.where(Agent.is_premium == is_premium)
 
-    # Count total
-    count_query = select(func.count()).select_from(
-        select(Agent.id).where(
-            Agent.is_premium == is_premium if is_premium is not None else True
-        ).subquery()
-    ) if is_premium is not None else select(func.count(Agent.id))
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Sorting
+    # Sorting (id breaks ties)
     sort_column = getattr(Agent, sort_by, Agent.rating)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
-    result = await db.execute(query)
-    agents = result.scalars().all()
-
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
+    descending = sort_order == "desc"
+    page = await paginate(
+        db, query, [(sort_column, descending), (Agent.id, descending)], pagination
+    )
 
     return AgentListResponse(
-        items=[AgentResponse.model_validate(a) for a in agents],
-        total=total,
+        items=[AgentResponse.model_validate(a) for a in page.scalars()],
+        total=page.total,
+        total_exact=page.total_exact,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        pages=page.pages,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -90,7 +76,8 @@ async def get_agent(
 async def get_agent_listings(
     agent_id: uuid.UUID,
     status_filter: ListingStatus | None = Query(None, alias="status"),
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all listings for a specific agent."""
@@ -109,30 +96,21 @@ async def get_agent_listings(
     if status_filter:
         query = query.where(Listing.status == status_filter)
 
-    # Count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Sort by created_at desc
-    query = query.order_by(
-        Listing.is_boosted.desc(),
-        Listing.created_at.desc(),
-    )
-
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
-    result = await db.execute(query)
-    listings = result.scalars().all()
+    # Boosted first, then newest
+    order = boosted_first(Listing.is_boosted, Listing.created_at, True, Listing.id)
+    page = await paginate(db, query, order, pagination)
 
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
+    items = [ListingResponse.model_validate(l) for l in page.scalars()]
+    await favorite_cache.mark(db, user_id, items)
 
     return ListingListResponse(
-        items=[ListingResponse.model_validate(l) for l in listings],
-        total=total,
+        items=items,
+        total=page.total,
+        total_exact=page.total_exact,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        pages=page.pages,
+        next_cursor=page.next_cursor,
     )
 
 
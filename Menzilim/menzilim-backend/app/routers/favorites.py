@@ -1,8 +1,7 @@
 import uuid
-import math
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,8 +11,10 @@ from app.models.listing import Listing
 from app.models.favorite import Favorite
 from app.schemas.listing import ListingResponse, ListingListResponse
 from app.schemas.auth import MessageResponse
+from app.services.favorite_cache import favorite_cache
 from app.services.notification_service import notification_service
-from app.utils.dependencies import get_current_user, pagination_params
+from app.utils.dependencies import cursor_pagination_params, get_current_user
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/favorites", tags=["Favorites"])
 
@@ -21,7 +22,7 @@ router = APIRouter(prefix="/favorites", tags=["Favorites"])
 @router.get("", response_model=ListingListResponse)
 async def get_my_favorites(
     current_user: User = Depends(get_current_user),
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
     db: AsyncSession = Depends(get_db),
 ):
     """Get the current user's favorite listings."""
@@ -31,36 +32,26 @@ async def get_my_favorites(
         .where(Favorite.user_id == current_user.id)
     )
 
-    # Count total
-    count_query = select(func.count()).select_from(
-        select(Favorite.id).where(Favorite.user_id == current_user.id).subquery()
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
     # Sort by favorited date (newest first)
-    query = query.order_by(Favorite.created_at.desc())
-
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
-    result = await db.execute(query)
-    listings = result.scalars().all()
+    page = await paginate(
+        db, query, [(Favorite.created_at, True), (Favorite.id, True)], pagination
+    )
 
     # Mark all as favorited
     listing_responses = []
-    for listing in listings:
+    for listing in page.scalars():
         resp = ListingResponse.model_validate(listing)
         resp.is_favorited = True
         listing_responses.append(resp)
 
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
-
     return ListingListResponse(
         items=listing_responses,
-        total=total,
+        total=page.total,
+        total_exact=page.total_exact,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        pages=page.pages,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -101,6 +92,7 @@ async def add_to_favorites(
     )
     db.add(favorite)
     await db.flush()
+    favorite_cache.invalidate(db, current_user.id)
 
     # Notify listing owner (if not favoriting own listing)
     if listing.user_id != current_user.id:
@@ -137,5 +129,6 @@ async def remove_from_favorites(
 
     await db.delete(favorite)
     await db.flush()
+    favorite_cache.invalidate(db, current_user.id)
 
     return MessageResponse(message="Listing removed from favorites")
@@ -1,9 +1,8 @@
 import uuid
-import math
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -26,9 +25,20 @@ from app.schemas.listing import (
     BoostRequest,
 )
 from app.schemas.auth import MessageResponse
-from app.utils.dependencies import get_current_user, pagination_params
+from app.services.favorite_cache import favorite_cache
+from app.services.search_index import search_index
+from app.services.view_counter import view_counter
+from app.utils.dependencies import (
+    cursor_pagination_params,
+    get_current_user,
+    get_optional_user_id,
+    get_viewer_key,
+)
+from app.utils.geo import bounds_box
+from app.utils.pagination import boosted_first, paginate
+from app.utils.responses import FastJSONResponse
 
-router = APIRouter(prefix="/listings", tags=["Listings"])
+router = APIRouter(prefix="/listings", tags=["Listings"], default_response_class=FastJSONResponse)
 
 
 @router.get("", response_model=ListingListResponse)
@@ -42,10 +52,11 @@ async def list_listings(
     district: str | None = None,
     sort_by: str = Query("created_at", enum=["created_at", "price", "views_count"]),
     sort_order: str = Query("desc", enum=["asc", "desc"]),
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    """List listings with filters, sorting, and pagination."""
+    """List listings with filters, sorting, and pagination (page or cursor)."""
     query = select(Listing).where(Listing.status == ListingStatus.ACTIVE)
 
     # Apply filters
@@ -64,38 +75,24 @@ async def list_listings(
     if district:
         query = query.where(Listing.district.ilike(f"%{district}%"))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Sorting: boosted listings first, then by chosen field
+    # Sorting: boosted listings first, then by chosen field (id breaks ties)
     sort_column = getattr(Listing, sort_by, Listing.created_at)
-    if sort_order == "desc":
-        query = query.order_by(
-            Listing.is_boosted.desc(),
-            sort_column.desc(),
-        )
-    else:
-        query = query.order_by(
-            Listing.is_boosted.desc(),
-            sort_column.asc(),
-        )
-
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
-    result = await db.execute(query)
-    listings = result.scalars().all()
+    order = boosted_first(Listing.is_boosted, sort_column, sort_order == "desc", Listing.id)
+    page = await paginate(db, query, order, pagination)
 
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
+    items = [ListingResponse.model_validate(l) for l in page.scalars()]
+    await favorite_cache.mark(db, user_id, items)
 
-    return ListingListResponse(
-        items=[ListingResponse.model_validate(l) for l in listings],
-        total=total,
+    response = ListingListResponse(
+        items=items,
+        total=page.total,
+        total_exact=page.total_exact,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        pages=page.pages,
+        next_cursor=page.next_cursor,
     )
+    return FastJSONResponse(response)
 
 
 @router.post("", response_model=ListingResponse, status_code=status.HTTP_201_CREATED)
@@ -124,6 +121,7 @@ async def create_listing(
     db.add(listing)
     await db.flush()
     await db.refresh(listing)
+    search_index.index_listing(db, listing)
 
     # Update agent total_listings count
     if agent_id:
@@ -141,9 +139,11 @@ async def create_listing(
 @router.get("/{listing_id}", response_model=ListingResponse)
 async def get_listing(
     listing_id: uuid.UUID,
+    viewer: str = Depends(get_viewer_key),
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get a listing by ID. Increments the view count."""
+    """Get a listing by ID. Counts a view (buffered, once per viewer per window)."""
     result = await db.execute(
         select(Listing).where(Listing.id == listing_id)
     )
@@ -155,11 +155,13 @@ async def get_listing(
             detail="Listing not found",
         )
 
-    # Increment views
-    listing.views_count = (listing.views_count or 0) + 1
-    await db.flush()
-
-    return ListingResponse.model_validate(listing)
+    # Buffered view count: stored count + views not flushed yet
+    response = ListingResponse.model_validate(listing)
+    response.views_count = (listing.views_count or 0) + await view_counter.record_view(
+        listing.id, viewer
+    )
+    await favorite_cache.mark(db, user_id, [response])
+    return response
 
 
 @router.put("/{listing_id}", response_model=ListingResponse)
@@ -200,6 +202,7 @@ async def update_listing(
 
     await db.flush()
     await db.refresh(listing)
+    search_index.index_listing(db, listing)
 
     return ListingResponse.model_validate(listing)
 
@@ -230,6 +233,7 @@ async def delete_listing(
 
     await db.delete(listing)
     await db.flush()
+    search_index.remove_listing(db, listing_id)
 
     return MessageResponse(message="Listing deleted successfully")
 
@@ -242,18 +246,17 @@ async def get_listings_on_map(
     max_lng: float = Query(..., ge=-180, le=180),
     listing_type: ListingType | None = None,
     property_type: PropertyType | None = None,
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get active listings within map bounds for map display."""
+    """
+    Get active listings within map bounds for map display (first 500).
+    Prefer GET /listings/map, which clusters instead of truncating.
+    """
     query = select(Listing).where(
         and_(
             Listing.status == ListingStatus.ACTIVE,
-            Listing.latitude.isnot(None),
-            Listing.longitude.isnot(None),
-            Listing.latitude >= min_lat,
-            Listing.latitude <= max_lat,
-            Listing.longitude >= min_lng,
-            Listing.longitude <= max_lng,
+            Listing.location.op("<@")(bounds_box(min_lat, max_lat, min_lng, max_lng)),
         )
     )
 
@@ -267,7 +270,11 @@ async def get_listings_on_map(
     result = await db.execute(query)
     listings = result.scalars().all()
 
-    return [ListingMapResponse.model_validate(l) for l in listings]
+    items = [ListingMapResponse.model_validate(l) for l in listings]
+    await favorite_cache.mark(db, user_id, items)
+
+    # Up to 500 rows — serialize the schemas directly, skipping response_model re-validation
+    return FastJSONResponse(items)
 
 
 @router.post("/{listing_id}/boost", response_model=ListingResponse)
@@ -278,8 +285,9 @@ async def boost_listing(
     db: AsyncSession = Depends(get_db),
 ):
     """Boost a listing for increased visibility."""
+    # Row lock: the boost expiry sweep skips the listing while it is renewed
     result = await db.execute(
-        select(Listing).where(Listing.id == listing_id)
+        select(Listing).where(Listing.id == listing_id).with_for_update()
     )
     listing = result.scalar_one_or_none()
 
@@ -309,5 +317,6 @@ async def boost_listing(
 
     await db.flush()
     await db.refresh(listing)
+    search_index.index_listing(db, listing)
 
     return ListingResponse.model_validate(listing)
@@ -1,8 +1,7 @@
 import uuid
-import math
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -11,7 +10,8 @@ from app.models.notification import Notification
 from app.schemas.notification import NotificationResponse, NotificationListResponse
 from app.schemas.auth import MessageResponse
 from app.services.notification_service import notification_service
-from app.utils.dependencies import get_current_user, pagination_params
+from app.utils.dependencies import cursor_pagination_params, get_current_user
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/notifications", tags=["Notifications"])
 @router.get("", response_model=NotificationListResponse)
 async def get_my_notifications(
     current_user: User = Depends(get_current_user),
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
     db: AsyncSession = Depends(get_db),
 ):
     """Get the current user's notifications."""
@@ -27,37 +27,25 @@ async def get_my_notifications(
         Notification.user_id == current_user.id
     )
 
-    # Count total
-    count_query = select(func.count()).select_from(
-        select(Notification.id)
-        .where(Notification.user_id == current_user.id)
-        .subquery()
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
     # Count unread
     unread_count = await notification_service.get_unread_count(
         db, current_user.id
     )
 
     # Sort by newest first
-    query = query.order_by(Notification.created_at.desc())
-
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
+    page = await paginate(
+        db, query, [(Notification.created_at, True), (Notification.id, True)], pagination
+    )
 
     return NotificationListResponse(
-        items=[NotificationResponse.model_validate(n) for n in notifications],
-        total=total,
+        items=[NotificationResponse.model_validate(n) for n in page.scalars()],
+        total=page.total,
+        total_exact=page.total_exact,
         unread_count=unread_count,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        pages=page.pages,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -7,14 +7,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.models.agent import Agent
 from app.models.review import Review
 from app.schemas.review import (
     ReviewCreateRequest,
+    ReviewUpdateRequest,
     ReviewResponse,
     ReviewListResponse,
 )
+from app.schemas.auth import MessageResponse
+from app.services.agent_rating import agent_rating
 from app.services.notification_service import notification_service
 from app.utils.dependencies import get_current_user, pagination_params
 
@@ -83,17 +86,17 @@ async def create_review(
     """Create a review for an agent."""
     # Verify agent exists
     agent_result = await db.execute(
-        select(Agent).options(selectinload(Agent.user)).where(Agent.id == agent_id)
+        select(Agent.user_id).where(Agent.id == agent_id)
     )
-    agent = agent_result.scalar_one_or_none()
-    if agent is None:
+    agent_user_id = agent_result.scalar_one_or_none()
+    if agent_user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Agent not found",
         )
 
     # Cannot review yourself
-    if agent.user_id == current_user.id:
+    if agent_user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You cannot review yourself",
@@ -123,20 +126,12 @@ async def create_review(
     await db.flush()
 
     # Update agent rating and review count
-    agent.total_reviews = (agent.total_reviews or 0) + 1
-
-    # Recalculate average rating
-    avg_result = await db.execute(
-        select(func.avg(Review.rating)).where(Review.agent_id == agent_id)
-    )
-    avg_rating = avg_result.scalar() or 0.0
-    agent.rating = round(float(avg_rating), 2)
-    await db.flush()
+    await agent_rating.review_added(db, agent_id, review.rating)
 
     # Send notification to agent
     await notification_service.notify_new_review(
         db=db,
-        agent_user_id=agent.user_id,
+        agent_user_id=agent_user_id,
         reviewer_name=current_user.full_name,
         rating=request.rating,
         agent_id=agent_id,
@@ -145,3 +140,72 @@ async def create_review(
     await db.refresh(review)
 
     return ReviewResponse.model_validate(review)
+
+
+async def _get_own_review(
+    db: AsyncSession,
+    agent_id: uuid.UUID,
+    review_id: uuid.UUID,
+    current_user: User,
+) -> Review:
+    """Load a review of the agent, locked, checking that the user may change it."""
+    result = await db.execute(
+        select(Review)
+        .where(Review.id == review_id, Review.agent_id == agent_id)
+        .with_for_update()
+    )
+    review = result.scalar_one_or_none()
+    if review is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found",
+        )
+    if review.user_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only change your own reviews",
+        )
+    return review
+
+
+@router.put("/{agent_id}/reviews/{review_id}", response_model=ReviewResponse)
+async def update_review(
+    agent_id: uuid.UUID,
+    review_id: uuid.UUID,
+    request: ReviewUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Edit a review (author or admin)."""
+    review = await _get_own_review(db, agent_id, review_id, current_user)
+
+    old_rating = review.rating
+    for field, value in request.model_dump(exclude_unset=True).items():
+        if field == "rating" and value is None:
+            continue
+        setattr(review, field, value)
+    await db.flush()
+
+    await agent_rating.review_changed(db, agent_id, old_rating, review.rating)
+    await db.refresh(review)
+    # Load the author here: not in the session when an admin edits
+    await db.refresh(review, ["user"])
+
+    return ReviewResponse.model_validate(review)
+
+
+@router.delete("/{agent_id}/reviews/{review_id}", response_model=MessageResponse)
+async def delete_review(
+    agent_id: uuid.UUID,
+    review_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete a review (author or admin)."""
+    review = await _get_own_review(db, agent_id, review_id, current_user)
+
+    await db.delete(review)
+    await db.flush()
+    await agent_rating.review_removed(db, agent_id, review.rating)
+
+    return MessageResponse(message="Review deleted successfully")
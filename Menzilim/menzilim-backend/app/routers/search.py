@@ -1,18 +1,47 @@
 import math
+import uuid
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func, or_
+from sqlalchemy import Float, case, select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.listing import Listing, ListingStatus, ListingType, PropertyType
-from app.schemas.listing import ListingResponse, ListingListResponse
-from app.utils.dependencies import pagination_params
+from app.schemas.listing import (
+    ListingMapResponse,
+    ListingMapViewResponse,
+    ListingSearchResult,
+    ListingSearchResponse,
+    MapClusterResponse,
+    NearbyListingResponse,
+    NearbyListingsResponse,
+)
+from app.services.favorite_cache import favorite_cache
+from app.services.search_index import search_index
+from app.utils.dependencies import cursor_pagination_params, get_optional_user_id, pagination_params
+from app.utils.geo import bounds_box, cluster_cell_size, haversine_km, make_point, radius_circle
+from app.utils.pagination import (
+    Page,
+    boosted_first,
+    decode_cursor_values,
+    encode_cursor,
+    invalid_cursor,
+    paginate,
+)
+from app.utils.responses import FastJSONResponse
+from app.utils.text_search import build_tsquery, highlight, query_terms
 
-router = APIRouter(prefix="/listings", tags=["Search"])
+router = APIRouter(prefix="/listings", tags=["Search"], default_response_class=FastJSONResponse)
 
+# Map view: clusters below this zoom level, individual pins from it on
+MAP_PINS_MIN_ZOOM = 15
+MAP_MAX_PINS = 500
 
-@router.get("/search", response_model=ListingListResponse)
+# First value of cursors issued by the in-memory index path
+INDEX_CURSOR_TAG = "index"
+
+
+@router.get("/search", response_model=ListingSearchResponse)
 async def search_listings(
     q: str = Query(..., min_length=2, max_length=200, description="Search query"),
     listing_type: ListingType | None = None,
@@ -23,26 +52,168 @@ async def search_listings(
     city: str | None = None,
     min_area: float | None = None,
     max_area: float | None = None,
-    sort_by: str = Query("created_at", enum=["created_at", "price", "views_count"]),
+    sort_by: str = Query("relevance", enum=["relevance", "created_at", "price", "views_count"]),
     sort_order: str = Query("desc", enum=["asc", "desc"]),
-    pagination: dict = Depends(pagination_params),
+    pagination: dict = Depends(cursor_pagination_params),
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Advanced search for listings with text query.
-    Searches across title, description, city, district, and address fields.
+    Full-text search for listings, ranked by relevance.
+    Matches title, description, city, district and address through the
+    `search_vector` GIN index (az/en/ru aware, prefix match on the last word)
+    and returns a highlighted snippet per result. With SEARCH_INDEX_ENABLED the
+    matching runs in the in-memory index and only the page is read from the DB.
     """
-    search_term = f"%{q}%"
+    terms = query_terms(q)
+    if not terms:
+        return FastJSONResponse(
+            ListingSearchResponse(
+                items=[], total=0, page=pagination["page"], per_page=pagination["per_page"], pages=1
+            )
+        )
+
+    filters = {
+        "listing_type": listing_type,
+        "property_type": property_type,
+        "min_price": min_price,
+        "max_price": max_price,
+        "rooms": rooms,
+        "city": city,
+        "min_area": min_area,
+        "max_area": max_area,
+    }
+
+    # views_count changes on every view and is not kept in the in-memory index.
+    # A cursor is only valid on the path that issued it (index ranks differ from ts_rank).
+    after = _index_cursor_key(pagination["cursor"]) if pagination["cursor"] else None
+    if search_index.ready and sort_by != "views_count" and (not pagination["cursor"] or after):
+        page = await _search_in_index(db, terms, filters, sort_by, sort_order, pagination, after)
+    else:
+        page = await _search_in_database(db, terms, filters, sort_by, sort_order, pagination)
+
+    items = []
+    for listing, score in page.rows:
+        item = ListingSearchResult.model_validate(listing)
+        item.rank = round(score, 6)
+        item.highlight = highlight(listing.description, terms) or highlight(listing.title, terms)
+        items.append(item)
+    await favorite_cache.mark(db, user_id, items)
+
+    response = ListingSearchResponse(
+        items=items,
+        total=page.total,
+        total_exact=page.total_exact,
+        page=pagination["page"],
+        per_page=pagination["per_page"],
+        pages=page.pages,
+        next_cursor=page.next_cursor,
+    )
+    return FastJSONResponse(response)
 
-    query = select(Listing).where(
+
+@router.get("/map", response_model=ListingMapViewResponse)
+async def get_map_view(
+    min_lat: float = Query(..., ge=-90, le=90),
+    max_lat: float = Query(..., ge=-90, le=90),
+    min_lng: float = Query(..., ge=-180, le=180),
+    max_lng: float = Query(..., ge=-180, le=180),
+    zoom: int = Query(..., ge=0, le=22, description="Web-map zoom level"),
+    listing_type: ListingType | None = None,
+    property_type: PropertyType | None = None,
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Active listings in a map viewport, clustered by zoom level.
+    From zoom 15 returns individual pins; below that (or when the viewport
+    holds more than 500 listings) returns grid-cell clusters with a centroid
+    and count, so dense areas are never truncated. Both are a single query
+    on the `location` GiST index.
+    """
+    conditions = [
         Listing.status == ListingStatus.ACTIVE,
-        or_(
-            Listing.title.ilike(search_term),
-            Listing.description.ilike(search_term),
-            Listing.city.ilike(search_term),
-            Listing.district.ilike(search_term),
-            Listing.address.ilike(search_term),
-        ),
+        Listing.location.op("<@")(bounds_box(min_lat, max_lat, min_lng, max_lng)),
+    ]
+    if listing_type:
+        conditions.append(Listing.listing_type == listing_type)
+    if property_type:
+        conditions.append(Listing.property_type == property_type)
+
+    if zoom >= MAP_PINS_MIN_ZOOM:
+        result = await db.execute(
+            select(Listing)
+            .where(*conditions)
+            .order_by(Listing.is_boosted.desc(), Listing.created_at.desc())
+            .limit(MAP_MAX_PINS + 1)
+        )
+        listings = result.scalars().all()
+        if len(listings) <= MAP_MAX_PINS:
+            pins = [ListingMapResponse.model_validate(l) for l in listings]
+            await favorite_cache.mark(db, user_id, pins)
+            return FastJSONResponse(
+                ListingMapViewResponse(
+                    zoom=zoom,
+                    clustered=False,
+                    total=len(pins),
+                    listings=pins,
+                )
+            )
+
+    # Clusters: group by a fixed lat/lng grid (~64 px cells), stable while panning
+    cell_lat, cell_lng = cluster_cell_size(zoom, (min_lat + max_lat) / 2)
+    count = func.count()
+    result = await db.execute(
+        select(
+            count.label("count"),
+            func.avg(Listing.latitude).label("latitude"),
+            func.avg(Listing.longitude).label("longitude"),
+            func.min(Listing.price).label("min_price"),
+            case((count == 1, func.any_value(Listing.id))).label("listing_id"),
+        )
+        .where(*conditions)
+        .group_by(
+            func.floor(Listing.latitude / cell_lat),
+            func.floor(Listing.longitude / cell_lng),
+        )
+    )
+    clusters = [MapClusterResponse.model_validate(row, from_attributes=True) for row in result.all()]
+
+    return FastJSONResponse(
+        ListingMapViewResponse(
+            zoom=zoom,
+            clustered=True,
+            total=sum(cluster.count for cluster in clusters),
+            clusters=clusters,
+        )
+    )
+
+
+@router.get("/nearby", response_model=NearbyListingsResponse)
+async def get_nearby_listings(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(2.0, gt=0, le=50),
+    listing_type: ListingType | None = None,
+    property_type: PropertyType | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    rooms: int | None = None,
+    pagination: dict = Depends(pagination_params),
+    user_id: uuid.UUID | None = Depends(get_optional_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Active listings within `radius_km` of a point, nearest first.
+    Uses KNN ordering on the `location` GiST index, so only the requested
+    page is read; each item carries its great-circle distance. There is no
+    total count — page with `has_more`.
+    """
+    distance = haversine_km(latitude, longitude, Listing.latitude, Listing.longitude)
+    query = select(Listing, distance.label("distance_km")).where(
+        Listing.status == ListingStatus.ACTIVE,
+        Listing.location.op("<@")(radius_circle(latitude, longitude, radius_km)),
+        distance <= radius_km,
     )
 
     # Apply filters
@@ -56,42 +227,143 @@ async def search_listings(
         query = query.where(Listing.price <= max_price)
     if rooms is not None:
         query = query.where(Listing.rooms == rooms)
-    if city:
-        query = query.where(Listing.city.ilike(f"%{city}%"))
-    if min_area is not None:
-        query = query.where(Listing.area_sqm >= min_area)
-    if max_area is not None:
-        query = query.where(Listing.area_sqm <= max_area)
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Sorting
-    sort_column = getattr(Listing, sort_by, Listing.created_at)
-    if sort_order == "desc":
-        query = query.order_by(
-            Listing.is_boosted.desc(),
-            sort_column.desc(),
-        )
-    else:
-        query = query.order_by(
-            Listing.is_boosted.desc(),
-            sort_column.asc(),
-        )
 
-    # Pagination
-    query = query.offset(pagination["offset"]).limit(pagination["per_page"])
+    query = (
+        query.order_by(Listing.location.op("<->")(make_point(latitude, longitude)))
+        .offset(pagination["offset"])
+        .limit(pagination["per_page"] + 1)
+    )
+    # Core geometric operators have no statistics (`<@ circle` is always
+    # estimated at 0.1%), so with selective filters the planner prefers a
+    # bitmap scan of the whole circle plus a sort. Walking the KNN index in
+    # distance order and stopping after the page is what we want. Only for
+    # this query: RESET right after, so later queries in the request plan normally.
+    await db.execute(text("SET LOCAL enable_bitmapscan = off"))
     result = await db.execute(query)
-    listings = result.scalars().all()
+    rows = result.all()
+    await db.execute(text("RESET enable_bitmapscan"))
 
-    pages = math.ceil(total / pagination["per_page"]) if total > 0 else 1
+    items = []
+    for listing, distance_km in rows[: pagination["per_page"]]:
+        item = NearbyListingResponse.model_validate(listing)
+        item.distance_km = round(distance_km, 3)
+        items.append(item)
+    await favorite_cache.mark(db, user_id, items)
 
-    return ListingListResponse(
-        items=[ListingResponse.model_validate(l) for l in listings],
-        total=total,
+    response = NearbyListingsResponse(
+        items=items,
         page=pagination["page"],
         per_page=pagination["per_page"],
-        pages=pages,
+        has_more=len(rows) > pagination["per_page"],
+    )
+    return FastJSONResponse(response)
+
+
+async def _search_in_database(
+    db: AsyncSession,
+    terms: list[str],
+    filters: dict,
+    sort_by: str,
+    sort_order: str,
+    pagination: dict,
+) -> Page:
+    """Search through the `search_vector` GIN index; rows are (listing, rank)."""
+    tsquery = build_tsquery(terms)
+    rank = func.ts_rank(Listing.search_vector, tsquery, 1, type_=Float)
+
+    query = select(Listing, rank.label("rank")).where(
+        Listing.status == ListingStatus.ACTIVE,
+        Listing.search_vector.op("@@")(tsquery),
+    )
+
+    # Apply filters
+    if filters["listing_type"]:
+        query = query.where(Listing.listing_type == filters["listing_type"])
+    if filters["property_type"]:
+        query = query.where(Listing.property_type == filters["property_type"])
+    if filters["min_price"] is not None:
+        query = query.where(Listing.price >= filters["min_price"])
+    if filters["max_price"] is not None:
+        query = query.where(Listing.price <= filters["max_price"])
+    if filters["rooms"] is not None:
+        query = query.where(Listing.rooms == filters["rooms"])
+    if filters["city"]:
+        query = query.where(Listing.city.ilike(f"%{filters['city']}%"))
+    if filters["min_area"] is not None:
+        query = query.where(Listing.area_sqm >= filters["min_area"])
+    if filters["max_area"] is not None:
+        query = query.where(Listing.area_sqm <= filters["max_area"])
+
+    # Sorting: boosted listings first, then relevance or the chosen field
+    if sort_by == "relevance":
+        order = [
+            (Listing.is_boosted, True),
+            (rank, True),
+            (Listing.created_at, True),
+            (Listing.id, True),
+        ]
+    else:
+        sort_column = getattr(Listing, sort_by, Listing.created_at)
+        order = boosted_first(Listing.is_boosted, sort_column, sort_order == "desc", Listing.id)
+
+    return await paginate(db, query, order, pagination)
+
+
+async def _search_in_index(
+    db: AsyncSession,
+    terms: list[str],
+    filters: dict,
+    sort_by: str,
+    sort_order: str,
+    pagination: dict,
+    after: tuple | None,
+) -> Page:
+    """Search in memory, then load only the listings of the requested page."""
+    per_page = pagination["per_page"]
+    total, hits = search_index.search(
+        terms, filters, sort_by, sort_order, pagination["offset"], per_page + 1, after
     )
+    next_cursor = None
+    if len(hits) > per_page:
+        hits = hits[:per_page]
+        next_cursor = encode_cursor([INDEX_CURSOR_TAG, *hits[-1][2]])
+
+    rows = []
+    if hits:
+        result = await db.execute(
+            select(Listing).where(
+                Listing.id.in_([listing_id for listing_id, _, _ in hits]),
+                Listing.status == ListingStatus.ACTIVE,
+            )
+        )
+        listings = {listing.id: listing for listing in result.scalars().all()}
+
+        for listing_id, score, _ in hits:
+            listing = listings.get(listing_id)
+            if listing is None:
+                # Deleted or deactivated by another worker since the last sync
+                search_index.discard(listing_id)
+                continue
+            rows.append((listing, score))
+
+    return Page(
+        rows=rows,
+        total=total,
+        total_exact=True,
+        pages=math.ceil(total / per_page) if total > 0 else 1,
+        next_cursor=next_cursor,
+    )
+
+
+def _index_cursor_key(cursor: str) -> tuple | None:
+    """Sort key of a cursor issued by _search_in_index(), None for a SQL-path cursor."""
+    values = decode_cursor_values(cursor)
+    if not values or values[0] != INDEX_CURSOR_TAG:
+        return None
+    *numbers, listing_id = values[1:]
+    if not numbers or not all(isinstance(n, (int, float)) for n in numbers):
+        raise invalid_cursor()
+    try:
+        return (*numbers, uuid.UUID(listing_id))
+    except (ValueError, TypeError, AttributeError):
+        raise invalid_cursor()
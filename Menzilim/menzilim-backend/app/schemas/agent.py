@@ -38,3 +38,5 @@ class AgentListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    total_exact: bool = True
+    next_cursor: str | None = None
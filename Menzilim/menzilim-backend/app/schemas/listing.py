@@ -97,6 +97,23 @@ class ListingListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    total_exact: bool = True
+    next_cursor: str | None = None
+
+
+class ListingSearchResult(ListingResponse):
+    rank: float | None = None
+    highlight: str | None = None
+
+
+class ListingSearchResponse(BaseModel):
+    items: list[ListingSearchResult]
+    total: int
+    page: int
+    per_page: int
+    pages: int
+    total_exact: bool = True
+    next_cursor: str | None = None
 
 
 class ListingMapResponse(BaseModel):
@@ -111,10 +128,39 @@ class ListingMapResponse(BaseModel):
     rooms: int | None = None
     area_sqm: float | None = None
     images: list[str] = []
+    is_favorited: bool = False
 
     model_config = {"from_attributes": True}
 
 
+class NearbyListingResponse(ListingResponse):
+    distance_km: float | None = None
+
+
+class NearbyListingsResponse(BaseModel):
+    items: list[NearbyListingResponse]
+    page: int
+    per_page: int
+    has_more: bool
+
+
+class MapClusterResponse(BaseModel):
+    latitude: float
+    longitude: float
+    count: int
+    min_price: Decimal
+    # Set when the cluster is a single listing
+    listing_id: uuid.UUID | None = None
+
+
+class ListingMapViewResponse(BaseModel):
+    zoom: int
+    clustered: bool
+    total: int
+    clusters: list[MapClusterResponse] = []
+    listings: list[ListingMapResponse] = []
+
+
 class BoostRequest(BaseModel):
     boost_type: BoostType
     duration_days: int = Field(..., ge=1, le=90)
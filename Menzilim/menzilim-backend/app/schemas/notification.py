@@ -27,3 +27,5 @@ class NotificationListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    total_exact: bool = True
+    next_cursor: str | None = None
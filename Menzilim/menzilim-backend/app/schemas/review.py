@@ -11,6 +11,11 @@ class ReviewCreateRequest(BaseModel):
     comment: str | None = Field(None, max_length=2000)
 
 
+class ReviewUpdateRequest(BaseModel):
+    rating: int | None = Field(None, ge=1, le=5)
+    comment: str | None = Field(None, max_length=2000)
+
+
 class ReviewReplyRequest(BaseModel):
     agent_reply: str = Field(..., min_length=1, max_length=2000)
 
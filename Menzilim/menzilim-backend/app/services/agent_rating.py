@@ -0,0 +1,127 @@
+"""Agent rating aggregates.
+
+agents.rating_sum / agents.total_reviews are running totals over the agent's
+reviews and agents.rating is their average (2 decimals, 0 without reviews).
+Review writes adjust all three in one UPDATE of the agent row, so a write
+costs the same for an agent with 3 or 3000 reviews and concurrent writes
+never lose an update (each one increments the stored values under the row
+lock instead of writing back a value computed in Python).
+
+Every AGENT_RATING_RECONCILE_SECONDS one worker recomputes the totals from
+the reviews table and repairs agents that drifted (e.g. reviews removed by a
+user/agent CASCADE delete, or manual SQL).
+"""
+
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import Float, Numeric, case, cast, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.agent import Agent
+from app.models.review import Review
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# pg_try_advisory_xact_lock key: one reconciliation at a time across workers
+RECONCILE_LOCK_KEY = 0x4D5A_0048
+
+
+def _average(rating_sum, total_reviews):
+    """rating column expression for the given sum / count expressions."""
+    return case(
+        (total_reviews > 0, cast(func.round(cast(rating_sum, Numeric) / total_reviews, 2), Float)),
+        else_=literal(0.0, Float),
+    )
+
+
+class AgentRatingService:
+    """Keeps agents.rating_sum / total_reviews / rating in step with reviews."""
+
+    @staticmethod
+    async def apply(
+        db: AsyncSession,
+        agent_id: uuid.UUID,
+        rating_delta: int,
+        count_delta: int,
+    ) -> None:
+        """Add `rating_delta` to the sum and `count_delta` to the count, in one UPDATE."""
+        new_sum = Agent.rating_sum + rating_delta
+        new_count = Agent.total_reviews + count_delta
+        await db.execute(
+            update(Agent)
+            .where(Agent.id == agent_id)
+            .values(
+                rating_sum=new_sum,
+                total_reviews=new_count,
+                rating=_average(new_sum, new_count),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def review_added(self, db: AsyncSession, agent_id: uuid.UUID, rating: int) -> None:
+        await self.apply(db, agent_id, rating, 1)
+
+    async def review_changed(
+        self, db: AsyncSession, agent_id: uuid.UUID, old_rating: int, new_rating: int
+    ) -> None:
+        if new_rating != old_rating:
+            await self.apply(db, agent_id, new_rating - old_rating, 0)
+
+    async def review_removed(self, db: AsyncSession, agent_id: uuid.UUID, rating: int) -> None:
+        await self.apply(db, agent_id, -rating, -1)
+
+    async def reconcile(self, session_factory: async_sessionmaker) -> int:
+        """Recompute every agent's totals from reviews; returns the number repaired."""
+        totals = (
+            select(
+                Agent.id.label("agent_id"),
+                func.coalesce(func.sum(Review.rating), 0).label("rating_sum"),
+                func.count(Review.id).label("total_reviews"),
+            )
+            .outerjoin(Review, Review.agent_id == Agent.id)
+            .group_by(Agent.id)
+            .subquery()
+        )
+        statement = (
+            update(Agent)
+            .where(
+                Agent.id == totals.c.agent_id,
+                (Agent.rating_sum != totals.c.rating_sum)
+                | (Agent.total_reviews != totals.c.total_reviews)
+                | (Agent.rating != _average(totals.c.rating_sum, totals.c.total_reviews)),
+            )
+            .values(
+                rating_sum=totals.c.rating_sum,
+                total_reviews=totals.c.total_reviews,
+                rating=_average(totals.c.rating_sum, totals.c.total_reviews),
+            )
+            .returning(Agent.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with session_factory() as session:
+            locked = await session.scalar(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_KEY)))
+            if not locked:
+                return 0
+            repaired = len((await session.execute(statement)).all())
+            await session.commit()
+
+        if repaired:
+            logger.warning(f"Agent rating reconciliation repaired {repaired} agents")
+        return repaired
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """Background task: reconcile every AGENT_RATING_RECONCILE_SECONDS."""
+        while True:
+            await asyncio.sleep(settings.AGENT_RATING_RECONCILE_SECONDS)
+            try:
+                await self.reconcile(session_factory)
+            except Exception as e:
+                logger.error(f"Agent rating reconciliation failed: {e}")
+
+
+agent_rating = AgentRatingService()
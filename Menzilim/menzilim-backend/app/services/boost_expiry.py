@@ -0,0 +1,87 @@
+"""Listing boost expiry.
+
+POST /listings/{id}/boost sets is_boosted and boost_expires_at. Every
+BOOST_EXPIRY_SECONDS a background sweep clears the boosts that have expired
+(is_boosted = false, boost_type = NULL; boost_expires_at is kept as the time
+the boost ended) and notifies the owners. A sweep is one set-based UPDATE per
+BOOST_EXPIRY_BATCH rows:
+
+    UPDATE listings SET is_boosted = false, boost_type = NULL, updated_at = now()
+    WHERE id IN (SELECT id FROM listings
+                 WHERE is_boosted AND boost_expires_at <= now()
+                 ORDER BY boost_expires_at LIMIT :batch
+                 FOR UPDATE SKIP LOCKED)
+    RETURNING id, user_id, title
+
+read from the partial index ix_listings_boost_expires, plus one INSERT for the
+batch's notifications in the same transaction.
+
+Every worker runs the sweep: SKIP LOCKED hands concurrent sweeps different
+rows, so each boost is cleared and notified exactly once. boost_listing locks
+the row it renews, so a renewal and a sweep of the same listing never
+interleave. The bumped updated_at lets the search index sync pick the change up.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.models.listing import Listing
+from app.services.notification_service import notification_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class BoostExpiryService:
+    """Clears expired listing boosts and notifies the listing owners."""
+
+    @staticmethod
+    def _expire_statement(batch: int):
+        expired = (
+            select(Listing.id)
+            .where(Listing.is_boosted, Listing.boost_expires_at <= func.now())
+            .order_by(Listing.boost_expires_at)
+            .limit(batch)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            update(Listing)
+            .where(Listing.id.in_(expired.scalar_subquery()))
+            .values(is_boosted=False, boost_type=None)
+            .returning(Listing.id, Listing.user_id, Listing.title)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def sweep(self, session_factory: async_sessionmaker) -> int:
+        """Clear every boost expired by now; returns the number cleared."""
+        batch = settings.BOOST_EXPIRY_BATCH
+        statement = self._expire_statement(batch)
+        expired = 0
+        while True:
+            async with session_factory() as session:
+                listings = (await session.execute(statement)).all()
+                await notification_service.notify_boosts_expired(session, listings)
+                await session.commit()
+            expired += len(listings)
+            if len(listings) < batch:
+                break
+
+        if expired:
+            logger.info(f"Boost expiry: cleared {expired} expired boosts")
+        return expired
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """Background task: sweep every BOOST_EXPIRY_SECONDS."""
+        while True:
+            try:
+                await self.sweep(session_factory)
+            except Exception as e:
+                logger.error(f"Boost expiry sweep failed: {e}")
+            await asyncio.sleep(settings.BOOST_EXPIRY_SECONDS)
+
+
+boost_expiry = BoostExpiryService()
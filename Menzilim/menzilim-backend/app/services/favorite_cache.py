@@ -0,0 +1,167 @@
+"""`is_favorited` for pages of listings.
+
+List, search and map responses mark the listings the (optional) current
+user has favorited with at most one query per page:
+
+    SELECT listing_id FROM favorites WHERE user_id = :user AND listing_id IN (:page)
+
+Answers are kept per user (favorited ids + ids already checked), so pages
+seen again — paging back, panning the map — need no query at all. A user's
+entry is dropped when they add or remove a favorite (after COMMIT) and
+expires after FAVORITE_CACHE_SECONDS.
+
+FAVORITE_CACHE_BACKEND=memory drops the entry only in the worker that handled
+the change (single worker / dev). FAVORITE_CACHE_BACKEND=redis also bumps a
+per-user version in Redis; every worker reads it (one GET per page) and
+starts the user's entry over when it changed, so a toggle shows up on the
+next page whichever worker serves it.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.favorite import Favorite
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Session.info key: users whose entry is dropped once the session commits
+PENDING_KEY = "favorite_cache_pending"
+
+# Past this many checked ids a user's entry starts over
+MAX_CHECKED_PER_USER = 5000
+
+VERSION_KEY_PREFIX = "favorites:version:"
+
+
+@dataclass
+class _UserFavorites:
+    expires_at: float
+    version: str | None
+    favorited: set[uuid.UUID] = field(default_factory=set)
+    checked: set[uuid.UUID] = field(default_factory=set)
+
+
+class FavoriteCache:
+    """Per-user favorite-id sets, LRU-bounded to FAVORITE_CACHE_MAX_USERS."""
+
+    def __init__(self) -> None:
+        self._users: OrderedDict[uuid.UUID, _UserFavorites] = OrderedDict()
+        self._redis = (
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+            if settings.FAVORITE_CACHE_BACKEND == "redis"
+            else None
+        )
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _version(self, user_id: uuid.UUID) -> str | None:
+        """The user's shared version (None with the memory backend or if Redis fails)."""
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(f"{VERSION_KEY_PREFIX}{user_id}")
+        except Exception as e:
+            logger.warning(f"Favorite cache version not read for user {user_id}: {e}")
+            return None
+
+    async def _bump_version(self, user_id: uuid.UUID) -> None:
+        key = f"{VERSION_KEY_PREFIX}{user_id}"
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incr(key)
+                # Outlives every entry built on the old version
+                pipe.expire(key, max(settings.FAVORITE_CACHE_SECONDS, 1))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Favorite cache invalidation not published for user {user_id}: {e}")
+
+    def _entry(self, user_id: uuid.UUID, version: str | None) -> _UserFavorites:
+        now = time.monotonic()
+        entry = self._users.get(user_id)
+        if (
+            entry is None
+            or entry.expires_at <= now
+            or entry.version != version
+            or len(entry.checked) > MAX_CHECKED_PER_USER
+        ):
+            entry = _UserFavorites(expires_at=now + settings.FAVORITE_CACHE_SECONDS, version=version)
+            self._users[user_id] = entry
+            if len(self._users) > settings.FAVORITE_CACHE_MAX_USERS:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(user_id)
+        return entry
+
+    async def favorited_ids(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        listing_ids: list[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """The subset of `listing_ids` the user has favorited."""
+        entry = self._entry(user_id, await self._version(user_id))
+        unknown = {listing_id for listing_id in listing_ids if listing_id not in entry.checked}
+        if unknown:
+            result = await db.execute(
+                select(Favorite.listing_id).where(
+                    Favorite.user_id == user_id,
+                    Favorite.listing_id.in_(unknown),
+                )
+            )
+            entry.favorited.update(result.scalars().all())
+            entry.checked.update(unknown)
+        return entry.favorited.intersection(listing_ids)
+
+    async def mark(self, db: AsyncSession, user_id: uuid.UUID | None, items) -> None:
+        """Set `is_favorited` on listing response items (no-op for anonymous users)."""
+        if user_id is None or not items:
+            return
+        favorited = await self.favorited_ids(db, user_id, [item.id for item in items])
+        for item in items:
+            item.is_favorited = item.id in favorited
+
+    def invalidate(self, db: AsyncSession, user_id: uuid.UUID) -> None:
+        """Drop the user's entry once the session commits."""
+        db.sync_session.info.setdefault(PENDING_KEY, set()).add(user_id)
+
+    def discard(self, user_id: uuid.UUID) -> None:
+        """Drop the user's entry here and, with the redis backend, in every worker."""
+        self._users.pop(user_id, None)
+        if self._redis is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._bump_version(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            await self._redis.aclose()
+
+
+favorite_cache = FavoriteCache()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for user_id in session.info.pop(PENDING_KEY, ()):
+        favorite_cache.discard(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _keep_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
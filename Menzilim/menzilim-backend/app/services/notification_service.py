@@ -1,8 +1,8 @@
 import uuid
 import logging
-from typing import Any
+from typing import Any, Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.notification import Notification, NotificationType
@@ -10,6 +10,14 @@ from app.models.notification import Notification, NotificationType
 logger = logging.getLogger(__name__)
 
 
+def _boost_expired_message(listing_title: str, listing_id: uuid.UUID) -> dict[str, Any]:
+    return {
+        "title": "Boost mudeti bitdi",
+        "body": f'"{listing_title}" elaninizin boost mudeti bitdi.',
+        "data": {"listing_id": str(listing_id)},
+    }
+
+
 class NotificationService:
     """Service for creating and managing notifications."""
 
@@ -118,11 +126,37 @@ class NotificationService:
         return await NotificationService.create_notification(
             db=db,
             user_id=user_id,
-            title="Boost mudeti bitdi",
-            body=f'"{listing_title}" elaninizin boost mudeti bitdi.',
             notification_type=NotificationType.BOOST_EXPIRED,
-            data={"listing_id": str(listing_id)},
+            **_boost_expired_message(listing_title, listing_id),
+        )
+
+    @staticmethod
+    async def notify_boosts_expired(
+        db: AsyncSession,
+        listings: Sequence[Any],
+    ) -> int:
+        """Notify the owners of expired boosts in one batched INSERT.
+
+        `listings` are rows with `id`, `user_id` and `title`; returns the number sent.
+        """
+        if not listings:
+            return 0
+        await db.execute(
+            insert(Notification),
+            [
+                {
+                    "user_id": listing.user_id,
+                    "type": NotificationType.BOOST_EXPIRED,
+                    **_boost_expired_message(listing.title, listing.id),
+                }
+                for listing in listings
+            ],
+        )
+        logger.info(
+            f"Notifications created: type={NotificationType.BOOST_EXPIRED.value} "
+            f"count={len(listings)}"
         )
+        return len(listings)
 
     @staticmethod
     async def get_unread_count(
@@ -0,0 +1,559 @@
+"""In-process inverted index for listing search (opt-in: SEARCH_INDEX_ENABLED).
+
+Built at startup from active listings and kept in memory per worker:
+
+- postings: token -> (docids, weight flags), the same tokens and A/B/C/D field
+  weights as the `search_vector` column (see app/utils/text_search.py)
+- sorted price / area_sqm / rooms columns for range filters
+- per-document columns for the remaining filters and sort keys
+
+/listings/search answers text + filter queries from it and only loads the
+final page from Postgres. Differences from the SQL path: the last query word
+is a prefix (as in SQL) and the others match by shared stem instead of the
+english/russian stemmers; `rank` is the same weighted score with ts_rank's
+length normalization, not ts_rank itself.
+
+Updates:
+- create / update / delete / boost register the change on the session and it
+  is applied after COMMIT (nothing happens on rollback)
+- every SEARCH_INDEX_SYNC_SECONDS a worker re-reads listings changed since its
+  last sync, so changes made by other workers show up as well
+- listings deleted elsewhere are dropped when page hydration does not find them
+
+Updates never modify postings in place: the old document is tombstoned and a
+new docid is appended. Once tombstones pass COMPACT_DEAD_RATIO the index is
+compacted: docids are renumbered and every per-document column, posting list
+and sorted column is rebuilt without them, so memory tracks the live listings.
+"""
+
+import asyncio
+import logging
+import math
+import sys
+import time
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from heapq import nsmallest
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.listing import Listing, ListingStatus, ListingType, PropertyType
+from app.utils.text_search import same_stem, tokenize
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Field weight flags — the setweight() classes of search_vector
+WEIGHT_A, WEIGHT_B, WEIGHT_C, WEIGHT_D = 8, 4, 2, 1
+# ts_rank default weights: D=0.1, C=0.2, B=0.4, A=1.0
+_WEIGHTS = {WEIGHT_A: 1.0, WEIGHT_B: 0.4, WEIGHT_C: 0.2, WEIGHT_D: 0.1}
+_FLAG_SCORES = [
+    sum(weight for flag, weight in _WEIGHTS.items() if flags & flag) for flags in range(16)
+]
+
+BUILD_BATCH = 5000
+COMPACT_DEAD_RATIO = 0.2
+PENDING_KEY = "search_index_pending"
+
+_COLUMNS = (
+    Listing.id,
+    Listing.status,
+    Listing.title,
+    Listing.description,
+    Listing.city,
+    Listing.district,
+    Listing.address,
+    Listing.listing_type,
+    Listing.property_type,
+    Listing.price,
+    Listing.area_sqm,
+    Listing.rooms,
+    Listing.is_boosted,
+    Listing.created_at,
+)
+
+
+@dataclass(slots=True)
+class IndexedListing:
+    """Snapshot of the searchable fields of one active listing."""
+
+    listing_id: uuid.UUID
+    tokens: dict[str, int]  # token -> weight flags
+    length: int
+    listing_type: ListingType
+    property_type: PropertyType
+    city: str
+    price: float
+    area_sqm: float | None
+    rooms: int | None
+    is_boosted: bool
+    created_at: float
+
+    @classmethod
+    def from_listing(cls, listing) -> "IndexedListing":
+        """Build from a Listing instance or a row with the same attribute names."""
+        tokens: dict[str, int] = {}
+        length = 0
+        for flag, text in (
+            (WEIGHT_A, listing.title),
+            (WEIGHT_B, listing.city),
+            (WEIGHT_B, listing.district),
+            (WEIGHT_C, listing.address),
+            (WEIGHT_D, listing.description),
+        ):
+            for token in tokenize(text):
+                tokens[token] = tokens.get(token, 0) | flag
+                length += 1
+        return cls(
+            listing_id=listing.id,
+            tokens=tokens,
+            length=length,
+            listing_type=listing.listing_type,
+            property_type=listing.property_type,
+            city=sys.intern((listing.city or "").lower()),
+            price=float(listing.price),
+            area_sqm=listing.area_sqm,
+            rooms=listing.rooms,
+            is_boosted=bool(listing.is_boosted),
+            created_at=listing.created_at.timestamp() if listing.created_at else time.time(),
+        )
+
+    def fingerprint(self) -> int:
+        return hash((
+            tuple(sorted(self.tokens.items())), self.listing_type, self.property_type,
+            self.city, self.price, self.area_sqm, self.rooms, self.is_boosted, self.created_at,
+        ))
+
+
+class _SortedColumn:
+    """(value, docid) pairs sorted by value, as two parallel arrays."""
+
+    def __init__(self) -> None:
+        self.values = array("d")
+        self.docids = array("I")
+        self._sorted = True
+
+    def append(self, value: float, docid: int) -> None:
+        """Bulk load: append unsorted, call sort() when done."""
+        self.values.append(value)
+        self.docids.append(docid)
+        self._sorted = False
+
+    def insert(self, value: float, docid: int) -> None:
+        i = bisect_right(self.values, value)
+        self.values.insert(i, value)
+        self.docids.insert(i, docid)
+
+    def sort(self) -> None:
+        if not self._sorted:
+            self._rebuild(sorted(range(len(self.values)), key=self.values.__getitem__))
+
+    def compact(self, remap: array) -> None:
+        """Drop removed docids (remap < 0) and renumber the rest."""
+        docids = self.docids
+        order = [i for i, docid in enumerate(docids) if remap[docid] >= 0]
+        self.values = array("d", (self.values[i] for i in order))
+        self.docids = array("I", (remap[docids[i]] for i in order))
+
+    def _rebuild(self, order: list[int]) -> None:
+        values, docids = self.values, self.docids
+        self.values = array("d", (values[i] for i in order))
+        self.docids = array("I", (docids[i] for i in order))
+        self._sorted = True
+
+    def span(self, low: float | None, high: float | None) -> tuple[int, int]:
+        start = 0 if low is None else bisect_left(self.values, low)
+        stop = len(self.values) if high is None else bisect_right(self.values, high)
+        return start, stop
+
+
+class _IndexData:
+    """The index itself. Docids are positions in the per-document arrays."""
+
+    # Per-document columns, renumbered together by compact()
+    DOC_COLUMNS = (
+        "listing_ids", "alive", "fingerprints", "norms", "listing_types", "property_types",
+        "cities", "prices", "areas", "rooms", "boosted", "created",
+    )
+
+    def __init__(self) -> None:
+        self.postings: dict[str, tuple[array, array]] = {}
+        self.vocabulary: list[str] = []  # sorted, for prefix lookups
+        self.docids: dict[uuid.UUID, int] = {}
+
+        # Per-document columns (docid -> value)
+        self.listing_ids: list[uuid.UUID] = []
+        self.alive = bytearray()
+        self.fingerprints = array("q")
+        self.norms = array("d")  # ts_rank normalization 1: 1 / (1 + log(length))
+        self.listing_types: list[ListingType] = []
+        self.property_types: list[PropertyType] = []
+        self.cities: list[str] = []
+        self.prices = array("d")
+        self.areas = array("d")  # NaN = unknown
+        self.rooms = array("i")  # -1 = unknown
+        self.boosted = bytearray()
+        self.created = array("d")
+
+        # Sorted columns for range filters
+        self.price_column = _SortedColumn()
+        self.area_column = _SortedColumn()
+        self.rooms_column = _SortedColumn()
+
+        self.dead = 0
+        self._bulk = False
+
+    @property
+    def size(self) -> int:
+        return len(self.docids)
+
+    def apply(self, listing_id: uuid.UUID, doc: IndexedListing | None) -> bool:
+        """Insert, replace (doc) or remove (None) a listing. False if nothing changed."""
+        old = self.docids.get(listing_id)
+        fingerprint = doc.fingerprint() if doc is not None else 0
+        if old is not None and doc is not None and self.fingerprints[old] == fingerprint:
+            return False
+        if old is None and doc is None:
+            return False
+        if old is not None:
+            self.alive[old] = 0
+            del self.docids[listing_id]
+            self.dead += 1
+        if doc is not None:
+            self._add(doc, fingerprint)
+        return True
+
+    def _add(self, doc: IndexedListing, fingerprint: int) -> None:
+        docid = len(self.listing_ids)
+        self.docids[doc.listing_id] = docid
+        self.listing_ids.append(doc.listing_id)
+        self.alive.append(1)
+        self.fingerprints.append(fingerprint)
+        self.norms.append(1 / (1 + math.log(max(doc.length, 1))))
+        self.listing_types.append(doc.listing_type)
+        self.property_types.append(doc.property_type)
+        self.cities.append(doc.city)
+        self.prices.append(doc.price)
+        self.areas.append(math.nan if doc.area_sqm is None else doc.area_sqm)
+        self.rooms.append(-1 if doc.rooms is None else doc.rooms)
+        self.boosted.append(doc.is_boosted)
+        self.created.append(doc.created_at)
+
+        add = _SortedColumn.append if self._bulk else _SortedColumn.insert
+        add(self.price_column, doc.price, docid)
+        if doc.area_sqm is not None:
+            add(self.area_column, doc.area_sqm, docid)
+        if doc.rooms is not None:
+            add(self.rooms_column, doc.rooms, docid)
+
+        for token, flags in doc.tokens.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = (array("I"), array("B"))
+                if self._bulk:
+                    self.vocabulary.append(token)
+                else:
+                    insort(self.vocabulary, token)
+            posting[0].append(docid)
+            posting[1].append(flags)
+
+    def bulk_load(self, docs) -> None:
+        self._bulk = True
+        try:
+            for doc in docs:
+                self.apply(doc.listing_id, doc)
+        finally:
+            self._bulk = False
+
+    def finish_bulk_load(self) -> None:
+        self.vocabulary.sort()
+        for column in (self.price_column, self.area_column, self.rooms_column):
+            column.sort()
+
+    def needs_compaction(self) -> bool:
+        return self.dead > COMPACT_DEAD_RATIO * max(len(self.listing_ids), 1)
+
+    def compact(self) -> None:
+        """Drop tombstoned documents: renumber docids (keeping their order, so postings
+        stay sorted) and rebuild the per-document columns, postings and sorted columns."""
+        alive = self.alive
+        keep = [docid for docid in range(len(alive)) if alive[docid]]
+        remap = array("i", [-1]) * len(alive)
+        for new_docid, docid in enumerate(keep):
+            remap[docid] = new_docid
+
+        for name in self.DOC_COLUMNS:
+            column = getattr(self, name)
+            if isinstance(column, array):
+                column = array(column.typecode, (column[i] for i in keep))
+            elif isinstance(column, bytearray):
+                column = bytearray(column[i] for i in keep)
+            else:
+                column = [column[i] for i in keep]
+            setattr(self, name, column)
+        self.docids = {listing_id: docid for docid, listing_id in enumerate(self.listing_ids)}
+
+        for token in list(self.postings):
+            docids, flags = self.postings[token]
+            kept = [i for i, docid in enumerate(docids) if remap[docid] >= 0]
+            if not kept:
+                del self.postings[token]
+            else:
+                self.postings[token] = (
+                    array("I", (remap[docids[i]] for i in kept)),
+                    array("B", (flags[i] for i in kept)),
+                )
+        self.vocabulary = sorted(self.postings)
+        for column in (self.price_column, self.area_column, self.rooms_column):
+            column.compact(remap)
+        self.dead = 0
+
+    def _tokens_for(self, term: str, prefix: bool) -> list[str]:
+        # Same word or same stem; the last word also matches as a prefix
+        key = term[:4]
+        tokens = []
+        for i in range(bisect_left(self.vocabulary, key), len(self.vocabulary)):
+            token = self.vocabulary[i]
+            if not token.startswith(key):
+                break
+            if token == term or same_stem(token, term) or (prefix and token.startswith(term)):
+                tokens.append(token)
+        return tokens
+
+    def _match(self, terms: list[str]) -> dict[int, float]:
+        """docid -> summed field weight, for documents containing every term."""
+        scores: dict[int, float] | None = None
+        for position, term in enumerate(terms):
+            tokens = self._tokens_for(term, prefix=position == len(terms) - 1)
+            if len(tokens) == 1:
+                matched = dict(zip(*self.postings[tokens[0]]))
+            else:
+                matched: dict[int, int] = {}
+                for token in tokens:
+                    docids, flags = self.postings[token]
+                    for docid, flag in zip(docids, flags):
+                        matched[docid] = matched.get(docid, 0) | flag
+            if scores is None:
+                scores = {docid: _FLAG_SCORES[flag] for docid, flag in matched.items()}
+            else:
+                scores = {
+                    docid: score + _FLAG_SCORES[matched[docid]]
+                    for docid, score in scores.items()
+                    if docid in matched
+                }
+            if not scores:
+                return {}
+        return scores or {}
+
+    def _range_filter(
+        self,
+        candidates: list[int],
+        column: _SortedColumn,
+        values: array,
+        low: float | None,
+        high: float | None,
+    ) -> list[int]:
+        start, stop = column.span(low, high)
+        if stop - start < len(candidates):
+            # Selective range: intersect with the sorted column slice
+            allowed = set(column.docids[start:stop])
+            return [docid for docid in candidates if docid in allowed]
+        low = -math.inf if low is None else low
+        high = math.inf if high is None else high
+        return [docid for docid in candidates if low <= values[docid] <= high]
+
+    def search(
+        self,
+        terms: list[str],
+        filters: dict,
+        sort_by: str,
+        sort_order: str,
+        offset: int,
+        limit: int,
+        after: tuple | None = None,
+    ) -> tuple[int, list[tuple[uuid.UUID, float, tuple]]]:
+        scores = self._match(terms)
+        alive = self.alive
+        candidates = [docid for docid in scores if alive[docid]]
+
+        if filters.get("listing_type"):
+            wanted = filters["listing_type"]
+            candidates = [d for d in candidates if self.listing_types[d] == wanted]
+        if filters.get("property_type"):
+            wanted = filters["property_type"]
+            candidates = [d for d in candidates if self.property_types[d] == wanted]
+        if filters.get("city"):
+            wanted = filters["city"].lower()
+            candidates = [d for d in candidates if wanted in self.cities[d]]
+        if filters.get("min_price") is not None or filters.get("max_price") is not None:
+            candidates = self._range_filter(
+                candidates, self.price_column, self.prices,
+                filters.get("min_price"), filters.get("max_price"),
+            )
+        if filters.get("min_area") is not None or filters.get("max_area") is not None:
+            candidates = self._range_filter(
+                candidates, self.area_column, self.areas,
+                filters.get("min_area"), filters.get("max_area"),
+            )
+        if filters.get("rooms") is not None:
+            candidates = self._range_filter(
+                candidates, self.rooms_column, self.rooms, filters["rooms"], filters["rooms"],
+            )
+
+        # Boosted first, then the requested order (same as the SQL path); the
+        # listing id makes every key unique so `after` (a page's last key) is exact
+        norms, boosted, created, ids = self.norms, self.boosted, self.created, self.listing_ids
+        if sort_by == "relevance":
+            key = lambda d: (-boosted[d], -scores[d] * norms[d], -created[d], ids[d])  # noqa: E731
+        else:
+            column = self.prices if sort_by == "price" else created
+            sign = -1 if sort_order == "desc" else 1
+            key = lambda d: (-boosted[d], sign * column[d], ids[d])  # noqa: E731
+
+        total = len(candidates)
+        if after is not None:
+            candidates = [d for d in candidates if key(d) > after]
+            offset = 0
+        page = nsmallest(offset + limit, candidates, key=key)[offset:]
+        return total, [(ids[d], scores[d] * norms[d], key(d)) for d in page]
+
+
+class ListingSearchIndex:
+    """Lifecycle around _IndexData: startup build, commit hooks, periodic sync."""
+
+    def __init__(self) -> None:
+        self._data: _IndexData | None = None
+        self._synced_at: datetime | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SEARCH_INDEX_ENABLED
+
+    @property
+    def ready(self) -> bool:
+        return self._data is not None
+
+    # ---- queries ---------------------------------------------------------
+
+    def search(
+        self,
+        terms: list[str],
+        filters: dict,
+        sort_by: str,
+        sort_order: str,
+        offset: int,
+        limit: int,
+        after: tuple | None = None,
+    ) -> tuple[int, list[tuple[uuid.UUID, float, tuple]]]:
+        """Total matches and the (listing_id, rank, sort key) page, in display order.
+
+        With `after` (the sort key of a previous page's last hit) the page
+        starts right after it and `offset` is ignored.
+        """
+        return self._data.search(terms, filters, sort_by, sort_order, offset, limit, after)
+
+    # ---- updates ---------------------------------------------------------
+
+    def index_listing(self, db: AsyncSession, listing: Listing) -> None:
+        """(Re)index a listing once the session commits; inactive listings are removed."""
+        if not self.enabled:
+            return
+        doc = IndexedListing.from_listing(listing) if listing.status == ListingStatus.ACTIVE else None
+        db.sync_session.info.setdefault(PENDING_KEY, {})[listing.id] = doc
+
+    def remove_listing(self, db: AsyncSession, listing_id: uuid.UUID) -> None:
+        """Remove a listing once the session commits."""
+        if not self.enabled:
+            return
+        db.sync_session.info.setdefault(PENDING_KEY, {})[listing_id] = None
+
+    def discard(self, listing_id: uuid.UUID) -> None:
+        """Remove immediately (listing no longer active in the database)."""
+        if self._data is not None:
+            self._data.apply(listing_id, None)
+
+    def _apply_pending(self, pending: dict) -> None:
+        if self._data is None:
+            return  # still building; the first sync picks these up
+        for listing_id, doc in pending.items():
+            self._data.apply(listing_id, doc)
+
+    # ---- build / sync ----------------------------------------------------
+
+    async def build(self, session_factory: async_sessionmaker) -> None:
+        """Load every active listing into a fresh index and swap it in."""
+        started = datetime.now(timezone.utc)
+        clock = time.perf_counter()
+        data = _IndexData()
+        async with session_factory() as session:
+            result = await session.stream(
+                select(*_COLUMNS)
+                .where(Listing.status == ListingStatus.ACTIVE)
+                .execution_options(yield_per=BUILD_BATCH)
+            )
+            async for rows in result.partitions():
+                data.bulk_load(IndexedListing.from_listing(row) for row in rows)
+                await asyncio.sleep(0)  # let requests run between batches
+        data.finish_bulk_load()
+        self._data = data
+        self._synced_at = started
+        logger.info(
+            f"Search index built: {data.size} listings, {len(data.postings)} tokens "
+            f"in {time.perf_counter() - clock:.1f}s"
+        )
+
+    async def sync(self, session_factory: async_sessionmaker) -> int:
+        """Re-read listings updated since the last sync (with overlap for in-flight commits)."""
+        started = datetime.now(timezone.utc)
+        since = self._synced_at - timedelta(seconds=settings.SEARCH_INDEX_SYNC_SECONDS + 60)
+        data = self._data
+        changed = 0
+        async with session_factory() as session:
+            result = await session.stream(
+                select(*_COLUMNS)
+                .where(Listing.updated_at >= since)
+                .execution_options(yield_per=BUILD_BATCH)
+            )
+            async for rows in result.partitions():
+                for row in rows:
+                    doc = IndexedListing.from_listing(row) if row.status == ListingStatus.ACTIVE else None
+                    changed += data.apply(row.id, doc)
+        self._synced_at = started
+        if data.needs_compaction():
+            data.compact()
+        return changed
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """Background task: build, then sync every SEARCH_INDEX_SYNC_SECONDS."""
+        try:
+            await self.build(session_factory)
+        except Exception as e:
+            logger.error(f"Search index build failed, search stays on SQL: {e}")
+            return
+        while True:
+            await asyncio.sleep(settings.SEARCH_INDEX_SYNC_SECONDS)
+            try:
+                await self.sync(session_factory)
+            except Exception as e:
+                logger.error(f"Search index sync failed: {e}")
+
+
+search_index = ListingSearchIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        search_index._apply_pending(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
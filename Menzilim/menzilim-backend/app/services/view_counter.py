@@ -0,0 +1,168 @@
+"""Buffered listing view counter.
+
+GET /listings/{id} used to UPDATE the listing row on every view. Views are now
+recorded in a buffer and written to the database every VIEW_FLUSH_SECONDS in
+one batched UPDATE:
+
+- a viewer (user id, or client IP when anonymous) counts once per listing per
+  VIEW_DEDUP_SECONDS window
+- the detail endpoint returns the stored count plus the pending delta
+- VIEW_COUNTER_BACKEND=memory buffers per process (single worker / dev);
+  VIEW_COUNTER_BACKEND=redis shares the buffer and the dedup window between
+  workers (a flush atomically RENAMEs the pending hash, so each view is
+  written by exactly one worker)
+- counts that fail to write are put back and retried on the next flush
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.models.listing import Listing
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PENDING_KEY = "views:pending"
+SEEN_KEY_PREFIX = "views:seen:"
+
+
+class InMemoryViewBuffer:
+    """Per-process buffer."""
+
+    def __init__(self) -> None:
+        self._pending: dict[uuid.UUID, int] = {}
+        self._seen: dict[tuple[uuid.UUID, str], float] = {}
+
+    async def record(self, listing_id: uuid.UUID, viewer: str) -> int:
+        """Count a view (once per viewer and window); returns the pending delta."""
+        now = time.monotonic()
+        key = (listing_id, viewer)
+        if self._seen.get(key, 0) <= now:
+            self._seen[key] = now + settings.VIEW_DEDUP_SECONDS
+            self._pending[listing_id] = self._pending.get(listing_id, 0) + 1
+        return self._pending.get(listing_id, 0)
+
+    async def drain(self) -> dict[uuid.UUID, int]:
+        pending, self._pending = self._pending, {}
+        now = time.monotonic()
+        self._seen = {key: expires for key, expires in self._seen.items() if expires > now}
+        return pending
+
+    async def restore(self, counts: dict[uuid.UUID, int]) -> None:
+        for listing_id, count in counts.items():
+            self._pending[listing_id] = self._pending.get(listing_id, 0) + count
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisViewBuffer:
+    """Buffer shared by all workers."""
+
+    def __init__(self, url: str) -> None:
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    async def record(self, listing_id: uuid.UUID, viewer: str) -> int:
+        field = str(listing_id)
+        first_view = await self._redis.set(
+            f"{SEEN_KEY_PREFIX}{field}:{viewer}", 1, nx=True, ex=settings.VIEW_DEDUP_SECONDS
+        )
+        if first_view:
+            return await self._redis.hincrby(PENDING_KEY, field, 1)
+        return int(await self._redis.hget(PENDING_KEY, field) or 0)
+
+    async def drain(self) -> dict[uuid.UUID, int]:
+        flushing_key = f"{PENDING_KEY}:{uuid.uuid4().hex}"
+        try:
+            await self._redis.rename(PENDING_KEY, flushing_key)
+        except ResponseError:
+            return {}  # nothing pending (or another worker took it)
+        counts = await self._redis.hgetall(flushing_key)
+        await self._redis.delete(flushing_key)
+        return {uuid.UUID(field): int(count) for field, count in counts.items()}
+
+    async def restore(self, counts: dict[uuid.UUID, int]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for listing_id, count in counts.items():
+                pipe.hincrby(PENDING_KEY, str(listing_id), count)
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class ViewCounterService:
+    """Records views and flushes them to listings.views_count in batches."""
+
+    def __init__(self) -> None:
+        if settings.VIEW_COUNTER_BACKEND == "redis":
+            self.buffer = RedisViewBuffer(settings.REDIS_URL)
+        else:
+            self.buffer = InMemoryViewBuffer()
+
+    async def record_view(self, listing_id: uuid.UUID, viewer: str) -> int:
+        """Record a view; returns the views not yet written to the database."""
+        try:
+            return await self.buffer.record(listing_id, viewer)
+        except Exception as e:
+            logger.warning(f"View not recorded for listing {listing_id}: {e}")
+            return 0
+
+    async def flush(self, session_factory: async_sessionmaker) -> int:
+        """Write pending views in one batched UPDATE; returns the number of listings updated."""
+        counts = await self.buffer.drain()
+        if not counts:
+            return 0
+
+        table = Listing.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("listing_id"))
+            # Keep updated_at: a view is not an edit
+            .values(
+                views_count=table.c.views_count + bindparam("delta"),
+                updated_at=table.c.updated_at,
+            )
+        )
+        # Sorted ids: concurrent flushes lock rows in the same order
+        params = [
+            {"listing_id": listing_id, "delta": counts[listing_id]}
+            for listing_id in sorted(counts)
+        ]
+        try:
+            async with session_factory() as session:
+                await session.execute(statement, params)
+                await session.commit()
+        except BaseException:
+            # Also on cancellation (shutdown), so close() writes them in its final flush
+            await self.buffer.restore(counts)
+            raise
+        return len(counts)
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """Background task: flush every VIEW_FLUSH_SECONDS."""
+        while True:
+            await asyncio.sleep(settings.VIEW_FLUSH_SECONDS)
+            try:
+                await self.flush(session_factory)
+            except Exception as e:
+                logger.error(f"View count flush failed: {e}")
+
+    async def close(self, session_factory: async_sessionmaker) -> None:
+        """Final flush on shutdown."""
+        try:
+            await self.flush(session_factory)
+        except Exception as e:
+            logger.error(f"Final view count flush failed: {e}")
+        await self.buffer.close()
+
+
+view_counter = ViewCounterService()
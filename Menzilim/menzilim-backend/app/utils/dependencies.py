@@ -1,15 +1,17 @@
 import uuid
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User, UserRole
+from app.utils.pagination import COUNT_MODES
 from app.utils.security import verify_access_token
 
 security_scheme = HTTPBearer()
+optional_security_scheme = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -84,6 +86,32 @@ async def get_current_agent_or_admin(
     return current_user
 
 
+def get_optional_user_id(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security_scheme),
+) -> uuid.UUID | None:
+    """User id from a valid bearer token, None for anonymous requests (never raises)."""
+    payload = verify_access_token(credentials.credentials) if credentials else None
+    try:
+        return uuid.UUID(payload["sub"]) if payload and payload.get("sub") else None
+    except ValueError:
+        return None
+
+
+def get_viewer_key(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security_scheme),
+) -> str:
+    """Identify a (possibly anonymous) viewer: user id from a valid token, else client IP.
+
+    The IP is the connection's peer address. X-Forwarded-For is client-controlled,
+    so it is only applied by uvicorn for trusted proxies (FORWARDED_ALLOW_IPS).
+    """
+    payload = verify_access_token(credentials.credentials) if credentials else None
+    if payload and payload.get("sub"):
+        return f"user:{payload['sub']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
 def pagination_params(
     page: int = 1,
     per_page: int = 20,
@@ -96,3 +124,12 @@ def pagination_params(
     if per_page > 100:
         per_page = 100
     return {"page": page, "per_page": per_page, "offset": (page - 1) * per_page}
+
+
+def cursor_pagination_params(
+    pagination: dict = Depends(pagination_params),
+    cursor: str | None = Query(None, description="next_cursor of the previous page (overrides page)"),
+    count: str = Query("exact", enum=COUNT_MODES, description="How `total` is computed"),
+) -> dict:
+    """pagination_params plus keyset cursor and count mode (see app.utils.pagination)."""
+    return {**pagination, "cursor": cursor, "count": count}
@@ -0,0 +1,81 @@
+"""Geo helpers for listings: indexed location column, bounding boxes, map grid.
+
+PostGIS is not assumed (the stock postgres image has no extension), so
+listings get a stored generated core-Postgres `point` with a GiST index, in an
+equirectangular projection centred on Azerbaijan:
+
+    location = point(longitude * cos(40.4°), latitude)
+
+Both axes are in degrees of latitude, so `<->` between two locations is a
+distance (x EARTH_KM_PER_DEGREE km). East-west scale error is ~0 in Baku and
+under 3% at the country's northern/southern edges; reported distances use
+haversine. The GiST index serves box / circle containment (`<@`) and
+nearest-first ordering (`ORDER BY location <-> point`).
+"""
+
+import math
+
+from sqlalchemy import Float, func, literal
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import UserDefinedType
+
+EARTH_RADIUS_KM = 6371.0
+EARTH_KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180  # ~111.195 km
+
+# Changing this needs the location column (and its index) to be rebuilt
+PROJECTION_LATITUDE = 40.4
+LNG_SCALE = round(math.cos(math.radians(PROJECTION_LATITUDE)), 6)
+
+LISTING_LOCATION_SQL = f"point(longitude * {LNG_SCALE}, latitude)"
+
+# Map clustering: ~64 px cells on a 256 px web-map tile
+CLUSTER_CELLS_PER_TILE = 4
+
+
+class Point(UserDefinedType):
+    """Postgres core `point` (DDL only — the column is never loaded)."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "POINT"
+
+
+def _float(value: float) -> ColumnElement:
+    return literal(value, Float)
+
+
+def make_point(latitude: float, longitude: float) -> ColumnElement:
+    """Projected point matching the `location` column."""
+    return func.point(_float(longitude * LNG_SCALE), _float(latitude))
+
+
+def bounds_box(min_lat: float, max_lat: float, min_lng: float, max_lng: float) -> ColumnElement:
+    """Projected box of a lat/lng bounding box (exact: the projection is linear)."""
+    return func.box(make_point(min_lat, min_lng), make_point(max_lat, max_lng))
+
+
+def radius_circle(latitude: float, longitude: float, radius_km: float) -> ColumnElement:
+    """Projected circle covering a radius, for `location <@ circle` pre-filtering.
+
+    Padded by the worst-case projection error — filter on haversine_km() too.
+    """
+    radius = radius_km / EARTH_KM_PER_DEGREE * 1.05
+    return func.circle(make_point(latitude, longitude), _float(radius))
+
+
+def haversine_km(latitude: float, longitude: float, lat_column, lng_column) -> ColumnElement:
+    """Great-circle distance in km from a fixed point to lat/lng columns."""
+    lat = math.radians(latitude)
+    dlat = func.radians(lat_column - latitude)
+    dlng = func.radians(lng_column - longitude)
+    a = func.power(func.sin(dlat / 2), 2) + math.cos(lat) * func.cos(
+        func.radians(lat_column)
+    ) * func.power(func.sin(dlng / 2), 2)
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(func.sqrt(a), 1.0))
+
+
+def cluster_cell_size(zoom: int, latitude: float) -> tuple[float, float]:
+    """(lat, lng) size in degrees of a ~64 px square cell at a web-map zoom level."""
+    lng_size = 360.0 / (2 ** zoom) / CLUSTER_CELLS_PER_TILE
+    return lng_size * math.cos(math.radians(latitude)), lng_size
@@ -0,0 +1,217 @@
+"""Keyset (cursor) pagination and cheap result counts for list endpoints.
+
+OFFSET pagination reads and throws away every row before the page, and the
+exact COUNT(*) scans every match, so both grow with the table. paginate():
+
+- pages by keyset when the request carries a `cursor`: the sort key of the
+  last row is encoded in an opaque token and the next page starts with
+  `WHERE (sort key) < (cursor)`, which an index on the sort columns serves
+  directly. `page` still works (OFFSET) for jumping to a page number, and
+  every response carries the `next_cursor` for continuing from it.
+- counts in one of three modes (the `count` query parameter):
+    exact     - COUNT(*) over all matches (the default)
+    estimated - the planner's row estimate (EXPLAIN), no scan at all
+    capped    - COUNT(*) over at most CAPPED_COUNT_LIMIT + 1 matches
+  The response's `total_exact` is False when `total` is not the exact count.
+
+Sort orders are lists of (column, descending) pairs and must end with a
+unique column (the primary key) so every row has a distinct position. Keep
+every column in one direction (see boosted_first()) so the keyset is a row
+comparison an index can seek to; mixed directions fall back to an OR chain
+that can only be filtered.
+"""
+
+import base64
+import binascii
+import json
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, func, literal, literal_column, not_, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+
+CAPPED_COUNT_LIMIT = 1000
+
+COUNT_MODES = ["exact", "estimated", "capped"]
+
+SortOrder = list[tuple[ColumnElement, bool]]
+
+
+@dataclass
+class Page:
+    rows: list[tuple]  # the selected entities/columns, without the sort key
+    total: int
+    total_exact: bool
+    pages: int
+    next_cursor: str | None
+
+    def scalars(self) -> list:
+        """First selected entity of every row."""
+        return [row[0] for row in self.rows]
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def boosted_first(
+    boosted: ColumnElement, column: ColumnElement, descending: bool, tiebreak: ColumnElement
+) -> SortOrder:
+    """Boosted rows first, then `column` (and `tiebreak`) in the requested direction.
+
+    `is_boosted DESC, price ASC` is written as `(NOT is_boosted) ASC, price ASC`
+    — the same order, in a single direction.
+    """
+    first = boosted if descending else not_(boosted)
+    return [(first, descending), (column, descending), (tiebreak, descending)]
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor",
+    )
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def _from_json(value, column: ColumnElement):
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type in (Decimal, uuid.UUID):
+        return python_type(value)
+    if python_type is bool:
+        if not isinstance(value, bool):
+            raise ValueError(value)
+        return value
+    if python_type in (int, float):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(value)
+        return python_type(value)
+    raise ValueError(value)
+
+
+def encode_cursor(values) -> str:
+    """Opaque cursor for the sort key values of a row."""
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor_values(cursor: str) -> list:
+    """The JSON values of a cursor, untyped."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise invalid_cursor()
+    if not isinstance(values, list):
+        raise invalid_cursor()
+    return values
+
+
+def decode_cursor(cursor: str, order: SortOrder) -> list:
+    """Sort key values of a cursor made by encode_cursor() for the same order."""
+    values = decode_cursor_values(cursor)
+    if len(values) != len(order):
+        raise invalid_cursor()
+    try:
+        return [_from_json(value, column) for value, (column, _) in zip(values, order)]
+    except (ValueError, TypeError, AttributeError, ArithmeticError):
+        raise invalid_cursor()
+
+
+def keyset_condition(order: SortOrder, values: list) -> ColumnElement:
+    """Rows strictly after `values` in `order`."""
+    bound = [literal(value, column.type) for value, (column, _) in zip(values, order)]
+    directions = {descending for _, descending in order}
+
+    if len(directions) == 1:
+        # Single direction: a row comparison, matched by a composite index
+        columns = tuple_(*[column for column, _ in order])
+        return columns < tuple_(*bound) if directions.pop() else columns > tuple_(*bound)
+
+    # Mixed directions (e.g. boosted first, then price ascending)
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        equal = [order[j][0] == bound[j] for j in range(i)]
+        after = column < bound[i] if descending else column > bound[i]
+        clauses.append(and_(*equal, after))
+    return or_(*clauses)
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: str = "exact") -> tuple[int, bool]:
+    """(total, is_exact) for the rows of `query`."""
+    matches = query.with_only_columns(literal_column("1"), maintain_column_froms=True).order_by(None)
+
+    if mode == "estimated":
+        plan = (await db.execute(_Explain(matches))).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(int(plan[0]["Plan"]["Plan Rows"]), 0), False
+
+    if mode == "capped":
+        matches = matches.limit(CAPPED_COUNT_LIMIT + 1)
+    total = (await db.execute(select(func.count()).select_from(matches.subquery()))).scalar() or 0
+    if total > CAPPED_COUNT_LIMIT and mode == "capped":
+        return CAPPED_COUNT_LIMIT, False
+    return total, True
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    order: SortOrder,
+    pagination: dict,
+) -> Page:
+    """Count and load one page of `query` in `order` (see the module docstring)."""
+    per_page = pagination["per_page"]
+    total, total_exact = await count_rows(db, query, pagination["count"])
+
+    query = query.order_by(
+        *[column.desc() if descending else column.asc() for column, descending in order]
+    )
+    if pagination["cursor"]:
+        query = query.where(keyset_condition(order, decode_cursor(pagination["cursor"], order)))
+    else:
+        query = query.offset(pagination["offset"])
+
+    # The sort key rides along as extra columns; one extra row tells if there is a next page
+    keys = [column.label(f"_key{i}") for i, (column, _) in enumerate(order)]
+    result = await db.execute(query.add_columns(*keys).limit(per_page + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1][-len(keys):])
+
+    return Page(
+        rows=[tuple(row[:-len(keys)]) for row in rows],
+        total=total,
+        total_exact=total_exact,
+        pages=math.ceil(total / per_page) if total > 0 else 1,
+        next_cursor=next_cursor,
+    )
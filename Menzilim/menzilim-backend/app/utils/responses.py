@@ -0,0 +1,66 @@
+"""Fast JSON response class backed by orjson / pydantic-core (opt-in).
+
+Two ways to use it:
+
+1. Per router — orjson instead of json.dumps:
+
+       router = APIRouter(..., default_response_class=FastJSONResponse)
+
+2. Returned directly from heavy routes — skips FastAPI's response_model
+   re-validation and the jsonable_encoder pass:
+
+       return FastJSONResponse([ListingMapResponse.model_validate(l) for l in rows])
+
+   Pydantic models (or lists of models) are written by pydantic-core's Rust
+   serializer, giving the same output as the response_model path. Anything
+   else goes through orjson: datetime/date, UUID and Enum are native, while
+   Decimal, sets and nested models are converted the way jsonable_encoder
+   does. Only return content that is already a response schema (never ORM
+   objects) — response_model does not filter fields on this path.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any
+
+import orjson
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not handle natively — same output as jsonable_encoder."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    return jsonable_encoder(obj)
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize content to UTF-8 JSON bytes."""
+    if isinstance(content, BaseModel) or (
+        isinstance(content, list) and content and all(isinstance(item, BaseModel) for item in content)
+    ):
+        return pydantic_core.to_json(content, by_alias=True)
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson / pydantic-core instead of json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
@@ -0,0 +1,125 @@
+"""Text search helpers for listings: normalization, tsvector/tsquery and snippets.
+
+Listings are indexed in a stored generated `search_vector` column (GIN):
+
+- 'simple' config over every text field, weighted title (A) > city/district (B)
+  > address (C) > description (D). Azerbaijani has no Postgres stemmer, so
+  az-specific letters are folded to ASCII (ə->e, ı->i, ş->s, ...) on both the
+  document and the query side — "Baki", "bakı" and "Bakı" all match.
+- 'english' and 'russian' configs over title + description for stemming
+  ("apartments" ~ "apartment", "квартиры" ~ "квартира").
+
+The query is the OR of the three configs; the 'simple' part uses a prefix match
+on the last word so search-as-you-type works.
+"""
+
+import html
+import os
+import re
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# Single-character folds only, so positions in the folded text match the original
+AZ_FOLD_FROM = "ƏəİIıÖöÜüĞğŞşÇç"
+AZ_FOLD_TO = "eeiiioouuggsscc"
+_FOLD_TABLE = str.maketrans(AZ_FOLD_FROM, AZ_FOLD_TO)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+SNIPPET_WORDS = 24
+MAX_QUERY_TERMS = 8
+
+
+def _fold_sql(column: str) -> str:
+    return f"translate(coalesce({column}, ''), '{AZ_FOLD_FROM}', '{AZ_FOLD_TO}')"
+
+
+# Expression for the generated column (must be IMMUTABLE: explicit regconfig casts)
+LISTING_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('simple'::regconfig, {_fold_sql('title')}), 'A') || "
+    f"setweight(to_tsvector('simple'::regconfig, {_fold_sql('city')} || ' ' || {_fold_sql('district')}), 'B') || "
+    f"setweight(to_tsvector('simple'::regconfig, {_fold_sql('address')}), 'C') || "
+    f"setweight(to_tsvector('simple'::regconfig, {_fold_sql('description')}), 'D') || "
+    f"setweight(to_tsvector('english'::regconfig, {_fold_sql('title')}), 'A') || "
+    f"setweight(to_tsvector('english'::regconfig, {_fold_sql('description')}), 'D') || "
+    f"setweight(to_tsvector('russian'::regconfig, {_fold_sql('title')}), 'A') || "
+    f"setweight(to_tsvector('russian'::regconfig, {_fold_sql('description')}), 'D')"
+)
+
+
+def fold_text(text: str) -> str:
+    """Lower-case and fold Azerbaijani letters to ASCII, keeping string length."""
+    return "".join(
+        folded if len(folded := ch.lower()) == 1 else ch
+        for ch in text.translate(_FOLD_TABLE)
+    )
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Folded words of a text — the 'simple' config tokens, used by the in-memory index."""
+    return _WORD_RE.findall(fold_text(text)) if text else []
+
+
+def query_terms(q: str) -> list[str]:
+    """Folded search words (only \\w characters — safe to embed in a tsquery)."""
+    return tokenize(q)[:MAX_QUERY_TERMS]
+
+
+def _regconfig(name: str) -> ColumnElement:
+    return literal_column(f"'{name}'::regconfig")
+
+
+def build_tsquery(terms: list[str]) -> ColumnElement:
+    """OR of the 'simple' (last word as prefix) and stemmed english/russian queries."""
+    prefix_query = " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+    plain = " ".join(terms)
+    return (
+        func.to_tsquery(_regconfig("simple"), prefix_query)
+        .op("||")(func.plainto_tsquery(_regconfig("english"), plain))
+        .op("||")(func.plainto_tsquery(_regconfig("russian"), plain))
+    )
+
+
+def same_stem(word: str, term: str) -> bool:
+    # Differ only in a short ending: "apartments" ~ "apartment", "квартиры" ~ "квартира"
+    common = len(os.path.commonprefix([word, term]))
+    return common >= 4 and common >= min(len(word), len(term)) - 1
+
+
+def _matches(word: str, terms: list[str]) -> bool:
+    return any(word.startswith(t) or same_stem(word, t) for t in terms)
+
+
+def highlight(text: str | None, terms: list[str], words: int = SNIPPET_WORDS) -> str | None:
+    """Snippet around the first matching word, matches wrapped in <b>…</b> (HTML-escaped).
+
+    Matching is done on folded text and by word prefix, so "menzil" highlights
+    "mənzillər". Returns None if nothing matches.
+    """
+    if not text or not terms:
+        return None
+    folded = fold_text(text)
+    tokens = list(_WORD_RE.finditer(folded))
+    hits = [i for i, m in enumerate(tokens) if _matches(m.group(), terms)]
+    if not hits:
+        return None
+
+    start = max(hits[0] - words // 3, 0)
+    end = min(start + words, len(tokens))
+    hit_set = set(hits)
+    begin_pos = tokens[start].start()
+    end_pos = tokens[end - 1].end()
+
+    parts = ["…"] if start > 0 else []
+    cursor = begin_pos
+    for i in range(start, end):
+        m = tokens[i]
+        if i in hit_set:
+            parts.append(html.escape(text[cursor:m.start()]))
+            parts.append(f"<b>{html.escape(text[m.start():m.end()])}</b>")
+            cursor = m.end()
+    parts.append(html.escape(text[cursor:end_pos]))
+    if end < len(tokens):
+        parts.append("…")
+    return "".join(parts)
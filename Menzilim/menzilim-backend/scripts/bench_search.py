@@ -0,0 +1,200 @@
+"""
+Listing search benchmark for Menzilim.
+
+Seeds N synthetic listings (az/ru/en titles and descriptions, Baku-area
+coordinates) and compares the legacy five-column ILIKE search with the
+tsvector/GIN search served by GET /api/v1/listings/search.
+
+Both variants run the same work per request: COUNT(*) + first page of 20.
+The new variant goes through the real router (ASGI, no network) so ranking
+and snippet building are included.
+
+Usage (from menzilim-backend/, against a throwaway database):
+    DATABASE_URL=postgresql+asyncpg://.../menzilim_bench \\
+        python -m scripts.bench_search --listings 100000 --requests 50
+    python -m scripts.bench_search --listings 1000000 --skip-seed
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+import httpx
+from sqlalchemy import func, or_, select, text
+
+from app.database import Base, engine, async_session_factory
+from app.models.listing import Listing, ListingStatus
+from app.models.user import User, UserRole
+import app.models  # noqa: F401 — register every table for create_all
+
+QUERIES = [
+    "mənzil",
+    "menzil nesimi",
+    "Baki",
+    "квартира",
+    "apartment sea view",
+    "yeni tikili",
+    "ofis",
+    "zz-no-match",
+]
+
+_WORDS = {
+    "title": [
+        "Yeni tikilidə", "Köhnə tikilidə", "Təmirli", "Geniş", "Sea view", "Modern",
+        "Уютная", "Просторная", "Cozy", "Bright",
+    ],
+    "kind": ["mənzil", "ev", "ofis", "квартира", "apartment", "house", "villa", "obyekt"],
+    "district": ["Nəsimi", "Yasamal", "Səbail", "Nərimanov", "Xətai", "Binəqədi", "Suraxanı", "Xəzər"],
+    "city": ["Bakı", "Sumqayıt", "Gəncə", "Xırdalan"],
+    "desc": [
+        "Metroya yaxın, bütün şərait var.", "Dəniz mənzərəli, kombi ilə istilik.",
+        "Рядом школа и парк, хороший ремонт.", "Close to the metro, fully furnished.",
+        "Sənədləri qaydasındadır, çıxarış var.", "Новостройка, высокие потолки.",
+        "Quiet street, parking included.", "Təcili satılır, qiymətdə razılaşma var.",
+    ],
+}
+
+
+def _pick(name: str, expr: str) -> str:
+    words = ", ".join("'" + w.replace("'", "''") + "'" for w in _WORDS[name])
+    return f"(ARRAY[{words}])[1 + ({expr}) % {len(_WORDS[name])}]"
+
+
+SEED_SQL = f"""
+INSERT INTO listings (
+    id, user_id, title, description, listing_type, property_type, price, currency,
+    city, district, address, latitude, longitude, rooms, area_sqm, images, status,
+    views_count, is_boosted, created_at, updated_at
+)
+SELECT
+    gen_random_uuid(), :user_id,
+    {_pick("title", "g / 7")} || ' ' || (1 + g % 5) || ' otaqlı ' || {_pick("kind", "g * 13")},
+    {_pick("desc", "g")} || ' ' || {_pick("desc", "g / 8")} || ' ' || {_pick("desc", "g / 64")},
+    (ARRAY['SALE', 'RENT', 'DAILY_RENT'])[1 + g % 3]::listing_type,
+    (ARRAY['OLD_BUILDING', 'NEW_BUILDING', 'HOUSE', 'OFFICE', 'COMMERCIAL'])[1 + g % 5]::property_type,
+    20000 + ((g % 100000) * 7919) % 480000,
+    'AZN'::currency_type,
+    {_pick("city", "g / 3")},
+    {_pick("district", "g / 5")},
+    {_pick("district", "g / 11")} || ' r., ' || (g % 200) || ' küç.',
+    40.30 + random() * 0.20,
+    49.75 + random() * 0.25,
+    1 + g % 5,
+    30 + (g * 37) % 220,
+    '[]'::json,
+    (CASE WHEN g % 10 = 0 THEN 'ARCHIVED' ELSE 'ACTIVE' END)::listing_status,
+    g % 500,
+    g % 50 = 0,
+    now() - (g % 365) * interval '1 day',
+    now()
+FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS g
+"""
+
+SEED_BATCH = 50_000
+
+
+async def seed(listings: int) -> None:
+    """Drop/create all tables and insert `listings` rows in batches."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id = uuid.uuid4()
+    async with async_session_factory() as session:
+        session.add(User(
+            id=user_id, email="bench@menzilim.az", password_hash="-",
+            full_name="Bench", role=UserRole.OWNER,
+        ))
+        await session.commit()
+
+    started = time.perf_counter()
+    for start in range(1, listings + 1, SEED_BATCH):
+        stop = min(start + SEED_BATCH - 1, listings)
+        async with engine.begin() as conn:
+            await conn.execute(text(SEED_SQL), {"user_id": user_id, "start": start, "stop": stop})
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE listings"))
+    print(f"seeded {listings} listings in {time.perf_counter() - started:.1f}s")
+
+
+async def legacy_search(q: str) -> None:
+    """The pre-tsvector query: five ILIKE '%q%' predicates, COUNT + first page."""
+    pattern = f"%{q}%"
+    where = [
+        Listing.status == ListingStatus.ACTIVE,
+        or_(
+            Listing.title.ilike(pattern),
+            Listing.description.ilike(pattern),
+            Listing.city.ilike(pattern),
+            Listing.district.ilike(pattern),
+            Listing.address.ilike(pattern),
+        ),
+    ]
+    async with async_session_factory() as session:
+        await session.execute(select(func.count(Listing.id)).where(*where))
+        await session.execute(
+            select(Listing).where(*where)
+            .order_by(Listing.is_boosted.desc(), Listing.created_at.desc())
+            .limit(20)
+        )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    samples = sorted(samples)
+    return samples[max(int(len(samples) * pct) - 1, 0)]
+
+
+async def _time(call, requests: int) -> list[float]:
+    await call()  # warm-up
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--listings", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse the already seeded table")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        await seed(args.listings)
+
+    from app.main import app
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print("=" * 96)
+        print(f"listings={args.listings}  requests={args.requests}")
+        print("=" * 96)
+        for q in QUERIES:
+            async def new_search(q=q):
+                response = await client.get("/api/v1/listings/search", params={"q": q, "per_page": 20})
+                response.raise_for_status()
+                return response
+
+            total = (await new_search()).json()["total"]
+            legacy = await _time(lambda q=q: legacy_search(q), args.requests)
+            new = await _time(new_search, args.requests)
+            print(
+                f"{q!r:<22} hits={total:<8}"
+                f" ILIKE p50={statistics.median(legacy):8.2f} p99={_percentile(legacy, 0.99):8.2f}"
+                f" | tsvector p50={statistics.median(new):7.2f} p99={_percentile(new, 0.99):7.2f}"
+                f" ({statistics.median(legacy) / statistics.median(new):.1f}x) ms"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,245 @@
+"""
+Query plan regression check for Menzilim list endpoints.
+
+Seeds a synthetic dataset (listings as in scripts/bench_search.py, plus
+agents, favorites and notifications), calls each list endpoint through the
+real router (ASGI, no network) for the first page and the cursor page after
+it, and EXPLAINs every page query it sent. A combination passes when the page
+is read from the expected index in sort order: an Index Scan on that index
+and no Sort node. Exits with status 1 if any combination fails.
+
+Supported listing sorts: created_at desc, price asc/desc, views_count desc
+(created_at asc / views_count asc are not indexed and use a sort).
+
+Usage (from menzilim-backend/, against a throwaway database):
+    DATABASE_URL=postgresql+asyncpg://.../menzilim_plans \\
+        python -m scripts.check_query_plans --listings 200000
+    python -m scripts.check_query_plans --skip-seed
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+
+import httpx
+from sqlalchemy import event, select, text
+
+from app.database import async_session_factory, engine
+from app.models.agent import Agent
+from app.models.user import User, UserRole
+from app.utils.security import create_access_token
+from scripts.bench_search import seed
+
+USERS = 200
+AGENTS = 20
+
+LISTING_SORTS = [
+    ({"sort_by": "created_at", "sort_order": "desc"}, "ix_listings_status_boosted_created"),
+    ({"sort_by": "price", "sort_order": "asc"}, "ix_listings_status_unboosted_price"),
+    ({"sort_by": "price", "sort_order": "desc"}, "ix_listings_status_boosted_price"),
+    ({"sort_by": "views_count", "sort_order": "desc"}, "ix_listings_status_boosted_views"),
+]
+
+LISTING_FILTERS = [
+    {},
+    {"listing_type": "sale"},
+    {"property_type": "house"},
+    {"rooms": 2},
+    {"min_price": 100000, "max_price": 300000},
+    {"listing_type": "rent", "property_type": "new_building"},
+    {"city": "Bakı"},
+]
+
+FAVORITES_SQL = """
+INSERT INTO favorites (id, user_id, listing_id, created_at)
+SELECT gen_random_uuid(), u.id, l.id, now() - l.rn * interval '1 minute'
+FROM (SELECT id, row_number() OVER (ORDER BY id) - 1 AS rn FROM users WHERE email LIKE 'plans-user%') u
+JOIN (SELECT id, row_number() OVER () AS rn FROM listings LIMIT :favorites) l ON l.rn % :users = u.rn
+"""
+
+NOTIFICATIONS_SQL = """
+INSERT INTO notifications (id, user_id, title, body, type, is_read, created_at)
+SELECT gen_random_uuid(), u.id, 'Plan check', 'Synthetic notification', 'SYSTEM', g % 5 <> 0,
+       now() - g * interval '1 hour'
+FROM users u CROSS JOIN generate_series(1, :per_user) AS g
+WHERE u.email LIKE 'plans-user%'
+"""
+
+AGENT_LISTINGS_SQL = """
+UPDATE listings SET agent_id = (CAST(:agent_ids AS uuid[]))[1 + views_count % :agents]
+WHERE views_count % 5 = 0
+"""
+
+
+async def seed_related() -> None:
+    """Users with favorites and notifications, and agents owning a fifth of the listings."""
+    async with async_session_factory() as session:
+        for i in range(USERS):
+            session.add(User(
+                email=f"plans-user{i}@menzilim.az", password_hash="-",
+                full_name=f"Plans {i}", role=UserRole.OWNER,
+            ))
+        agent_ids = []
+        for i in range(AGENTS):
+            user = User(
+                email=f"plans-agent{i}@menzilim.az", password_hash="-",
+                full_name=f"Agent {i}", role=UserRole.AGENT,
+            )
+            session.add(user)
+            await session.flush()
+            agent = Agent(user_id=user.id)
+            session.add(agent)
+            await session.flush()
+            agent_ids.append(agent.id)
+        await session.commit()
+
+    async with engine.begin() as conn:
+        await conn.execute(text(FAVORITES_SQL), {"favorites": USERS * 100, "users": USERS})
+        await conn.execute(text(NOTIFICATIONS_SQL), {"per_user": 200})
+        await conn.execute(text(AGENT_LISTINGS_SQL), {"agent_ids": agent_ids, "agents": AGENTS})
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in ("listings", "favorites", "notifications", "agents", "users"):
+            await conn.execute(text(f"VACUUM ANALYZE {table}"))
+
+
+class StatementRecorder:
+    """Records the SQL (with driver parameters) sent while active."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, tuple]] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.startswith("EXPLAIN"):
+            self.statements.append((statement, parameters))
+
+    def take(self) -> list[tuple[str, tuple]]:
+        statements, self.statements = self.statements, []
+        return statements
+
+
+def _nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+async def explain(statement: str, parameters: tuple) -> dict:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+def check_plan(plan: dict, index: str, ordered: bool) -> str | None:
+    """None when the plan reads `index` (and, if `ordered`, does not sort); else the reason."""
+    nodes = list(_nodes(plan))
+    used = {node.get("Index Name") for node in nodes if "Index" in node["Node Type"]}
+    if index not in used:
+        scans = sorted(
+            f"{node['Node Type']} {node.get('Index Name') or node.get('Relation Name', '')}".strip()
+            for node in nodes if "Scan" in node["Node Type"]
+        )
+        return f"{index} not used ({', '.join(scans)})"
+    if ordered and any("Sort" in node["Node Type"] for node in nodes):
+        return f"{index} used, but the rows are sorted afterwards"
+    return None
+
+
+async def check(client, recorder, name, url, params, expected, headers=None) -> bool:
+    """First page and the cursor page after it; every query matching a pattern is checked."""
+    failures = []
+    cursor = None
+    for page in ("page 1", "cursor"):
+        request = dict(params, per_page=20, count="estimated")
+        if cursor:
+            request["cursor"] = cursor
+        recorder.take()
+        response = await client.get(url, params=request, headers=headers)
+        response.raise_for_status()
+        cursor = response.json().get("next_cursor")
+        statements = recorder.take()
+
+        for pattern, index, ordered in expected:
+            matching = [(sql, args) for sql, args in statements if pattern in sql]
+            if not matching:
+                failures.append(f"{page}: no query matching {pattern!r}")
+            for sql, args in matching:
+                reason = check_plan(await explain(sql, args), index, ordered)
+                if reason:
+                    failures.append(f"{page}: {reason}")
+        if not cursor:
+            break
+
+    print(f"{'FAIL' if failures else 'ok  '}  {name}")
+    for failure in failures:
+        print(f"        {failure}")
+    return not failures
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--listings", type=int, default=200_000)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse the already seeded tables")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        await seed(args.listings)
+        await seed_related()
+
+    from app.main import app
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async with async_session_factory() as session:
+        user_id = (await session.execute(
+            select(User.id).where(User.email.like("plans-user%")).limit(1)
+        )).scalar_one()
+        agent_id = (await session.execute(select(Agent.id).limit(1))).scalar_one()
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id), UserRole.OWNER.value)}"}
+
+    recorder = StatementRecorder()
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://plans") as client:
+        page = "ORDER BY"
+        for (sort, index), filters in itertools.product(LISTING_SORTS, LISTING_FILTERS):
+            name = f"GET /listings {sort['sort_by']} {sort['sort_order']} {filters or ''}"
+            results.append(await check(
+                client, recorder, name, "/api/v1/listings", {**sort, **filters},
+                [(page, index, True)],
+            ))
+
+        results.append(await check(
+            client, recorder, "GET /agents/{id}/listings", f"/api/v1/agents/{agent_id}/listings", {},
+            [(page, "ix_listings_agent_boosted_created", True)],
+        ))
+        results.append(await check(
+            client, recorder, "GET /favorites", "/api/v1/favorites", {},
+            [(page, "ix_favorites_user_created", True)], headers,
+        ))
+        results.append(await check(
+            client, recorder, "GET /notifications", "/api/v1/notifications", {},
+            [
+                (page, "ix_notifications_user_created", True),
+                ("is_read = false", "ix_notifications_user_unread", False),
+            ],
+            headers,
+        ))
+        results.append(await check(
+            client, recorder, "GET /listings/search relevance", "/api/v1/listings/search",
+            {"q": "villa suraxani"}, [(page, "ix_listings_search_vector", False)],
+        ))
+
+    await engine.dispose()
+    print(f"{sum(results)}/{len(results)} combinations use their index")
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
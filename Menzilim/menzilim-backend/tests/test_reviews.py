@@ -0,0 +1,222 @@
+"""
+Review edit / delete tests
+PUT and DELETE /agents/{agent_id}/reviews/{review_id}: who may change a
+review, and that the agent's rating_sum / total_reviews / rating follow.
+
+Runs against the database in DATABASE_URL (migrated); every test seeds its
+own users and removes them afterwards.
+"""
+
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, select
+
+from app.database import async_session_factory, engine
+from app.main import app
+from app.models.agent import Agent
+from app.models.user import User, UserRole
+from app.utils.security import create_access_token
+
+
+async def _seed() -> dict:
+    """An agent plus three users (author, other, admin); returns ids and headers."""
+    suffix = uuid.uuid4().hex[:12]
+    users = {
+        name: User(
+            email=f"review-test-{name}-{suffix}@test.com",
+            # Never logs in: requests carry tokens from create_access_token
+            password_hash="!",
+            full_name=f"Review Test {name}",
+            role=role,
+        )
+        for name, role in [
+            ("agent", UserRole.AGENT),
+            ("author", UserRole.OWNER),
+            ("other", UserRole.OWNER),
+            ("admin", UserRole.ADMIN),
+        ]
+    }
+    async with async_session_factory() as session:
+        session.add_all(users.values())
+        await session.flush()
+        agent = Agent(user_id=users["agent"].id)
+        session.add(agent)
+        await session.commit()
+
+    return {
+        "agent_id": agent.id,
+        "user_ids": [user.id for user in users.values()],
+        "headers": {
+            name: {"Authorization": f"Bearer {create_access_token(str(user.id), user.role.value)}"}
+            for name, user in users.items()
+        },
+    }
+
+
+async def _cleanup(seed: dict) -> None:
+    async with async_session_factory() as session:
+        await session.execute(delete(User).where(User.id.in_(seed["user_ids"])))
+        await session.commit()
+    # Each test has its own event loop; pooled connections must not outlive it
+    await engine.dispose()
+
+
+async def _agent_totals(agent_id: uuid.UUID) -> tuple[int, int, float]:
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(Agent.rating_sum, Agent.total_reviews, Agent.rating).where(Agent.id == agent_id)
+        )
+        return tuple(result.one())
+
+
+def _client() -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _create_review(client: AsyncClient, seed: dict, user: str, rating: int) -> str:
+    response = await client.post(
+        f"/api/v1/agents/{seed['agent_id']}/reviews",
+        json={"rating": rating, "comment": f"{user} review"},
+        headers=seed["headers"][user],
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestReviewAccess:
+    """Only the author or an admin may edit or delete a review"""
+
+    @pytest.mark.asyncio
+    async def test_author_can_edit_and_delete(self):
+        seed = await _seed()
+        try:
+            async with _client() as client:
+                review_id = await _create_review(client, seed, "author", 3)
+                url = f"/api/v1/agents/{seed['agent_id']}/reviews/{review_id}"
+
+                response = await client.put(
+                    url, json={"rating": 4, "comment": "edited"}, headers=seed["headers"]["author"]
+                )
+                assert response.status_code == 200
+                assert response.json()["rating"] == 4
+                assert response.json()["comment"] == "edited"
+
+                response = await client.delete(url, headers=seed["headers"]["author"])
+                assert response.status_code == 200
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_admin_can_edit_and_delete(self):
+        seed = await _seed()
+        try:
+            async with _client() as client:
+                review_id = await _create_review(client, seed, "author", 3)
+                url = f"/api/v1/agents/{seed['agent_id']}/reviews/{review_id}"
+
+                response = await client.put(url, json={"rating": 1}, headers=seed["headers"]["admin"])
+                assert response.status_code == 200
+                assert response.json()["rating"] == 1
+
+                response = await client.delete(url, headers=seed["headers"]["admin"])
+                assert response.status_code == 200
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_other_user_gets_403(self):
+        seed = await _seed()
+        try:
+            async with _client() as client:
+                review_id = await _create_review(client, seed, "author", 3)
+                url = f"/api/v1/agents/{seed['agent_id']}/reviews/{review_id}"
+
+                for headers in (seed["headers"]["other"], seed["headers"]["agent"]):
+                    response = await client.put(url, json={"rating": 1}, headers=headers)
+                    assert response.status_code == 403
+                    response = await client.delete(url, headers=headers)
+                    assert response.status_code == 403
+
+                # Unchanged
+                assert await _agent_totals(seed["agent_id"]) == (3, 1, 3.0)
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_repeated_delete_returns_404(self):
+        seed = await _seed()
+        try:
+            async with _client() as client:
+                review_id = await _create_review(client, seed, "author", 5)
+                url = f"/api/v1/agents/{seed['agent_id']}/reviews/{review_id}"
+
+                response = await client.delete(url, headers=seed["headers"]["author"])
+                assert response.status_code == 200
+                response = await client.delete(url, headers=seed["headers"]["author"])
+                assert response.status_code == 404
+                response = await client.put(url, json={"rating": 1}, headers=seed["headers"]["author"])
+                assert response.status_code == 404
+
+                # The second delete did not count the review out twice
+                assert await _agent_totals(seed["agent_id"]) == (0, 0, 0.0)
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_review_of_another_agent_returns_404(self):
+        seed = await _seed()
+        other_seed = await _seed()
+        try:
+            async with _client() as client:
+                review_id = await _create_review(client, seed, "author", 4)
+                url = f"/api/v1/agents/{other_seed['agent_id']}/reviews/{review_id}"
+
+                response = await client.delete(url, headers=seed["headers"]["author"])
+                assert response.status_code == 404
+        finally:
+            await _cleanup(other_seed)
+            await _cleanup(seed)
+
+
+class TestReviewRating:
+    """Agent rating totals after edits and deletes"""
+
+    @pytest.mark.asyncio
+    async def test_rating_follows_edit_and_delete(self):
+        seed = await _seed()
+        try:
+            async with _client() as client:
+                author_review = await _create_review(client, seed, "author", 4)
+                other_review = await _create_review(client, seed, "other", 2)
+                base = f"/api/v1/agents/{seed['agent_id']}/reviews"
+                assert await _agent_totals(seed["agent_id"]) == (6, 2, 3.0)
+
+                response = await client.put(
+                    f"{base}/{author_review}", json={"rating": 5}, headers=seed["headers"]["author"]
+                )
+                assert response.status_code == 200
+                assert await _agent_totals(seed["agent_id"]) == (7, 2, 3.5)
+
+                # Comment-only edit keeps the rating
+                response = await client.put(
+                    f"{base}/{author_review}", json={"comment": "still 5"}, headers=seed["headers"]["author"]
+                )
+                assert response.status_code == 200
+                assert response.json()["rating"] == 5
+                assert await _agent_totals(seed["agent_id"]) == (7, 2, 3.5)
+
+                response = await client.delete(f"{base}/{other_review}", headers=seed["headers"]["admin"])
+                assert response.status_code == 200
+                assert await _agent_totals(seed["agent_id"]) == (5, 1, 5.0)
+
+                response = await client.get(f"/api/v1/agents/{seed['agent_id']}")
+                assert response.json()["rating"] == 5.0
+                assert response.json()["total_reviews"] == 1
+
+                response = await client.delete(f"{base}/{author_review}", headers=seed["headers"]["author"])
+                assert response.status_code == 200
+                assert await _agent_totals(seed["agent_id"]) == (0, 0, 0.0)
+        finally:
+            await _cleanup(seed)
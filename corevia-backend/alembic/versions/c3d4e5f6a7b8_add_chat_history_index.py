@@ -0,0 +1,32 @@
+"""add_chat_history_index
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, None] = 'b2c3d4e5f6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Composite index for cursor-paginated chat history."""
+    op.create_index(
+        'ix_chat_messages_pair_created',
+        'chat_messages',
+        ['sender_id', 'receiver_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop chat history index."""
+    op.drop_index('ix_chat_messages_pair_created', table_name='chat_messages')
@@ -0,0 +1,91 @@
+"""add_chat_conversations
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Per-pair conversation summary for the chat inbox, backfilled from chat_messages."""
+    op.create_table(
+        'chat_conversations',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_a_id', sa.String(), nullable=False),
+        sa.Column('user_b_id', sa.String(), nullable=False),
+        sa.Column('last_message_id', sa.String(), nullable=False),
+        sa.Column('last_message', sa.Text(), nullable=False),
+        sa.Column('last_message_time', sa.DateTime(), nullable=False),
+        sa.Column('last_sender_id', sa.String(), nullable=False),
+        sa.Column('unread_a', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unread_b', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_a_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['user_b_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_a_id', 'user_b_id', name='uq_chat_conversations_pair'),
+    )
+    op.create_index(
+        'ix_chat_conversations_a_time',
+        'chat_conversations',
+        ['user_a_id', 'last_message_time', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_chat_conversations_b_time',
+        'chat_conversations',
+        ['user_b_id', 'last_message_time', 'id'],
+        unique=False,
+    )
+
+    # Backfill: pair ordering must match Python's str comparison, hence COLLATE "C"
+    op.execute(
+        """
+        WITH pairs AS (
+            SELECT m.*,
+                   LEAST(m.sender_id COLLATE "C", m.receiver_id COLLATE "C") AS user_a_id,
+                   GREATEST(m.sender_id COLLATE "C", m.receiver_id COLLATE "C") AS user_b_id
+            FROM chat_messages m
+        ),
+        last_messages AS (
+            SELECT DISTINCT ON (user_a_id, user_b_id)
+                   user_a_id, user_b_id, id, message, created_at, sender_id
+            FROM pairs
+            ORDER BY user_a_id, user_b_id, created_at DESC, id DESC
+        ),
+        unread AS (
+            SELECT user_a_id, user_b_id,
+                   count(*) FILTER (WHERE NOT is_read AND receiver_id = user_a_id) AS unread_a,
+                   count(*) FILTER (WHERE NOT is_read AND receiver_id = user_b_id) AS unread_b
+            FROM pairs
+            GROUP BY user_a_id, user_b_id
+        )
+        INSERT INTO chat_conversations (
+            id, user_a_id, user_b_id, last_message_id, last_message, last_message_time,
+            last_sender_id, unread_a, unread_b, updated_at
+        )
+        SELECT gen_random_uuid()::text, l.user_a_id, l.user_b_id, l.id, l.message, l.created_at,
+               l.sender_id, u.unread_a, u.unread_b, now()
+        FROM last_messages l
+        JOIN unread u USING (user_a_id, user_b_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop chat conversation summary."""
+    op.drop_index('ix_chat_conversations_b_time', table_name='chat_conversations')
+    op.drop_index('ix_chat_conversations_a_time', table_name='chat_conversations')
+    op.drop_table('chat_conversations')
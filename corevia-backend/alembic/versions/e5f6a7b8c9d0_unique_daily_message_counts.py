@@ -0,0 +1,56 @@
+"""unique_daily_message_counts
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """One counter row per (user_id, date) — target of the atomic quota upsert."""
+    # Merge duplicate rows left by the old read-modify-write counter
+    op.execute(
+        """
+        WITH totals AS (
+            SELECT user_id, date, min(id) AS keep_id, sum(count) AS total
+            FROM daily_message_counts
+            GROUP BY user_id, date
+            HAVING count(*) > 1
+        )
+        UPDATE daily_message_counts d
+        SET count = totals.total
+        FROM totals
+        WHERE d.id = totals.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM daily_message_counts d
+        USING (
+            SELECT user_id, date, min(id) AS keep_id
+            FROM daily_message_counts
+            GROUP BY user_id, date
+            HAVING count(*) > 1
+        ) dup
+        WHERE d.user_id = dup.user_id AND d.date = dup.date AND d.id <> dup.keep_id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_daily_message_counts_user_date', 'daily_message_counts', ['user_id', 'date']
+    )
+
+
+def downgrade() -> None:
+    """Drop unique daily counter constraint."""
+    op.drop_constraint('uq_daily_message_counts_user_date', 'daily_message_counts', type_='unique')
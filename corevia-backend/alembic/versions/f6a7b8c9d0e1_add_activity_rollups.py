@@ -0,0 +1,66 @@
+"""add_activity_rollups
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Retention / DAU-WAU-MAU rollup tables + created_at indexes for the daily activity scan."""
+    op.create_table(
+        'user_activity_days',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'day'),
+    )
+    op.create_index('ix_user_activity_days_day', 'user_activity_days', ['day'], unique=False)
+
+    op.create_table(
+        'activity_daily_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('dau', sa.Integer(), nullable=False),
+        sa.Column('wau', sa.Integer(), nullable=False),
+        sa.Column('mau', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('day'),
+    )
+
+    op.create_table(
+        'cohort_retention',
+        sa.Column('cohort_start', sa.Date(), nullable=False),
+        sa.Column('period_type', sa.String(length=10), nullable=False),
+        sa.Column('period_index', sa.Integer(), nullable=False),
+        sa.Column('cohort_size', sa.Integer(), nullable=False),
+        sa.Column('active_users', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('cohort_start', 'period_type', 'period_index'),
+    )
+
+    op.create_index('ix_workouts_created_at', 'workouts', ['created_at'], unique=False)
+    op.create_index('ix_food_entries_created_at', 'food_entries', ['created_at'], unique=False)
+    op.create_index('ix_chat_messages_created_at', 'chat_messages', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop activity rollups."""
+    op.drop_index('ix_chat_messages_created_at', table_name='chat_messages')
+    op.drop_index('ix_food_entries_created_at', table_name='food_entries')
+    op.drop_index('ix_workouts_created_at', table_name='workouts')
+    op.drop_table('cohort_retention')
+    op.drop_table('activity_daily_rollups')
+    op.drop_index('ix_user_activity_days_day', table_name='user_activity_days')
+    op.drop_table('user_activity_days')
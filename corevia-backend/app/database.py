@@ -1,13 +1,237 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
+from app.utils.shared_cache import shared_cache
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+# ── Pool metrikləri ───────────────────────────────────────────────────────
+# Checkout gözləmə müddəti və istifadədə olan bağlantı sayı — yük altında
+# pool_size / max_overflow dəyərlərini ölçmək üçün.
+
+class PoolMetrics:
+    """Pool checkout gözləmə statistikası (son N checkout üzrə p50/p95)."""
+
+    def __init__(self, window: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait += seconds
+        self.max_wait = max(self.max_wait, seconds)
+        self._recent.append(seconds)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        recent = sorted(self._recent)
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+        def percentile(p: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(len(recent) * p))]
+
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_p50_ms": round(percentile(0.50) * 1000, 3),
+            "wait_p95_ms": round(percentile(0.95) * 1000, 3),
+            "wait_max_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool + checkout gözləmə müddətinin ölçülməsi."""
+
+    metrics: PoolMetrics = pool_metrics
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def _engine_kwargs(database_url: str) -> dict:
+    """Pool və asyncpg parametrləri — sqlite (testlər) üçün default-lar saxlanılır."""
+    kwargs: dict = {"echo": settings.db_echo}
+    if database_url.startswith("sqlite"):
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if database_url.startswith("postgresql+asyncpg"):
+        server_settings = {"application_name": settings.app_name}
+        if settings.db_statement_timeout_ms > 0:
+            server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+        kwargs["connect_args"] = {
+            "server_settings": server_settings,
+            # SQLAlchemy asyncpg dialektinin prepared statement LRU keşi (bağlantı başına)
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        }
+    return kwargs
+
+
+engine = create_async_engine(settings.database_url, **_engine_kwargs(settings.database_url))
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Read-only sessiyalar — PostgreSQL-də "BEGIN READ ONLY" (əlavə round-trip yoxdur)
+_readonly_engine = (
+    engine.execution_options(postgresql_readonly=True)
+    if settings.database_url.startswith("postgresql+asyncpg")
+    else engine
+)
+readonly_session = async_sessionmaker(_readonly_engine, class_=AsyncSession, expire_on_commit=False)
+
+# ── Read replica (opsional) ───────────────────────────────────────────────
+# database_replica_url boşdursa bütün oxumalar primary-yə (read-only) gedir.
+replica_engine = None
+if settings.database_replica_url:
+    replica_engine = create_async_engine(
+        settings.database_replica_url, **_engine_kwargs(settings.database_replica_url)
+    )
+    if isinstance(replica_engine.pool, InstrumentedAsyncPool):
+        replica_engine.pool.metrics = replica_pool_metrics
+
+
+# ── Read-your-writes ──────────────────────────────────────────────────────
+# İstifadəçi öz yazısından sonra qısa müddət (replica lag pəncərəsi) ərzində
+# replica-dan köhnə data görməsin deyə onun oxumaları primary-yə yönləndirilir.
+# Marker shared_cache-dədir (cache_backend=redis ilə bütün worker-lər görür):
+# yazı bir worker-də, növbəti oxuma başqasında ola bilər.
+
+# Cari sorğunun user id-si — get_auth_user tərəfindən təyin olunur
+request_user_id: ContextVar[str | None] = ContextVar("request_user_id", default=None)
+
+RECENT_WRITE_KEY_PREFIX = "recent_write:"
+
+
+class RecentWriteTracker:
+    """user_id -> son commit: prosesdaxili + shared_cache-də window saniyəlik marker."""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._writes: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def mark(self, user_id: str) -> None:
+        now = time.monotonic()
+        self._writes[user_id] = now
+        if len(self._writes) > 10000:
+            cutoff = now - self.window_seconds
+            self._writes = {uid: t for uid, t in self._writes.items() if t > cutoff}
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # sinxron skriptlər — yalnız prosesdaxili marker
+        task = loop.create_task(self._mark_shared(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _mark_shared(self, user_id: str) -> None:
+        try:
+            await shared_cache.set(RECENT_WRITE_KEY_PREFIX + user_id, 1, self.window_seconds)
+        except Exception as e:
+            logger.error(f"Recent write marker xətası: {e}")
+
+    def is_recent_local(self, user_id: str | None) -> bool:
+        if user_id is None:
+            return False
+        written_at = self._writes.get(user_id)
+        return written_at is not None and time.monotonic() - written_at < self.window_seconds
+
+    async def is_recent(self, user_id: str | None) -> bool:
+        if user_id is None:
+            return False
+        if self.is_recent_local(user_id):
+            return True
+        try:
+            return await shared_cache.get(RECENT_WRITE_KEY_PREFIX + user_id) is not None
+        except Exception as e:
+            logger.error(f"Recent write marker xətası: {e}")
+            return True  # bilinmirsə primary-dən oxu
+
+
+recent_writes = RecentWriteTracker(settings.replica_read_your_writes_seconds)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_session_write(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_user_write(session: Session) -> None:
+    if session.info.pop("has_writes", False):
+        user_id = request_user_id.get()
+        if user_id is not None:
+            recent_writes.mark(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_session_write(session: Session) -> None:
+    session.info.pop("has_writes", None)
+
+
+class ReadRoutingSession(Session):
+    """Bind-i ilk sorğuda seçir: replica, və ya user yaxında yazıbsa primary (read-only).
+
+    get_read_db seçimi shared marker-ə görə əvvəlcədən edir (info["read_bind"]);
+    qalan hallarda yalnız prosesdaxili marker yoxlanılır.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        bind = self.info.get("read_bind")
+        if bind is None:
+            use_replica = replica_engine is not None and not recent_writes.is_recent_local(
+                request_user_id.get()
+            )
+            bind = (replica_engine if use_replica else _readonly_engine).sync_engine
+            self.info["read_bind"] = bind
+        return bind
+
+
+read_session = async_sessionmaker(
+    class_=AsyncSession, sync_session_class=ReadRoutingSession, expire_on_commit=False
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -23,3 +247,48 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_readonly_db() -> AsyncSession:
+    """Yalnız oxuyan GET endpoint-ləri üçün: commit edilmir, close() tranzaksiyanı bağlayır."""
+    async with readonly_session() as session:
+        yield session
+
+
+async def get_read_db() -> AsyncSession:
+    """Oxuma-ağır GET endpoint-ləri üçün: replica varsa ora yönləndirilir.
+
+    Read-only sessiyadır (commit yoxdur). İstifadəçi son
+    replica_read_your_writes_seconds ərzində yazıbsa primary-dən oxuyur.
+    """
+    async with read_session() as session:
+        if replica_engine is not None:
+            # User dependency-ləri (get_auth_user) db-dən əvvəl elan olunur — user id artıq məlumdur
+            use_replica = not await recent_writes.is_recent(request_user_id.get())
+            session.sync_session.info["read_bind"] = (
+                replica_engine if use_replica else _readonly_engine
+            ).sync_engine
+        yield session
+
+
+def _engine_pool_status(target_engine, metrics: PoolMetrics) -> dict:
+    pool = target_engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            max_overflow=settings.db_max_overflow,
+        )
+    status.update(metrics.snapshot())
+    return status
+
+
+def get_pool_status() -> dict:
+    """Hazırkı pool vəziyyəti + checkout gözləmə metrikləri."""
+    status = _engine_pool_status(engine, pool_metrics)
+    if replica_engine is not None:
+        status["replica"] = _engine_pool_status(replica_engine, replica_pool_metrics)
+    return status
@@ -2,7 +2,6 @@ import logging
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.config import get_settings
 from app.routers import (
     auth, users, workouts, food, plans, uploads, admin, ai,
@@ -50,6 +49,7 @@ from app.middleware.security import (
     RequestLoggingMiddleware,
     InputSanitizationMiddleware,
 )
+from app.middleware.uploads import UploadStaticFiles, UploadsFastPathMiddleware
 
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
@@ -104,7 +104,14 @@ app.include_router(payment.router)
 # ── Static files ──────────────────────────────────────────────────────────
 uploads_dir = Path(__file__).parent.parent / "uploads"
 uploads_dir.mkdir(exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+uploads_static = UploadStaticFiles(
+    directory=str(uploads_dir),
+    max_age=settings.uploads_cache_max_age,
+    accel_redirect_prefix=settings.uploads_accel_redirect_prefix,
+)
+app.mount("/uploads", uploads_static, name="uploads")
+# Ən xarici middleware — şəkil sorğuları BaseHTTPMiddleware qatlarından keçmir
+app.add_middleware(UploadsFastPathMiddleware, static_app=uploads_static, path="/uploads")
 
 
 @app.on_event("startup")
@@ -127,6 +134,12 @@ async def shutdown_event():
     from app.services.scheduler_service import scheduler
     scheduler.shutdown(wait=False)
 
+    from app.services.chat_pubsub import chat_broker
+    await chat_broker.close()
+
+    from app.utils.shared_cache import shared_cache
+    await shared_cache.close()
+
 
 @app.get("/")
 async def root():
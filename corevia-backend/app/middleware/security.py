@@ -318,3 +318,6 @@ otp_rate_limiter = EndpointRateLimiter(max_calls=3, window_seconds=300, identifi
 
 # 15 dəq ərzində maks 3 şifrə sıfırlama sorğusu
 password_reset_rate_limiter = EndpointRateLimiter(max_calls=3, window_seconds=900, identifier="pwd_reset")
+
+# 10 dəq ərzində maks 2 xəbər yeniləmə sorğusu (IP üzrə; qlobal cooldown servisdədir)
+news_refresh_rate_limiter = EndpointRateLimiter(max_calls=2, window_seconds=600, identifier="news_refresh")
@@ -0,0 +1,110 @@
+"""
+Upload Serving - /uploads üçün sürətli statik fayl yolu
+
+Yüklənmiş şəkillərin adları UUID-dir və fayl heç vaxt yerində dəyişdirilmir,
+ona görə də cavablar "immutable" kimi keşlənə bilər. Bu modul:
+
+- güclü ETag, Last-Modified, If-None-Match / If-Modified-Since (304)
+- Range sorğuları (206) və server dəstəkləyirsə pathsend (zero-copy)
+- uzunmüddətli `Cache-Control: public, max-age=..., immutable`
+- opsional X-Accel-Redirect rejimi (nginx faylı özü göndərir)
+
+təmin edir və /uploads sorğularını BaseHTTPMiddleware zəncirindən keçirmədən
+birbaşa StaticFiles-a yönləndirir.
+"""
+
+import os
+from pathlib import Path
+from urllib.parse import quote
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.routing import Match, Mount
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class UploadStaticFiles(StaticFiles):
+    """StaticFiles + immutable cache headerləri + opsional X-Accel-Redirect."""
+
+    def __init__(
+        self,
+        *,
+        directory: str | Path,
+        max_age: int = 31536000,
+        accel_redirect_prefix: str = "",
+    ) -> None:
+        super().__init__(directory=directory)
+        self.accel_redirect_prefix = accel_redirect_prefix.rstrip("/")
+        self.cache_headers = {
+            "Cache-Control": f"public, max-age={max_age}, immutable",
+            "X-Content-Type-Options": "nosniff",
+        }
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if self.accel_redirect_prefix:
+            return self._accel_redirect_response(full_path, status_code)
+
+        request_headers = Headers(scope=scope)
+
+        # FileResponse ETag/Last-Modified/Accept-Ranges və Range (206) işini özü görür
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers=self.cache_headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _accel_redirect_response(
+        self, full_path: str | os.PathLike[str], status_code: int
+    ) -> Response:
+        """Faylı nginx-in internal location-u ilə göndər (conditional/range orada)."""
+        relative = os.path.relpath(full_path, os.path.realpath(self.directory))
+        target = f"{self.accel_redirect_prefix}/{quote(Path(relative).as_posix())}"
+        headers = {**self.cache_headers, "X-Accel-Redirect": target}
+        # Content-Type nginx tərəfindən faylın uzantısına görə təyin olunur
+        return Response(status_code=status_code, headers=headers)
+
+
+class UploadsFastPathMiddleware:
+    """
+    Pure ASGI middleware — /uploads sorğularını digər middleware-lərdən əvvəl tutur.
+
+    Ən sonda `add_middleware` ilə əlavə olunmalıdır ki, stack-də ən xaricdə olsun.
+    Şəkil baytları beləliklə RateLimit/Logging/InputSanitization kimi
+    BaseHTTPMiddleware qatlarından keçmir. Path traversal qorunması
+    StaticFiles.lookup_path-dadır.
+    """
+
+    def __init__(self, app: ASGIApp, static_app: StaticFiles, path: str = "/uploads") -> None:
+        self.app = app
+        self.mount = Mount(path, app=static_app)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            match, child_scope = self.mount.matches(scope)
+            if match == Match.FULL:
+                await self._serve({**scope, **child_scope}, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+    async def _serve(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.mount.app(scope, receive, send)
+        except HTTPException as exc:
+            # ExceptionMiddleware-dən kənardayıq — 404/405 cavabını özümüz qaytarırıq
+            response = PlainTextResponse(
+                exc.detail, status_code=exc.status_code, headers=exc.headers
+            )
+            await response(scope, receive, send)
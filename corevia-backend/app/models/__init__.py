@@ -8,7 +8,7 @@ from app.models.route import Route
 from app.models.notification import DeviceToken, Notification
 from app.models.subscription import Subscription
 from app.models.review import Review
-from app.models.chat import ChatMessage, DailyMessageCount
+from app.models.chat import ChatMessage, DailyMessageCount, ChatConversationSummary
 from app.models.content import TrainerContent, ContentType
 from app.models.onboarding import UserOnboarding
 from app.models.otp import OTPCode
@@ -19,7 +19,10 @@ from app.models.live_session import (
     ParticipantExercise, SessionStats, PoseDetectionLog,
 )
 from app.models.marketplace import MarketplaceProduct, ProductPurchase, ProductReview, ProductType
-from app.models.analytics import DailyStats, WeeklyStats, BodyMeasurement
+from app.models.analytics import (
+    DailyStats, WeeklyStats, BodyMeasurement,
+    UserActivityDay, ActivityRollup, CohortRetention,
+)
 from app.models.daily_survey import DailySurvey
 from app.models.payment import Payment
 
@@ -34,7 +37,7 @@ __all__ = [
     "DeviceToken", "Notification",
     "Subscription",
     "Review",
-    "ChatMessage", "DailyMessageCount",
+    "ChatMessage", "DailyMessageCount", "ChatConversationSummary",
     "TrainerContent", "ContentType",
     "UserOnboarding",
     "OTPCode",
@@ -44,6 +47,7 @@ __all__ = [
     "ParticipantExercise", "SessionStats", "PoseDetectionLog",
     "MarketplaceProduct", "ProductPurchase", "ProductReview", "ProductType",
     "DailyStats", "WeeklyStats", "BodyMeasurement",
+    "UserActivityDay", "ActivityRollup", "CohortRetention",
     "DailySurvey",
     "Payment",
 ]
@@ -97,5 +97,41 @@ class BodyMeasurement(Base):
     user: Mapped["User"] = relationship("User")
 
 
+
+# ============================================================
+# Platform analytics (admin) — retention / MAU rollups
+# ============================================================
+
+class UserActivityDay(Base):
+    """One row per user per day with any activity (workout, food entry, post, chat message)"""
+    __tablename__ = "user_activity_days"
+
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True, index=True)
+
+
+class ActivityRollup(Base):
+    """Daily / weekly / monthly active users as of a given day"""
+    __tablename__ = "activity_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    dau: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    wau: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    mau: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class CohortRetention(Base):
+    """Signup cohort (week / month) x period offset -> cohort size and active users"""
+    __tablename__ = "cohort_retention"
+
+    cohort_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    period_type: Mapped[str] = mapped_column(String(10), primary_key=True)  # week, month
+    period_index: Mapped[int] = mapped_column(Integer, primary_key=True)  # 0 = signup period
+    cohort_size: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    active_users: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 # Import to avoid circular imports
 from app.models.user import User
@@ -1,19 +1,23 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Sohbet tarixcesi: (sender, receiver) uzre created_at DESC keyset pagination
+        Index("ix_chat_messages_pair_created", "sender_id", "receiver_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     sender_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
     receiver_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
     sender: Mapped["User"] = relationship("User", foreign_keys=[sender_id])
     receiver: Mapped["User"] = relationship("User", foreign_keys=[receiver_id])
@@ -21,8 +25,39 @@ class ChatMessage(Base):
 
 class DailyMessageCount(Base):
     __tablename__ = "daily_message_counts"
+    __table_args__ = (
+        # Gunluk limit tek atomik upsert ile artirilir (ON CONFLICT hedefi)
+        UniqueConstraint("user_id", "date", name="uq_daily_message_counts_user_date"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
     date: Mapped[str] = mapped_column(String(10), nullable=False)  # YYYY-MM-DD
     count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ChatConversationSummary(Base):
+    """Her (user_a, user_b) cutu ucun bir setir — inbox bu cedvelden oxunur.
+
+    user_a_id < user_b_id (cut siralanmis saxlanilir); unread_a/unread_b
+    muvafiq terefin oxumadigi mesaj sayidir.
+    """
+
+    __tablename__ = "chat_conversations"
+    __table_args__ = (
+        UniqueConstraint("user_a_id", "user_b_id", name="uq_chat_conversations_pair"),
+        # Inbox: her teref uzre last_message_time DESC keyset pagination
+        Index("ix_chat_conversations_a_time", "user_a_id", "last_message_time", "id"),
+        Index("ix_chat_conversations_b_time", "user_b_id", "last_message_time", "id"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_a_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    user_b_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    last_message_id: Mapped[str] = mapped_column(String, nullable=False)
+    last_message: Mapped[str] = mapped_column(Text, nullable=False)
+    last_message_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_sender_id: Mapped[str] = mapped_column(String, nullable=False)
+    unread_a: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    unread_b: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
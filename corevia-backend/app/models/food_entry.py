@@ -28,7 +28,7 @@ class FoodEntry(Base):
     notes: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     has_image: Mapped[bool] = mapped_column(Boolean, default=False)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
     # AI-generated fields
     ai_analyzed: Mapped[bool] = mapped_column(Boolean, default=False)
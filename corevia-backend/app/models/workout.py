@@ -25,7 +25,7 @@ class Workout(Base):
     notes: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
     # Location fields (for running/cycling)
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -1,17 +1,14 @@
 from pathlib import Path
-from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
-from app.database import get_db
+from app.database import get_db, get_pool_status
 from app.models.user import User, UserType, VerificationStatus
-from app.models.subscription import Subscription
-from app.models.review import Review
-from app.models.chat import ChatMessage
 from app.schemas.user import UserResponse, TrainerListResponse
 from app.utils.security import get_current_user
+from app.services.admin_stats_service import admin_stats_snapshot
 
 router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 
@@ -108,110 +105,56 @@ async def get_all_trainers(
 
 
 @router.get("/stats")
-async def get_admin_stats(
-    admin: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db),
-):
-    total_users = await db.execute(select(func.count(User.id)))
-    total_clients = await db.execute(select(func.count(User.id)).where(User.user_type == UserType.client))
-    total_trainers = await db.execute(select(func.count(User.id)).where(User.user_type == UserType.trainer))
-    pending_trainers = await db.execute(
-        select(func.count(User.id)).where(
-            User.user_type == UserType.trainer,
-            User.verification_status == VerificationStatus.pending,
-        )
-    )
-    verified_trainers = await db.execute(
-        select(func.count(User.id)).where(
-            User.user_type == UserType.trainer,
-            User.verification_status == VerificationStatus.verified,
-        )
-    )
-    premium_users = await db.execute(
-        select(func.count(User.id)).where(User.is_premium == True)
-    )
-    active_subs = await db.execute(
-        select(func.count(Subscription.id)).where(Subscription.is_active == True)
-    )
-    total_reviews = await db.execute(select(func.count(Review.id)))
-    total_messages = await db.execute(select(func.count(ChatMessage.id)))
+async def get_admin_stats(admin: User = Depends(require_admin)):
+    """Umumi saylar — snapshot-dan (admin_stats_refresh_seconds-da bir yenilenir)."""
+    snapshot = await admin_stats_snapshot.get()
+    return {**snapshot.stats, "generated_at": snapshot.generated_at}
 
-    # Son 7 gun qeydiyyat
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    new_users_week = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= week_ago)
-    )
 
-    # Son 30 gun qeydiyyat
-    month_ago = datetime.utcnow() - timedelta(days=30)
-    new_users_month = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= month_ago)
-    )
-
-    return {
-        "total_users": total_users.scalar(),
-        "total_clients": total_clients.scalar(),
-        "total_trainers": total_trainers.scalar(),
-        "verified_trainers": verified_trainers.scalar(),
-        "pending_verifications": pending_trainers.scalar(),
-        "premium_users": premium_users.scalar(),
-        "active_subscriptions": active_subs.scalar(),
-        "total_reviews": total_reviews.scalar(),
-        "total_messages": total_messages.scalar(),
-        "new_users_this_week": new_users_week.scalar(),
-        "new_users_this_month": new_users_month.scalar(),
-    }
+def _trend(current: float, previous: float | None) -> str:
+    if previous is None or current == previous:
+        return "stable"
+    return "up" if current > previous else "down"
 
 
 @router.get("/metrics")
-async def get_metrics(
-    admin: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db),
-):
-    """MAU, retention, growth metrikleri (demo data + real data mix)."""
-    now = datetime.utcnow()
-
-    # Son 6 ay ucun ayliq qeydiyyat
-    monthly_signups = []
-    for i in range(5, -1, -1):
-        month_start = (now.replace(day=1) - timedelta(days=30 * i)).replace(day=1)
-        if i > 0:
-            month_end = (now.replace(day=1) - timedelta(days=30 * (i - 1))).replace(day=1)
-        else:
-            month_end = now
-
-        count_result = await db.execute(
-            select(func.count(User.id)).where(
-                User.created_at >= month_start,
-                User.created_at < month_end,
-            )
-        )
-        count = count_result.scalar() or 0
-        monthly_signups.append({
-            "month": month_start.strftime("%b %Y"),
-            "signups": count,
-        })
-
-    # Premium conversion rate
-    total = (await db.execute(select(func.count(User.id)))).scalar() or 1
-    premium = (await db.execute(select(func.count(User.id)).where(User.is_premium == True))).scalar() or 0
+async def get_metrics(admin: User = Depends(require_admin)):
+    """MAU, retention, growth metrikleri — cohort rollup-larindan (gunluk job)."""
+    snapshot = await admin_stats_snapshot.get()
+    total = snapshot.stats["total_users"] or 1
+    premium = snapshot.stats["premium_users"]
+    premium_rate = round((premium / total) * 100, 1)
+
+    active = snapshot.active_users
+    mau, previous_mau = active["mau"], active["mau_30d_ago"]
+    growth = round((mau - previous_mau) / previous_mau * 100) if previous_mau else 0
+    stickiness = round(active["dau"] / mau * 100, 1) if mau else 0
+    rating = snapshot.stats["avg_review_rating"]
 
     return {
-        "monthly_signups": monthly_signups,
-        "mau_estimate": total,
-        "premium_conversion_rate": round((premium / total) * 100, 1) if total > 0 else 0,
-        "retention_data": [
-            {"period": "Week 1", "rate": 85},
-            {"period": "Week 2", "rate": 72},
-            {"period": "Week 3", "rate": 65},
-            {"period": "Week 4", "rate": 58},
-            {"period": "Month 2", "rate": 45},
-            {"period": "Month 3", "rate": 38},
-        ],
+        "monthly_signups": snapshot.monthly_signups,
+        "mau_estimate": mau,
+        "dau": active["dau"],
+        "wau": active["wau"],
+        "mau": mau,
+        "activity_as_of": active["as_of"],
+        "premium_conversion_rate": premium_rate,
+        "retention_data": snapshot.retention,
         "growth_data": [
-            {"metric": "User Growth", "value": "+24%", "trend": "up"},
-            {"metric": "Premium Conv.", "value": f"{round((premium / total) * 100, 1)}%", "trend": "up"},
-            {"metric": "Avg. Session", "value": "12 min", "trend": "up"},
-            {"metric": "Trainer Satisfaction", "value": "4.6/5", "trend": "stable"},
+            {"metric": "User Growth (MAU)", "value": f"{growth:+d}%", "trend": _trend(mau, previous_mau)},
+            {"metric": "Premium Conv.", "value": f"{premium_rate}%", "trend": "stable"},
+            {"metric": "Stickiness (DAU/MAU)", "value": f"{stickiness}%", "trend": "stable"},
+            {
+                "metric": "Trainer Satisfaction",
+                "value": f"{rating}/5" if rating is not None else "-",
+                "trend": "stable",
+            },
         ],
+        "generated_at": snapshot.generated_at,
     }
+
+
+@router.get("/db-pool")
+async def get_db_pool_status(admin: User = Depends(require_admin)):
+    """DB connection pool: istifadədə olan bağlantılar və checkout gözləmə müddəti."""
+    return get_pool_status()
@@ -8,12 +8,11 @@ from app.models.user import User
 from app.models.workout import Workout
 from app.models.food_entry import FoodEntry, MealType
 from app.models.daily_survey import DailySurvey
-from app.models.training_plan import TrainingPlan
-from app.models.meal_plan import MealPlan
 from app.schemas.food import FoodEntryResponse
-from app.utils.security import get_current_user, get_premium_user
+from app.utils.security import AuthUser, get_current_user, get_premium_auth_user
 from app.services.ai_service import analyze_food_image, get_user_recommendations
 from app.services.file_service import save_upload
+from app.services.student_metrics_service import get_student_metrics
 
 router = APIRouter(prefix="/api/v1/ai", tags=["AI"])
 
@@ -25,7 +24,7 @@ router = APIRouter(prefix="/api/v1/ai", tags=["AI"])
 @router.post("/analyze-food")
 async def analyze_food(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_premium_user),
+    current_user: AuthUser = Depends(get_premium_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Sekili upload et, AI ile analiz et — Premium lazimdir"""
@@ -42,7 +41,7 @@ async def analyze_food(
 @router.post("/analyze-and-save", response_model=FoodEntryResponse)
 async def analyze_and_save(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_premium_user),
+    current_user: AuthUser = Depends(get_premium_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Sekili upload et, AI analiz et, saxla — Premium lazimdir"""
@@ -279,49 +278,18 @@ async def _build_students_data(
     if not students:
         return []
 
+    # Butun telebeler ucun saylar bir defe (sabit sayda GROUP BY sorgusu)
+    metrics = await get_student_metrics(db, [student.id for student in students], week_ago)
+
     students_data = []
     for student in students:
-        # Bu heftenin mesqleri
-        wk_result = await db.execute(
-            select(func.count(Workout.id)).where(
-                Workout.user_id == student.id,
-                Workout.date >= week_ago,
-            )
-        )
-        week_workouts = wk_result.scalar() or 0
-
-        # Umumi mesq sayi
-        total_wk_result = await db.execute(
-            select(func.count(Workout.id)).where(
-                Workout.user_id == student.id,
-            )
-        )
-        total_workouts = total_wk_result.scalar() or 0
-
-        # Teyin olunmus training plan sayi
-        tp_result = await db.execute(
-            select(func.count(TrainingPlan.id)).where(
-                TrainingPlan.assigned_student_id == student.id,
-                TrainingPlan.is_completed == False,
-            )
-        )
-        training_plans_count = tp_result.scalar() or 0
-
-        # Teyin olunmus meal plan sayi
-        mp_result = await db.execute(
-            select(func.count(MealPlan.id)).where(
-                MealPlan.assigned_student_id == student.id,
-                MealPlan.is_completed == False,
-            )
-        )
-        meal_plans_count = mp_result.scalar() or 0
-
+        m = metrics[student.id]
         students_data.append({
             "name": student.name or "Tələbə",
-            "this_week_workouts": week_workouts,
-            "total_workouts": total_workouts,
-            "training_plans_count": training_plans_count,
-            "meal_plans_count": meal_plans_count,
+            "this_week_workouts": m.week_workouts,
+            "total_workouts": m.total_workouts,
+            "training_plans_count": m.active_training_plans,
+            "meal_plans_count": m.active_meal_plans,
             "weight": student.weight,
             "goal": student.goal,
         })
@@ -10,8 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, desc
 from typing import Optional
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_read_db
 from app.models.analytics import DailyStats, WeeklyStats, BodyMeasurement
 from app.models.workout import Workout
 from app.models.food_entry import FoodEntry
@@ -27,11 +26,12 @@ from app.schemas.analytics import (
     ComparisonPeriod,
     ProgressComparisonResponse,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
+from app.utils.responses import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"])
+router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"], default_response_class=FastJSONResponse)
 
 
 # ============================================================
@@ -106,8 +106,8 @@ async def calculate_daily_stats(user_id: str, target_date: date, db: AsyncSessio
 @router.get("/daily/{date}", response_model=DailyStatsResponse)
 async def get_daily_stats(
     date: date,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get daily statistics for specific date
@@ -119,8 +119,8 @@ async def get_daily_stats(
 @router.get("/weekly", response_model=list[DailyStatsResponse])
 async def get_weekly_stats(
     start_date: Optional[date] = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get daily stats for a week (7 days) - OWASP A01"""
     if start_date is None:
@@ -142,7 +142,7 @@ async def get_weekly_stats(
 @router.post("/measurements", response_model=BodyMeasurementResponse, status_code=status.HTTP_201_CREATED)
 async def create_body_measurement(
     measurement_data: BodyMeasurementCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -176,8 +176,8 @@ async def create_body_measurement(
 async def get_body_measurements(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get body measurements - OWASP A01"""
     query = select(BodyMeasurement).where(BodyMeasurement.user_id == current_user.id)
@@ -198,7 +198,7 @@ async def get_body_measurements(
 @router.delete("/measurements/{measurement_id}")
 async def delete_body_measurement(
     measurement_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete body measurement - OWASP A01 Ownership check"""
@@ -229,8 +229,8 @@ async def delete_body_measurement(
 
 @router.get("/dashboard", response_model=AnalyticsDashboardResponse)
 async def get_analytics_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Complete analytics dashboard
@@ -333,7 +333,7 @@ async def get_analytics_dashboard(
         else:
             break  # Streak broken
 
-    return AnalyticsDashboardResponse(
+    response = AnalyticsDashboardResponse(
         current_week=current_week,
         weight_trend=weight_trend,
         workout_trend=workout_trend,
@@ -344,6 +344,8 @@ async def get_analytics_dashboard(
         avg_daily_calories=avg_daily_calories,
         workout_streak_days=workout_streak,
     )
+    # Hazır sxem — response_model təkrar validasiyası olmadan birbaşa JSON
+    return FastJSONResponse(response)
 
 
 # ============================================================
@@ -353,8 +355,8 @@ async def get_analytics_dashboard(
 @router.get("/comparison", response_model=ProgressComparisonResponse)
 async def get_progress_comparison(
     period: str = "week",  # week, month
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Compare current period with previous period
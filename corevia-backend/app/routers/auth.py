@@ -13,8 +13,9 @@ from app.models.settings import UserSettings
 from app.schemas.user import UserRegister, RegisterRequestOTP, UserLogin, LoginVerifyOTP, Token, TokenRefresh, UserResponse, TrainerVerificationResponse
 from app.schemas.password_reset import ForgotPasswordRequest, VerifyOTPRequest, ResetPasswordRequest, OTPResponse, ChangePasswordRequest, DeleteAccountRequest
 from app.utils.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     get_current_user,
@@ -109,7 +110,7 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
     new_user = User(
         name=user_data.name,
         email=user_data.email,
-        hashed_password=hash_password(user_data.password),
+        hashed_password=await hash_password_async(user_data.password),
         user_type=user_data.user_type,
         verification_status=VerificationStatus.verified,
     )
@@ -141,7 +142,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == user_data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    if not user or not await verify_password_async(user_data.password, user.hashed_password):
         logger.warning(f"Failed login attempt for: {user_data.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -149,6 +150,11 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # bcrypt cost dəyişibsə, düz parol əlimizdə ikən yeni cost ilə yenidən hash-lə
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(user_data.password)
+        logger.info(f"Password rehashed with updated bcrypt cost for user: {user.id}")
+
     # User type yoxlaması — tələbə müəllim kimi daxil ola bilməz və əksinə
     if user.user_type != user_data.user_type:
         actual = "Tələbə" if user.user_type == UserType.client else "Məşqçi"
@@ -496,7 +502,7 @@ async def reset_password(
         )
 
     # Update password
-    user.hashed_password = hash_password(request.new_password)
+    user.hashed_password = await hash_password_async(request.new_password)
     await db.commit()
 
     logger.info(f"Password reset successful for user: {user.id}")
@@ -524,13 +530,13 @@ async def change_password(
     2. Yeni şifrə set olunur
     """
 
-    if not verify_password(request.current_password, current_user.hashed_password):
+    if not await verify_password_async(request.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cari şifrə səhvdir"
         )
 
-    current_user.hashed_password = hash_password(request.new_password)
+    current_user.hashed_password = await hash_password_async(request.new_password)
     await db.commit()
 
     logger.info(f"Password changed for user: {current_user.id}")
@@ -563,7 +569,7 @@ async def delete_account(
 
     # Model imports
     from app.models.social import Post, PostLike, PostComment, Follow, Achievement
-    from app.models.analytics import DailyStats, WeeklyStats, BodyMeasurement
+    from app.models.analytics import DailyStats, WeeklyStats, BodyMeasurement, UserActivityDay
     from app.models.daily_survey import DailySurvey
     from app.models.live_session import (
         LiveSession, SessionParticipant, SessionExercise,
@@ -571,7 +577,7 @@ async def delete_account(
     )
     from app.models.notification import Notification, DeviceToken
     from app.models.subscription import Subscription
-    from app.models.chat import ChatMessage, DailyMessageCount
+    from app.models.chat import ChatMessage, DailyMessageCount, ChatConversationSummary
     from app.models.review import Review
     from app.models.content import TrainerContent
     from app.models.route import Route
@@ -582,7 +588,7 @@ async def delete_account(
     from app.models.training_plan import TrainingPlan, PlanWorkout
     from app.models.meal_plan import MealPlan, MealPlanItem
 
-    if not verify_password(request.password, current_user.hashed_password):
+    if not await verify_password_async(request.password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Şifrə səhvdir"
@@ -660,6 +666,7 @@ async def delete_account(
         await db.execute(delete(DailyStats).where(DailyStats.user_id == user_id))
         await db.execute(delete(WeeklyStats).where(WeeklyStats.user_id == user_id))
         await db.execute(delete(BodyMeasurement).where(BodyMeasurement.user_id == user_id))
+        await db.execute(delete(UserActivityDay).where(UserActivityDay.user_id == user_id))
 
         # ── 5. Marketplace (child → parent) ──
         await db.execute(delete(ProductReview).where(ProductReview.buyer_id == user_id))
@@ -707,6 +714,9 @@ async def delete_account(
         await db.execute(delete(ChatMessage).where(
             or_(ChatMessage.sender_id == user_id, ChatMessage.receiver_id == user_id)
         ))
+        await db.execute(delete(ChatConversationSummary).where(
+            or_(ChatConversationSummary.user_a_id == user_id, ChatConversationSummary.user_b_id == user_id)
+        ))
         await db.execute(delete(DailyMessageCount).where(DailyMessageCount.user_id == user_id))
         await db.execute(delete(Review).where(
             or_(Review.trainer_id == user_id, Review.student_id == user_id)
@@ -1,17 +1,31 @@
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_, func, desc
+from sqlalchemy import select, update, or_, and_, tuple_, union_all
+from sqlalchemy.orm import aliased
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
-from app.models.chat import ChatMessage, DailyMessageCount
-from app.schemas.chat import ChatMessageCreate, ChatMessageResponse, ChatConversation, MessageLimitResponse
-from app.utils.security import get_current_user, get_premium_user, get_premium_or_trainer
+from app.models.chat import ChatMessage
+from app.services.chat_service import (
+    record_message, decrement_unread, load_inbox, consume_message_quota, get_message_quota_used,
+)
+from app.services.chat_pubsub import chat_broker, queue_chat_event
+from app.schemas.chat import (
+    ChatMessageCreate, ChatMessageResponse, ChatHistoryPage, ChatConversation, MessageLimitResponse,
+)
+from app.utils.security import (
+    AuthUser, get_auth_user, get_premium_or_trainer, get_premium_or_trainer_auth_user,
+)
 
 router = APIRouter(prefix="/api/v1/chat", tags=["Chat"])
 
 DAILY_MESSAGE_LIMIT = 10
+HISTORY_PAGE_SIZE = 50
+HISTORY_MAX_PAGE_SIZE = 100
+INBOX_PAGE_SIZE = 50
+INBOX_MAX_PAGE_SIZE = 100
 
 
 @router.post("/send", response_model=ChatMessageResponse)
@@ -42,17 +56,8 @@ async def send_message(
             detail="Yalniz trainer-telebe arasinda mesaj gondermek olar",
         )
 
-    # Gunluk limit yoxla
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    count_result = await db.execute(
-        select(DailyMessageCount).where(
-            DailyMessageCount.user_id == current_user.id,
-            DailyMessageCount.date == today,
-        )
-    )
-    daily_count = count_result.scalar_one_or_none()
-
-    if daily_count and daily_count.count >= DAILY_MESSAGE_LIMIT:
+    # Gunluk limit — atomik artim (limit dolubsa None)
+    if await consume_message_quota(db, current_user.id, DAILY_MESSAGE_LIMIT) is None:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=f"Gunluk mesaj limitine catdiniz ({DAILY_MESSAGE_LIMIT}/gun)",
@@ -66,15 +71,12 @@ async def send_message(
     )
     db.add(chat_msg)
 
-    # Gunluk saygaci artir
-    if daily_count:
-        daily_count.count += 1
-    else:
-        db.add(DailyMessageCount(user_id=current_user.id, date=today, count=1))
-
     await db.flush()
 
-    return ChatMessageResponse(
+    # Inbox xulasesi: son mesaj + alicinin unread sayi
+    await record_message(db, chat_msg)
+
+    response = ChatMessageResponse(
         id=chat_msg.id,
         sender_id=chat_msg.sender_id,
         receiver_id=chat_msg.receiver_id,
@@ -85,35 +87,113 @@ async def send_message(
         created_at=chat_msg.created_at,
     )
 
+    # Push: alici + gonderenin diger cihazlari (commit-den sonra)
+    queue_chat_event(
+        db.sync_session,
+        [chat_msg.receiver_id, current_user.id],
+        {"type": "message", "message": response.model_dump(mode="json")},
+    )
+    return response
+
+
+def _direction_page(sender_id: str, receiver_id: str, limit: int, before: str | None):
+    """Bir istiqametde (sender -> receiver) en yeni `limit` mesaj, before cursor-dan evvel."""
+    query = select(ChatMessage).where(
+        ChatMessage.sender_id == sender_id,
+        ChatMessage.receiver_id == receiver_id,
+    )
+    if before:
+        cursor_created = (
+            select(ChatMessage.created_at).where(ChatMessage.id == before).scalar_subquery()
+        )
+        query = query.where(
+            tuple_(ChatMessage.created_at, ChatMessage.id) < tuple_(cursor_created, before)
+        )
+    return query.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(limit)
+
+
+async def _load_history_page(
+    db: AsyncSession, user_id: str, other_id: str, limit: int, before: str | None
+) -> tuple[list[ChatMessage], bool]:
+    """Iki istiqametin her biri index uzre LIMIT ile oxunur, sonra birlesdirilir —
+    sohbetin uzunlugundan asili olmayaraq sabit xerc."""
+    sent = _direction_page(user_id, other_id, limit + 1, before).subquery()
+    received = _direction_page(other_id, user_id, limit + 1, before).subquery()
+    merged = union_all(select(sent), select(received)).subquery()
+    page_msg = aliased(ChatMessage, merged)
 
-@router.get("/history/{user_id}", response_model=list[ChatMessageResponse])
-async def get_chat_history(
-    user_id: str,
-    current_user: User = Depends(get_premium_or_trainer),
-    db: AsyncSession = Depends(get_db),
-):
-    """Iki istifadeci arasinda mesaj tarixcesi."""
     result = await db.execute(
-        select(ChatMessage)
+        select(page_msg)
+        .order_by(page_msg.created_at.desc(), page_msg.id.desc())
+        .limit(limit + 1)
+    )
+    messages = list(result.scalars().all())
+    has_more = len(messages) > limit
+    return messages[:limit], has_more
+
+
+async def _mark_read_up_to(
+    db: AsyncSession, reader_id: str, sender_id: str, created_at: datetime, message_id: str
+) -> int:
+    """sender -> reader istiqametinde (created_at, id) <= verilen mesaja qeder hamisini oxunmus et."""
+    result = await db.execute(
+        update(ChatMessage)
         .where(
-            or_(
-                and_(ChatMessage.sender_id == current_user.id, ChatMessage.receiver_id == user_id),
-                and_(ChatMessage.sender_id == user_id, ChatMessage.receiver_id == current_user.id),
-            )
+            ChatMessage.sender_id == sender_id,
+            ChatMessage.receiver_id == reader_id,
+            ChatMessage.is_read == False,
+            tuple_(ChatMessage.created_at, ChatMessage.id) <= tuple_(created_at, message_id),
         )
-        .order_by(ChatMessage.created_at.asc())
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
     )
-    messages = result.scalars().all()
+    updated = result.rowcount or 0
+    if updated:
+        await decrement_unread(db, reader_id, sender_id, updated)
+        # Read receipt push: gonderen + oxuyanin diger cihazlari
+        queue_chat_event(
+            db.sync_session,
+            [sender_id, reader_id],
+            {
+                "type": "read",
+                "reader_id": reader_id,
+                "sender_id": sender_id,
+                "up_to": message_id,
+                "up_to_created_at": created_at.isoformat(),
+                "count": updated,
+            },
+        )
+    return updated
 
-    # Oxunmamis mesajlari oxunmus isaretle
-    for msg in messages:
-        if msg.receiver_id == current_user.id and not msg.is_read:
-            msg.is_read = True
+
+async def _build_history_page(
+    db: AsyncSession, current_user_id: str, other_id: str, limit: int, before: str | None
+) -> ChatHistoryPage:
+    messages, has_more = await _load_history_page(db, current_user_id, other_id, limit, before)
+
+    # Oxunmamis mesajlari bir UPDATE ile oxunmus isaretle (sehifenin en yeni mesajina qeder)
+    read_cutoff = None
+    if messages:
+        newest = messages[0]
+        if await _mark_read_up_to(db, current_user_id, other_id, newest.created_at, newest.id):
+            read_cutoff = (newest.created_at, newest.id)
+
+    # Her iki istirakci bir defe yuklenir
+    users_result = await db.execute(
+        select(User.id, User.name, User.profile_image_url).where(
+            User.id.in_([current_user_id, other_id])
+        )
+    )
+    participants = {row.id: row for row in users_result.all()}
 
     response = []
     for msg in messages:
-        sender_result = await db.execute(select(User).where(User.id == msg.sender_id))
-        sender = sender_result.scalar_one_or_none()
+        sender = participants.get(msg.sender_id)
+        is_read = msg.is_read or (
+            read_cutoff is not None
+            and msg.receiver_id == current_user_id
+            and (msg.created_at, msg.id) <= read_cutoff
+        )
         response.append(
             ChatMessageResponse(
                 id=msg.id,
@@ -122,81 +202,149 @@ async def get_chat_history(
                 sender_name=sender.name if sender else "Unknown",
                 sender_profile_image=sender.profile_image_url if sender else None,
                 message=msg.message,
-                is_read=msg.is_read,
+                is_read=is_read,
                 created_at=msg.created_at,
             )
         )
 
-    return response
+    return ChatHistoryPage(
+        messages=response,
+        has_more=has_more,
+        next_cursor=response[-1].id if has_more and response else None,
+    )
 
 
-@router.get("/conversations", response_model=list[ChatConversation])
-async def get_conversations(
-    current_user: User = Depends(get_premium_or_trainer),
+@router.get("/messages/{user_id}", response_model=ChatHistoryPage)
+async def get_chat_messages(
+    user_id: str,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    before: str | None = Query(None, description="Bu mesaj id-sinden evvelki mesajlar"),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Mesaj tarixcesi — en yenisi birinci, cursor pagination (before=next_cursor)."""
+    return await _build_history_page(db, current_user.id, user_id, limit, before)
+
+
+@router.get("/history/{user_id}", response_model=list[ChatMessageResponse])
+async def get_chat_history(
+    user_id: str,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    before: str | None = Query(None),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Iki istifadeci arasinda mesaj tarixcesi (kohne client-ler ucun, xronoloji sira).
+
+    Artiq butun sohbeti yuklemir — en yeni `limit` mesaj qaytarilir.
+    Yeni client-ler /messages/{user_id} istifade etmelidir.
+    """
+    page = await _build_history_page(db, current_user.id, user_id, limit, before)
+    return list(reversed(page.messages))
+
+
+@router.post("/read/{user_id}")
+async def mark_messages_read(
+    user_id: str,
+    up_to: str = Query(..., description="Bu mesaja qeder (daxil) oxunmus et"),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Istifadecinin butun sobet listi."""
+    """Read receipt — user_id-den gelen mesajlari up_to mesajina qeder bir UPDATE ile oxunmus et."""
     result = await db.execute(
-        select(ChatMessage)
-        .where(
+        select(ChatMessage.created_at, ChatMessage.id).where(
+            ChatMessage.id == up_to,
             or_(
-                ChatMessage.sender_id == current_user.id,
-                ChatMessage.receiver_id == current_user.id,
-            )
+                and_(ChatMessage.sender_id == user_id, ChatMessage.receiver_id == current_user.id),
+                and_(ChatMessage.sender_id == current_user.id, ChatMessage.receiver_id == user_id),
+            ),
         )
-        .order_by(desc(ChatMessage.created_at))
     )
-    messages = result.scalars().all()
+    cursor = result.one_or_none()
+    if cursor is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mesaj tapilmadi")
 
-    conversations = {}
-    for msg in messages:
-        other_id = msg.receiver_id if msg.sender_id == current_user.id else msg.sender_id
-        if other_id not in conversations:
-            conversations[other_id] = {
-                "last_message": msg.message,
-                "last_message_time": msg.created_at,
-                "unread_count": 0,
-            }
-        if msg.receiver_id == current_user.id and not msg.is_read:
-            conversations[other_id]["unread_count"] += 1
+    updated = await _mark_read_up_to(db, current_user.id, user_id, cursor.created_at, cursor.id)
+    return {"updated": updated}
 
-    response = []
-    for user_id, conv in conversations.items():
-        user_result = await db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
-        if user:
-            response.append(
-                ChatConversation(
-                    user_id=user.id,
-                    user_name=user.name,
-                    user_profile_image=user.profile_image_url,
-                    last_message=conv["last_message"],
-                    last_message_time=conv["last_message_time"],
-                    unread_count=conv["unread_count"],
-                )
-            )
 
-    return response
+@router.get("/conversations", response_model=list[ChatConversation])
+async def get_conversations(
+    limit: int = Query(INBOX_PAGE_SIZE, ge=1, le=INBOX_MAX_PAGE_SIZE),
+    before: str | None = Query(None, description="Evvelki sehifenin son sohbetinin user_id-si"),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
+):
+    """Istifadecinin sohbet listi — en yenisi birinci, chat_conversations xulasesinden."""
+    rows = await load_inbox(db, current_user.id, limit, before)
+    return [
+        ChatConversation(
+            user_id=row.other_id,
+            user_name=row.name,
+            user_profile_image=row.profile_image_url,
+            last_message=row.last_message,
+            last_message_time=row.last_message_time,
+            unread_count=row.unread_count,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/limit", response_model=MessageLimitResponse)
 async def get_message_limit(
-    current_user: User = Depends(get_premium_or_trainer),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Gunluk mesaj limitini yoxla."""
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    result = await db.execute(
-        select(DailyMessageCount).where(
-            DailyMessageCount.user_id == current_user.id,
-            DailyMessageCount.date == today,
-        )
-    )
-    daily_count = result.scalar_one_or_none()
-    used = daily_count.count if daily_count else 0
+    used = await get_message_quota_used(db, current_user.id)
 
     return MessageLimitResponse(
         daily_limit=DAILY_MESSAGE_LIMIT,
         used_today=used,
         remaining=max(0, DAILY_MESSAGE_LIMIT - used),
     )
+
+
+def _ws_token(websocket: WebSocket) -> str:
+    """JWT: ?token= query parametri ve ya Authorization: Bearer header."""
+    token = websocket.query_params.get("token")
+    if token:
+        return token
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    return credentials if scheme.lower() == "bearer" else ""
+
+
+@router.websocket("/ws")
+async def chat_websocket(websocket: WebSocket):
+    """Real-time chat push — yeni mesajlar ({"type": "message"}) ve read receipt-ler ({"type": "read"}).
+
+    Client-ler /history ve /conversations-u polling etmek evezine bu kanala qosulur.
+    Keepalive protokol seviyyesinde (WebSocket ping) olur; client-den gelen mesajlar nezere alinmir.
+    """
+    try:
+        current_user = await get_premium_or_trainer_auth_user(await get_auth_user(_ws_token(websocket)))
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with chat_broker.subscribe(current_user.id) as queue:
+
+        async def push_events():
+            while True:
+                await websocket.send_json(await queue.get())
+
+        async def read_client():
+            while True:
+                await websocket.receive_text()
+
+        tasks = [asyncio.create_task(push_events()), asyncio.create_task(read_client())]
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                if exc is not None and not isinstance(exc, WebSocketDisconnect):
+                    raise exc
+        finally:
+            for task in tasks:
+                task.cancel()
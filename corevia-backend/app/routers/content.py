@@ -9,7 +9,7 @@ from app.database import get_db
 from app.models.user import User, UserType
 from app.models.content import TrainerContent, ContentType
 from app.schemas.content import ContentCreate, ContentResponse, ContentUpdate
-from app.utils.security import get_current_user, get_premium_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
 
 router = APIRouter(prefix="/api/v1/content", tags=["Content"])
 
@@ -236,7 +236,7 @@ async def update_content(
 @router.delete("/{content_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_content(
     content_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Trainer oz content-ini silsin."""
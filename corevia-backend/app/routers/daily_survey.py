@@ -10,15 +10,15 @@ GET    /api/v1/survey/questions     — Sual siyahısı (lokalizə edilmiş)
 from datetime import datetime, date, timedelta
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_readonly_db
 from app.models.daily_survey import DailySurvey
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
+from app.utils.http_cache import CachePolicy, cache_response
 
 router = APIRouter(prefix="/api/v1/survey", tags=["Daily Survey"])
 
@@ -73,7 +73,7 @@ class SurveyQuestionsResponse(BaseModel):
 @router.post("/daily", response_model=DailySurveyResponse)
 async def submit_daily_survey(
     data: DailySurveyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Günlük survey-i doldur. Gündə 1 dəfə icazə verilir."""
@@ -136,8 +136,8 @@ async def submit_daily_survey(
 
 @router.get("/daily/today")
 async def get_today_survey(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Bugünkü survey statusu"""
     today = date.today()
@@ -174,8 +174,8 @@ async def get_today_survey(
 @router.get("/daily/history")
 async def get_survey_history(
     days: int = 30,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Son N günlük survey tarixçəsi"""
     since = date.today() - timedelta(days=days)
@@ -213,9 +213,10 @@ async def get_survey_history(
 
 @router.get("/questions", response_model=SurveyQuestionsResponse)
 async def get_survey_questions(
+    request: Request,
     lang: str = "az",
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Sual siyahısı (lokalizə edilmiş)"""
     today = date.today()
@@ -360,7 +361,9 @@ async def get_survey_questions(
 
     questions = QUESTIONS.get(lang, QUESTIONS["az"])
 
-    return SurveyQuestionsResponse(
-        questions=questions,
-        already_completed=already_completed,
+    # Suallar nadir dəyişir — client ETag ilə yoxlayır (already_completed da ETag-ə daxildir)
+    return cache_response(
+        request,
+        SurveyQuestionsResponse(questions=questions, already_completed=already_completed),
+        CachePolicy(max_age=0),
     )
@@ -4,11 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 import base64
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
 from app.models.food_entry import FoodEntry, MealType
 from app.schemas.food import FoodEntryCreate, FoodEntryUpdate, FoodEntryResponse, DailyNutritionSummary
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
 from app.services.ai_food_service import ai_food_service
 
 router = APIRouter(prefix="/api/v1/food", tags=["Food"])
@@ -17,7 +17,7 @@ router = APIRouter(prefix="/api/v1/food", tags=["Food"])
 @router.post("/", response_model=FoodEntryResponse, status_code=status.HTTP_201_CREATED)
 async def create_food_entry(
     food_data: FoodEntryCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     entry = FoodEntry(
@@ -40,8 +40,8 @@ async def create_food_entry(
 
 @router.get("/", response_model=list[FoodEntryResponse])
 async def get_food_entries(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     meal_type: MealType | None = None,
     date_from: datetime | None = None,
     date_to: datetime | None = None,
@@ -62,8 +62,8 @@ async def get_food_entries(
 
 @router.get("/today", response_model=list[FoodEntryResponse])
 async def get_today_food(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + timedelta(days=1)
@@ -133,8 +133,8 @@ async def get_daily_summary(
 @router.get("/{entry_id}", response_model=FoodEntryResponse)
 async def get_food_entry(
     entry_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     result = await db.execute(
         select(FoodEntry).where(FoodEntry.id == entry_id, FoodEntry.user_id == current_user.id)
@@ -149,7 +149,7 @@ async def get_food_entry(
 async def update_food_entry(
     entry_id: str,
     food_data: FoodEntryUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -168,7 +168,7 @@ async def update_food_entry(
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_food_entry(
     entry_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -185,7 +185,7 @@ async def delete_food_entry(
 async def analyze_food_image(
     file: UploadFile = File(...),
     language: str = "az",
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
 ):
     """
     AI Food Analysis Endpoint
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func, desc
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
 from app.models.live_session import (
     LiveSession, SessionParticipant, SessionExercise,
@@ -24,7 +24,7 @@ from app.schemas.live_session import (
     ParticipantExerciseResponse, PoseDetectionRequest,
     PoseDetectionResponse, SessionStatsResponse, FormFeedback
 )
-from app.utils.security import get_current_user, require_trainer
+from app.utils.security import AuthUser, get_auth_user, require_trainer_auth_user
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +75,7 @@ manager = ConnectionManager()
 @router.post("", response_model=LiveSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_live_session(
     session_data: CreateLiveSessionRequest,
-    current_user: User = Depends(require_trainer),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -141,8 +141,8 @@ async def list_live_sessions(
     upcoming_only: bool = True,
     page: int = 1,
     page_size: int = 20,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """
     List live sessions with filters
@@ -187,8 +187,8 @@ async def list_live_sessions(
 @router.get("/{session_id}", response_model=LiveSessionResponse)
 async def get_live_session(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get session details - OWASP A01"""
     result = await db.execute(
@@ -220,7 +220,7 @@ async def get_live_session(
 async def update_live_session(
     session_id: str,
     update_data: UpdateLiveSessionRequest,
-    current_user: User = Depends(require_trainer),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update session - OWASP A01 Ownership check"""
@@ -258,7 +258,7 @@ async def update_live_session(
 @router.delete("/{session_id}")
 async def delete_live_session(
     session_id: str,
-    current_user: User = Depends(require_trainer),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete/cancel session - OWASP A01"""
@@ -293,7 +293,7 @@ async def delete_live_session(
 @router.post("/join", status_code=status.HTTP_201_CREATED)
 async def join_session(
     join_data: JoinSessionRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Join a live session - OWASP A01"""
@@ -349,7 +349,7 @@ async def join_session(
 @router.post("/{session_id}/join", status_code=status.HTTP_201_CREATED)
 async def join_session_by_path(
     session_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Join a live session via path param (Android compatibility) - OWASP A01"""
@@ -424,7 +424,7 @@ async def join_session_by_path(
 @router.post("/{session_id}/leave")
 async def leave_session(
     session_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Leave a live session - OWASP A01"""
@@ -490,8 +490,8 @@ async def leave_session(
 @router.get("/{session_id}/participants", response_model=List[ParticipantResponse])
 async def get_session_participants(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get session participants"""
     # Verify access to session
@@ -521,8 +521,8 @@ async def get_session_participants(
 @router.get("/{session_id}/exercises", response_model=List[SessionExerciseResponse])
 async def get_session_exercises(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get exercises for session"""
     result = await db.execute(
@@ -538,7 +538,7 @@ async def get_session_exercises(
 @router.post("/{session_id}/start")
 async def start_session(
     session_id: str,
-    current_user: User = Depends(require_trainer),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Start a live session - OWASP A01 Trainer only"""
@@ -577,7 +577,7 @@ async def start_session(
 @router.post("/{session_id}/end")
 async def end_session(
     session_id: str,
-    current_user: User = Depends(require_trainer),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """End a live session - OWASP A01"""
@@ -628,8 +628,8 @@ async def end_session(
 @router.get("/{session_id}/stats", response_model=SessionStatsResponse)
 async def get_session_stats(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get session statistics"""
     result = await db.execute(
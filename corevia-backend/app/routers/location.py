@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
 from app.models.route import Route
 from app.schemas.route import (
@@ -13,7 +13,13 @@ from app.schemas.route import (
     RouteResponse,
     RouteStatsResponse,
 )
-from app.utils.security import get_current_user, get_premium_or_trainer
+from app.utils.security import (
+    AuthUser,
+    get_current_user,
+    get_premium_or_trainer,
+    get_auth_user,
+    get_premium_or_trainer_auth_user,
+)
 from app.services.location_service import process_route_data, get_mapbox_directions
 
 router = APIRouter(prefix="/api/v1/routes", tags=["Routes & Location"])
@@ -65,8 +71,8 @@ async def create_route(
 
 @router.get("/", response_model=list[RouteResponse])
 async def get_routes(
-    current_user: User = Depends(get_premium_or_trainer),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     activity_type: str | None = None,
     is_completed: bool | None = None,
     date_from: datetime | None = None,
@@ -93,8 +99,8 @@ async def get_routes(
 
 @router.get("/stats", response_model=RouteStatsResponse)
 async def get_route_stats(
-    current_user: User = Depends(get_premium_or_trainer),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_premium_or_trainer_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     days: int = Query(default=30, le=365),
 ):
     """Marsrut statistikası (son N gün)"""
@@ -152,8 +158,8 @@ async def get_route_stats(
 
 @router.get("/assigned", response_model=list[RouteResponse])
 async def get_assigned_routes(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Student-in trainer tərəfindən təyin olunmuş marsrutlarini gətir"""
     result = await db.execute(
@@ -167,8 +173,8 @@ async def get_assigned_routes(
 @router.get("/{route_id}", response_model=RouteResponse)
 async def get_route(
     route_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Tək marsrutu gətir"""
     result = await db.execute(
@@ -218,7 +224,7 @@ async def update_route(
 @router.delete("/{route_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_route(
     route_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Marsrutu sil"""
@@ -236,7 +242,7 @@ async def delete_route(
 @router.post("/assign", response_model=RouteResponse, status_code=status.HTTP_201_CREATED)
 async def assign_route_to_student(
     assign_data: RouteAssign,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Trainer öz student-inə marsrut təyin etsin"""
@@ -282,8 +288,8 @@ async def assign_route_to_student(
 
 @router.get("/trainer/assigned", response_model=list[RouteResponse])
 async def get_trainer_assigned_routes(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Trainer-in təyin etdiyi bütün marsrutlar"""
     if current_user.user_type != "trainer":
@@ -307,7 +313,7 @@ async def get_directions_preview(
     end_lat: float = Query(...),
     end_lng: float = Query(...),
     profile: str = Query(default="walking"),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
 ):
     """Mapbox Directions API ile 2 nöqtə arasında marsrut preview al"""
     VALID_PROFILES = {"walking", "cycling", "driving", "driving-traffic"}
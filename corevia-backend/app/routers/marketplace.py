@@ -10,12 +10,12 @@ Marketplace Router - OWASP Top 10 Compliant
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc
 from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db, get_read_db
 from app.models.user import User, UserType
 from app.models.marketplace import MarketplaceProduct, ProductPurchase, ProductReview
 from app.schemas.marketplace import (
@@ -34,13 +34,21 @@ from app.schemas.marketplace import (
     OrderCreateRequest,
     OrderResponse,
 )
-from app.utils.security import get_current_user, require_trainer
+from app.utils.security import (
+    AuthUser,
+    get_current_user,
+    require_trainer,
+    get_auth_user,
+    require_trainer_auth_user,
+)
 from app.services.file_service import save_upload
+from app.utils.http_cache import CachePolicy, cache_response
+from app.utils.responses import FastJSONResponse
 from app.services.premium_service import validate_apple_receipt
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/marketplace", tags=["Marketplace"])
+router = APIRouter(prefix="/api/v1/marketplace", tags=["Marketplace"], default_response_class=FastJSONResponse)
 
 
 # ============================================================
@@ -98,7 +106,7 @@ async def list_marketplace_products(
     max_price: Optional[float] = None,
     sort_by: str = "created_at",  # created_at, price, rating, sales
     current_user: Optional[User] = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get marketplace products (public, published only)
@@ -186,20 +194,22 @@ async def list_marketplace_products(
         product_response.is_purchased = is_purchased
         product_responses.append(product_response)
 
-    return MarketplaceListResponse(
+    response = MarketplaceListResponse(
         products=product_responses,
         total=total,
         page=page,
         page_size=page_size,
         has_more=(offset + page_size) < total,
     )
+    return FastJSONResponse(response)
 
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
 async def get_product_detail(
     product_id: str,
+    request: Request,
     current_user: Optional[User] = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get single product detail - OWASP A01:2021 Access Control"""
     product = await get_product_or_404(product_id, db)
@@ -234,7 +244,8 @@ async def get_product_detail(
             rating=seller.rating,
         )
     product_response.is_purchased = is_purchased
-    return product_response
+    # is_purchased user-ə aiddir — yalnız private keş, ETag məzmundan
+    return cache_response(request, product_response, CachePolicy(max_age=0))
 
 
 # ============================================================
@@ -362,8 +373,8 @@ async def delete_product(
 
 @router.get("/my-products", response_model=MyProductsResponse)
 async def get_my_products(
-    current_user: User = Depends(require_trainer),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(require_trainer_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get seller's products - OWASP A01:2021"""
     result = await db.execute(
@@ -482,8 +493,8 @@ async def create_order(
 
 @router.get("/orders", response_model=list[OrderResponse])
 async def get_orders(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get user's orders (Android compatibility) - OWASP A01:2021"""
     result = await db.execute(
@@ -515,8 +526,8 @@ async def get_orders(
 
 @router.get("/my-purchases", response_model=MyPurchasesResponse)
 async def get_my_purchases(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get user's purchases - OWASP A01:2021"""
     result = await db.execute(
@@ -622,7 +633,7 @@ async def create_product_review(
 @router.get("/products/{product_id}/reviews", response_model=list[ProductReviewResponse])
 async def get_product_reviews(
     product_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get product reviews (public)"""
     product = await get_product_or_404(product_id, db)
@@ -1,7 +1,7 @@
 """
 News Router - Fitness xəbərləri API
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, desc
 from pydantic import BaseModel, Field
@@ -9,15 +9,30 @@ from typing import List, Optional
 from datetime import datetime
 import logging
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_readonly_db
 from app.models.news import NewsBookmark
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
 from app.services.fitness_news_service import fitness_news_service
+from app.middleware.security import news_refresh_rate_limiter
+from app.utils.http_cache import CachePolicy, cache_response, version_etag
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/news", tags=["Fitness News"])
 
+# Xəbər siyahısı 2 saat keşdədir — client 1 dəq sonra ETag ilə yoxlayır
+NEWS_CACHE_POLICY = CachePolicy(max_age=60)
+CATEGORIES_CACHE_POLICY = CachePolicy(max_age=86400)
+
+NEWS_CATEGORIES = {
+    "categories": [
+        {"id": "workout", "name": "Workout", "icon": "dumbbell"},
+        {"id": "nutrition", "name": "Nutrition", "icon": "apple"},
+        {"id": "research", "name": "Research", "icon": "microscope"},
+        {"id": "tips", "name": "Tips", "icon": "lightbulb"},
+        {"id": "lifestyle", "name": "Lifestyle", "icon": "heart"},
+    ]
+}
+
 
 class NewsArticle(BaseModel):
     """Fitness xəbər article model"""
@@ -40,42 +55,40 @@ class NewsResponse(BaseModel):
 
 @router.get("/", response_model=NewsResponse)
 async def get_fitness_news(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Xəbər sayı"),
     force_refresh: bool = Query(False, description="Cache-i yenilə"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: AuthUser = Depends(get_auth_user),
 ):
     """
     Fitness xəbərlərini gətir
 
     - AI ilə internetdən fitness xəbərləri toplayır
-    - 2 saat cache edir (force_refresh=true ilə yeniləyə bilərsən)
+    - 2 saat cache edir (force_refresh=true ilə yeniləyə bilərsən, 5 dəqiqədə bir)
     - Categories: Workout, Nutrition, Research, Tips, Lifestyle
     """
     try:
-        logger.info(f"News request from user {current_user.email}, limit={limit}, force_refresh={force_refresh}")
+        logger.info(f"News request from user {current_user.id}, limit={limit}, force_refresh={force_refresh}")
 
-        # Service-dən xəbərləri al
-        articles_data = await fitness_news_service.get_fitness_news(
+        # Service-dən xəbərləri al (paylaşılan keş)
+        articles_data, cache_status = await fitness_news_service.get_news_with_status(
             limit=limit,
             force_refresh=force_refresh
         )
 
         logger.info(f"Successfully fetched {len(articles_data)} news articles")
 
-        # Cache status təyin et
-        cache_status = "fresh" if force_refresh else "cached"
-        if not fitness_news_service._cache_time:
-            cache_status = "fresh"
-
         # Response hazırla
         articles = [NewsArticle(**article) for article in articles_data]
 
-        return NewsResponse(
+        response = NewsResponse(
             articles=articles,
             total=len(articles),
             cache_status=cache_status
         )
+        # ETag siyahı versiyasından — dəyişməyibsə gövdəsiz 304
+        etag = version_etag("news", fitness_news_service.version, limit)
+        return cache_response(request, response, NEWS_CACHE_POLICY, etag=etag)
 
     except Exception as e:
         logger.error(f"Error fetching news: {str(e)}", exc_info=True)
@@ -87,33 +100,25 @@ async def get_fitness_news(
 
 @router.get("/categories")
 async def get_news_categories(
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    current_user: AuthUser = Depends(get_auth_user)
 ):
     """
     Mövcud news kategoriyaları
     """
-    return {
-        "categories": [
-            {"id": "workout", "name": "Workout", "icon": "dumbbell"},
-            {"id": "nutrition", "name": "Nutrition", "icon": "apple"},
-            {"id": "research", "name": "Research", "icon": "microscope"},
-            {"id": "tips", "name": "Tips", "icon": "lightbulb"},
-            {"id": "lifestyle", "name": "Lifestyle", "icon": "heart"},
-        ]
-    }
+    return cache_response(request, NEWS_CATEGORIES, CATEGORIES_CACHE_POLICY)
 
 
 @router.get("/{article_id}")
 async def get_news_article(
     article_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_auth_user)
 ):
     """
     Bir xəbərin detaylarını gətir
     """
-    # Cache-dən tap
-    articles = await fitness_news_service.get_fitness_news(limit=50)
-    article = next((a for a in articles if a["id"] == article_id), None)
+    # Cache-dən tap (id indeksi)
+    article = await fitness_news_service.get_article(article_id)
 
     if not article:
         raise HTTPException(status_code=404, detail="Xəbər tapılmadı")
@@ -123,29 +128,36 @@ async def get_news_article(
 
 @router.post("/refresh")
 async def refresh_news_cache(
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_auth_user),
+    _rl: None = Depends(news_refresh_rate_limiter),
 ):
     """
     News cache-ini yenilə (admin/manual refresh)
+
+    Bütün worker-lər üzrə 5 dəqiqədə bir dəfədən çox yenilənmir.
     """
     try:
-        articles = await fitness_news_service.get_fitness_news(
-            limit=50,
-            force_refresh=True
-        )
-
-        return {
-            "success": True,
-            "message": "Xəbərlər yeniləndi",
-            "count": len(articles),
-            "timestamp": datetime.now().isoformat()
-        }
+        refreshed = await fitness_news_service.refresh()
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Xəbərləri yeniləyərkən xəta: {str(e)}"
         )
 
+    if not refreshed:
+        raise HTTPException(
+            status_code=429,
+            detail="Xəbərlər bu yaxınlarda yenilənib, bir neçə dəqiqə sonra yenidən cəhd edin",
+        )
+
+    articles = await fitness_news_service.get_fitness_news(limit=50)
+    return {
+        "success": True,
+        "message": "Xəbərlər yeniləndi",
+        "count": len(articles),
+        "timestamp": datetime.now().isoformat()
+    }
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BOOKMARKS
@@ -169,7 +181,7 @@ class BookmarkResponse(BaseModel):
 @router.post("/bookmarks", response_model=BookmarkResponse, status_code=201)
 async def bookmark_article(
     request: BookmarkRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Xəbəri əlfəcinlə (bookmark)"""
@@ -200,7 +212,7 @@ async def bookmark_article(
 @router.delete("/bookmarks/{article_id}")
 async def remove_bookmark(
     article_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Əlfəcini sil"""
@@ -224,8 +236,8 @@ async def remove_bookmark(
 
 @router.get("/bookmarks", response_model=List[BookmarkResponse])
 async def get_bookmarks(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db)
 ):
     """İstifadəçinin əlfəcinlərini gətir"""
     result = await db.execute(
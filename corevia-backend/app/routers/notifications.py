@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
 from app.models.notification import DeviceToken, Notification
 from app.schemas.notification import (
@@ -12,7 +12,7 @@ from app.schemas.notification import (
     NotificationSend,
     NotificationMarkRead,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
 from app.services.notification_service import (
     send_push_notification,
     get_notification_template,
@@ -27,7 +27,7 @@ router = APIRouter(prefix="/api/v1/notifications", tags=["Notifications"])
 @router.post("/register-device", status_code=status.HTTP_201_CREATED)
 async def register_device_token(
     token_data: DeviceTokenCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """iOS/Android app-in FCM token-ini qeyd et (login/startup zamani)"""
@@ -59,7 +59,7 @@ async def register_device_token(
 @router.delete("/device-token")
 async def unregister_device_token(
     fcm_token: str = Query(...),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Device token-i deaktiv et (logout zamani)"""
@@ -79,8 +79,8 @@ async def unregister_device_token(
 
 @router.get("/", response_model=list[NotificationResponse])
 async def get_notifications(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     unread_only: bool = False,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
@@ -98,8 +98,8 @@ async def get_notifications(
 
 @router.get("/unread-count")
 async def get_unread_count(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Oxunmamis bildiris sayini qaytar"""
     result = await db.execute(
@@ -115,7 +115,7 @@ async def get_unread_count(
 @router.post("/mark-read")
 async def mark_notifications_read(
     data: NotificationMarkRead,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Bildirisleri oxunmus olaraq isaretle"""
@@ -132,7 +132,7 @@ async def mark_notifications_read(
 
 @router.post("/mark-all-read")
 async def mark_all_read(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Butun bildirisleri oxunmus et"""
@@ -150,7 +150,7 @@ async def mark_all_read(
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_notification(
     notification_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Tek bildirisi sil"""
@@ -171,7 +171,7 @@ async def delete_notification(
 @router.post("/send", status_code=status.HTTP_201_CREATED)
 async def send_notification_to_student(
     data: NotificationSend,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Trainer oz student-ine bildiris gondersin"""
@@ -3,11 +3,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User
 from app.models.onboarding import UserOnboarding
 from app.schemas.onboarding import OnboardingCreate, OnboardingResponse, OnboardingOptions
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
 
 router = APIRouter(prefix="/api/v1/onboarding", tags=["Onboarding"])
 
@@ -100,8 +100,8 @@ async def complete_onboarding(
 
 @router.get("/status", response_model=OnboardingResponse | None)
 async def get_onboarding_status(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Onboarding statusunu yoxla."""
     result = await db.execute(
@@ -20,7 +20,7 @@ from app.schemas.payment import (
     PaymentCreateResponse,
     PaymentStatusResponse,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
 from app.services.kapital_service import create_order, get_order_details, refund_order
 from app.services.premium_service import get_plan_info, calculate_expiry, PREMIUM_FEATURES
 
@@ -32,7 +32,7 @@ settings = get_settings()
 @router.post("/create-order", response_model=PaymentCreateResponse)
 async def create_payment_order(
     data: PaymentCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -189,7 +189,7 @@ async def payment_callback(
 @router.get("/status/{payment_id}", response_model=PaymentStatusResponse)
 async def get_payment_status(
     payment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -240,7 +240,7 @@ async def get_payment_status(
 @router.post("/refund/{payment_id}")
 async def refund_payment(
     payment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Admin və ya istifadəçi tərəfindən geri ödəniş."""
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User, UserType
 from app.models.meal_plan import MealPlan, MealPlanItem, PlanType
 from app.models.training_plan import TrainingPlan, PlanWorkout
@@ -13,7 +13,7 @@ from app.schemas.plan import (
     MealPlanCreate, MealPlanUpdate, MealPlanResponse,
     TrainingPlanCreate, TrainingPlanUpdate, TrainingPlanResponse,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
 
 router = APIRouter(prefix="/api/v1/plans", tags=["Plans"])
 
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/api/v1/plans", tags=["Plans"])
 @router.post("/meal", response_model=MealPlanResponse, status_code=status.HTTP_201_CREATED)
 async def create_meal_plan(
     plan_data: MealPlanCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     if current_user.user_type != UserType.trainer:
@@ -70,8 +70,8 @@ async def create_meal_plan(
 
 @router.get("/meal", response_model=list[MealPlanResponse])
 async def get_meal_plans(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     plan_type: PlanType | None = None,
 ):
     if current_user.user_type == UserType.trainer:
@@ -90,8 +90,8 @@ async def get_meal_plans(
 @router.get("/meal/{plan_id}", response_model=MealPlanResponse)
 async def get_meal_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     result = await db.execute(
         select(MealPlan).options(selectinload(MealPlan.items)).where(MealPlan.id == plan_id)
@@ -110,7 +110,7 @@ async def get_meal_plan(
 async def update_meal_plan(
     plan_id: str,
     plan_data: MealPlanUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -157,7 +157,7 @@ async def update_meal_plan(
 @router.delete("/meal/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_meal_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -175,7 +175,7 @@ async def delete_meal_plan(
 @router.post("/training", response_model=TrainingPlanResponse, status_code=status.HTTP_201_CREATED)
 async def create_training_plan(
     plan_data: TrainingPlanCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     if current_user.user_type != UserType.trainer:
@@ -219,8 +219,8 @@ async def create_training_plan(
 
 @router.get("/training", response_model=list[TrainingPlanResponse])
 async def get_training_plans(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     plan_type: PlanType | None = None,
 ):
     if current_user.user_type == UserType.trainer:
@@ -239,8 +239,8 @@ async def get_training_plans(
 @router.get("/training/{plan_id}", response_model=TrainingPlanResponse)
 async def get_training_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     result = await db.execute(
         select(TrainingPlan).options(selectinload(TrainingPlan.workouts)).where(TrainingPlan.id == plan_id)
@@ -259,7 +259,7 @@ async def get_training_plan(
 async def update_training_plan(
     plan_id: str,
     plan_data: TrainingPlanUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -304,7 +304,7 @@ async def update_training_plan(
 @router.delete("/training/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_training_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -322,7 +322,7 @@ async def delete_training_plan(
 @router.put("/training/{plan_id}/complete", response_model=TrainingPlanResponse)
 async def complete_training_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Tələbə və ya trainer assign olunmuş məşq planını tamamlandı kimi işarələyir"""
@@ -348,7 +348,7 @@ async def complete_training_plan(
 @router.put("/meal/{plan_id}/complete", response_model=MealPlanResponse)
 async def complete_meal_plan(
     plan_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Tələbə və ya trainer assign olunmuş yemək planını tamamlandı kimi işarələyir"""
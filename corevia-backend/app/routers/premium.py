@@ -1,9 +1,9 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.config import get_settings
 from app.models.user import User
 from app.models.subscription import Subscription
@@ -12,7 +12,8 @@ from app.schemas.subscription import (
     SubscriptionResponse,
     PremiumStatusResponse,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
+from app.utils.http_cache import CachePolicy, cache_response
 from app.services.premium_service import (
     get_plan_info,
     calculate_expiry,
@@ -238,8 +239,8 @@ async def restore_subscription(
 
 @router.get("/history", response_model=list[SubscriptionResponse])
 async def get_subscription_history(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Abunəlik tarixcesi"""
     result = await db.execute(
@@ -250,28 +251,34 @@ async def get_subscription_history(
     return result.scalars().all()
 
 
+# Statik melumat — client 1 saat tekrar yuklemir, sonra ETag ile yoxlayir
+PLANS_CACHE_POLICY = CachePolicy(max_age=3600, private=False)
+
+PREMIUM_PLANS = {
+    "plans": [
+        {
+            "product_id": "com.corevia.monthly",
+            "name": "Ayliq Premium",
+            "price": 9.99,
+            "currency": "AZN",
+            "period": "monthly",
+            "features": PREMIUM_FEATURES,
+        },
+        {
+            "product_id": "com.corevia.yearly",
+            "name": "Illik Premium",
+            "price": 79.99,
+            "currency": "AZN",
+            "period": "yearly",
+            "save_percent": 20,
+            "features": PREMIUM_FEATURES,
+            "is_popular": True,
+        },
+    ],
+}
+
+
 @router.get("/plans")
-async def get_available_plans():
+async def get_available_plans(request: Request):
     """Movcud premium planlar (login olmadan da gorune biler)"""
-    return {
-        "plans": [
-            {
-                "product_id": "com.corevia.monthly",
-                "name": "Ayliq Premium",
-                "price": 9.99,
-                "currency": "AZN",
-                "period": "monthly",
-                "features": PREMIUM_FEATURES,
-            },
-            {
-                "product_id": "com.corevia.yearly",
-                "name": "Illik Premium",
-                "price": 79.99,
-                "currency": "AZN",
-                "period": "yearly",
-                "save_percent": 20,
-                "features": PREMIUM_FEATURES,
-                "is_popular": True,
-            },
-        ],
-    }
+    return cache_response(request, PREMIUM_PLANS, PLANS_CACHE_POLICY)
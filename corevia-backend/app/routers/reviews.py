@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User, UserType
 from app.models.review import Review
 from app.schemas.review import ReviewCreate, ReviewResponse, ReviewSummary
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
+from app.utils.http_cache import invalidate_keys_on_commit
+from app.routers.users import trainer_cache_keys
 
 router = APIRouter(prefix="/api/v1/trainer", tags=["Reviews"])
 
@@ -63,6 +65,7 @@ async def create_review(
     await db.execute(
         update(User).where(User.id == trainer_id).values(rating=round(float(avg_rating), 1))
     )
+    invalidate_keys_on_commit(db, *trainer_cache_keys(trainer_id))
 
     return ReviewResponse(
         id=review.id,
@@ -79,8 +82,8 @@ async def create_review(
 @router.get("/{trainer_id}/reviews", response_model=list[ReviewResponse])
 async def get_trainer_reviews(
     trainer_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_readonly_db),
+    current_user: AuthUser = Depends(get_auth_user),
 ):
     """Trainer-in butun review-larini getir."""
     result = await db.execute(
@@ -111,7 +114,7 @@ async def get_trainer_reviews(
 @router.get("/{trainer_id}/reviews/summary", response_model=ReviewSummary)
 async def get_review_summary(
     trainer_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Trainer-in review xulasesini getir."""
     result = await db.execute(
@@ -137,7 +140,7 @@ async def get_review_summary(
 @router.delete("/{trainer_id}/reviews", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_my_review(
     trainer_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Student oz review-unu silsin."""
@@ -164,3 +167,4 @@ async def delete_my_review(
             rating=round(float(avg_rating), 1) if avg_rating else None
         )
     )
+    invalidate_keys_on_commit(db, *trainer_cache_keys(trainer_id))
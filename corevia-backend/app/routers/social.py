@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc
 from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db, get_read_db
 from app.models.user import User
 from app.models.social import Post, PostLike, PostComment, Follow, Achievement
 from app.schemas.social import (
@@ -19,10 +19,11 @@ from app.schemas.social import (
     AchievementResponse,
     FeedResponse,
 )
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
 from app.services.file_service import save_upload
+from app.utils.responses import FastJSONResponse
 
-router = APIRouter(prefix="/api/v1/social", tags=["Social"])
+router = APIRouter(prefix="/api/v1/social", tags=["Social"], default_response_class=FastJSONResponse)
 
 
 # ============================================================
@@ -63,7 +64,7 @@ async def create_post(
 async def upload_post_image(
     post_id: str,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Upload image for a post"""
@@ -88,8 +89,8 @@ async def upload_post_image(
 async def get_feed(
     page: int = 1,
     page_size: int = 20,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get social feed (posts from followed users + own posts)"""
     offset = (page - 1) * page_size
@@ -146,20 +147,21 @@ async def get_feed(
         post_response.is_liked = is_liked
         post_responses.append(post_response)
 
-    return FeedResponse(
+    response = FeedResponse(
         posts=post_responses,
         total=total,
         page=page,
         page_size=page_size,
         has_more=(offset + page_size) < total,
     )
+    return FastJSONResponse(response)
 
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get single post"""
     result = await db.execute(select(Post).where(Post.id == post_id))
@@ -195,7 +197,7 @@ async def get_post(
 @router.delete("/posts/{post_id}")
 async def delete_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a post"""
@@ -220,7 +222,7 @@ async def delete_post(
 @router.post("/posts/{post_id}/like")
 async def like_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Like a post"""
@@ -254,7 +256,7 @@ async def like_post(
 @router.delete("/posts/{post_id}/like")
 async def unlike_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Unlike a post"""
@@ -325,8 +327,8 @@ async def create_comment(
 @router.get("/posts/{post_id}/comments", response_model=list[CommentResponse])
 async def get_comments(
     post_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get comments for a post"""
     result = await db.execute(
@@ -357,7 +359,7 @@ async def get_comments(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a comment"""
@@ -388,7 +390,7 @@ async def delete_comment(
 @router.post("/follow/{user_id}")
 async def follow_user(
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Follow a user"""
@@ -420,7 +422,7 @@ async def follow_user(
 @router.delete("/follow/{user_id}")
 async def unfollow_user(
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Unfollow a user"""
@@ -442,8 +444,8 @@ async def unfollow_user(
 @router.get("/profile/{user_id}", response_model=UserProfileSummary)
 async def get_user_profile(
     user_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get user profile summary"""
     # Get user
@@ -491,8 +493,8 @@ async def get_user_profile(
 
 @router.get("/achievements", response_model=list[AchievementResponse])
 async def get_my_achievements(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get current user's achievements"""
     result = await db.execute(
@@ -506,8 +508,8 @@ async def get_my_achievements(
 
 @router.get("/achievements/all")
 async def get_all_achievements(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get all available achievements with user's progress"""
     from app.models.workout import Workout
@@ -622,8 +624,8 @@ async def get_all_achievements(
 @router.get("/profile/{user_id}/posts", response_model=list[PostResponse])
 async def get_user_posts(
     user_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get posts by a specific user"""
     result = await db.execute(
@@ -3,14 +3,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.user import User, UserType
-from app.models.workout import Workout
-from app.models.food_entry import FoodEntry
 from app.models.training_plan import TrainingPlan
 from app.models.meal_plan import MealPlan
 from app.schemas.user import TrainerDashboardStats, StudentSummary, StatsSummary
 from app.utils.security import get_current_user
+from app.services.student_metrics_service import get_student_metrics
 
 router = APIRouter(prefix="/api/v1/trainer", tags=["Trainer Dashboard"])
 
@@ -18,7 +17,7 @@ router = APIRouter(prefix="/api/v1/trainer", tags=["Trainer Dashboard"])
 @router.get("/stats", response_model=TrainerDashboardStats)
 async def get_trainer_stats(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Trainer dashboard statistikalarini qaytarir"""
 
@@ -35,17 +34,15 @@ async def get_trainer_stats(
     total_subscribers = len(students)
 
     week_ago = datetime.utcnow() - timedelta(days=7)
-    active_student_ids = set()
 
-    for student in students:
-        workout_count = await db.execute(
-            select(func.count(Workout.id)).where(
-                Workout.user_id == student.id,
-                Workout.created_at >= week_ago,
-            )
-        )
-        if workout_count.scalar() > 0:
-            active_student_ids.add(student.id)
+    # Butun telebelerin saylari sabit sayda GROUP BY sorgusu ile
+    metrics = await get_student_metrics(
+        db, [student.id for student in students], week_ago,
+        trainer_id=current_user.id, with_calories=True,
+    )
+    active_student_ids = {
+        student_id for student_id, m in metrics.items() if m.week_logged_workouts > 0
+    }
 
     active_students = len(active_student_ids)
 
@@ -72,60 +69,7 @@ async def get_trainer_stats(
     weights = []
 
     for student in students:
-        tp_count_result = await db.execute(
-            select(func.count(TrainingPlan.id)).where(
-                TrainingPlan.assigned_student_id == student.id,
-                TrainingPlan.trainer_id == current_user.id,
-            )
-        )
-        tp_count = tp_count_result.scalar() or 0
-
-        mp_count_result = await db.execute(
-            select(func.count(MealPlan.id)).where(
-                MealPlan.assigned_student_id == student.id,
-                MealPlan.trainer_id == current_user.id,
-            )
-        )
-        mp_count = mp_count_result.scalar() or 0
-
-        completed_tp_result = await db.execute(
-            select(func.count(TrainingPlan.id)).where(
-                TrainingPlan.assigned_student_id == student.id,
-                TrainingPlan.trainer_id == current_user.id,
-                TrainingPlan.is_completed == True,
-            )
-        )
-        completed_tp = completed_tp_result.scalar() or 0
-
-        completed_mp_result = await db.execute(
-            select(func.count(MealPlan.id)).where(
-                MealPlan.assigned_student_id == student.id,
-                MealPlan.trainer_id == current_user.id,
-                MealPlan.is_completed == True,
-            )
-        )
-        completed_mp = completed_mp_result.scalar() or 0
-
-        total_workouts_result = await db.execute(
-            select(func.count(Workout.id)).where(Workout.user_id == student.id)
-        )
-        total_workouts = total_workouts_result.scalar() or 0
-
-        week_workouts_result = await db.execute(
-            select(func.count(Workout.id)).where(
-                Workout.user_id == student.id,
-                Workout.created_at >= week_ago,
-            )
-        )
-        this_week_workouts = week_workouts_result.scalar() or 0
-
-        total_cal_result = await db.execute(
-            select(func.coalesce(func.sum(FoodEntry.calories), 0)).where(
-                FoodEntry.user_id == student.id
-            )
-        )
-        total_calories = int(total_cal_result.scalar() or 0)
-
+        m = metrics[student.id]
         student_summaries.append(
             StudentSummary(
                 id=student.id,
@@ -136,18 +80,18 @@ async def get_trainer_stats(
                 goal=student.goal,
                 age=student.age,
                 profile_image_url=student.profile_image_url,
-                training_plans_count=tp_count,
-                meal_plans_count=mp_count,
-                completed_training_plans=completed_tp,
-                completed_meal_plans=completed_mp,
-                total_workouts=total_workouts,
-                this_week_workouts=this_week_workouts,
-                total_calories_logged=total_calories,
+                training_plans_count=m.training_plans,
+                meal_plans_count=m.meal_plans,
+                completed_training_plans=m.completed_training_plans,
+                completed_meal_plans=m.completed_meal_plans,
+                total_workouts=m.total_workouts,
+                this_week_workouts=m.week_logged_workouts,
+                total_calories_logged=m.total_calories,
             )
         )
 
-        all_workouts_total += total_workouts
-        all_week_workouts += this_week_workouts
+        all_workouts_total += m.total_workouts
+        all_week_workouts += m.week_logged_workouts
         if student.weight:
             weights.append(student.weight)
 
@@ -7,7 +7,7 @@ from app.models.user import User, UserType
 from app.models.food_entry import FoodEntry
 from app.schemas.user import UserResponse
 from app.schemas.food import FoodEntryResponse
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_current_user, get_auth_user
 from app.services.file_service import save_upload, delete_upload
 
 router = APIRouter(prefix="/api/v1/uploads", tags=["Uploads"])
@@ -31,7 +31,7 @@ async def upload_profile_image(
 async def upload_food_image(
     entry_id: str,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -1,14 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.models.user import User, UserType, VerificationStatus
 from app.schemas.user import UserResponse, UserProfileUpdate, TrainerListResponse
-from app.utils.security import get_current_user, get_premium_user
+from app.utils.security import AuthUser, get_current_user, get_premium_user, get_auth_user
+from app.utils.http_cache import CachePolicy, invalidate_on_commit, shared_response
 
 router = APIRouter(prefix="/api/v1/users", tags=["Users"])
 
+# Trainer siyahisi / profili hami ucun eynidir — server kesi + ETag
+TRAINERS_CACHE_POLICY = CachePolicy(max_age=60, private=False)
+
+
+def trainer_cache_keys(trainer_id: str) -> tuple[str, ...]:
+    """Trainer siyahisi + profil acarlari (reviews router-i bulk rating update-de istifade edir)"""
+    return ("users:trainers", f"users:trainer:{trainer_id}")
+
+
+def _trainer_cache_keys(user: User) -> tuple[str, ...]:
+    if user.user_type != UserType.trainer:
+        return ()
+    return trainer_cache_keys(user.id)
+
+
+invalidate_on_commit(User, _trainer_cache_keys)
+
 
 @router.get("/profile", response_model=UserResponse)
 async def get_profile(current_user: User = Depends(get_current_user)):
@@ -32,29 +50,35 @@ async def update_profile(
 
 
 @router.get("/trainers", response_model=list[TrainerListResponse])
-async def get_trainers(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(User).where(
-            User.user_type == UserType.trainer,
-            User.is_active == True,
-            User.verification_status == VerificationStatus.verified,
+async def get_trainers(request: Request, db: AsyncSession = Depends(get_readonly_db)):
+    async def build():
+        result = await db.execute(
+            select(User).where(
+                User.user_type == UserType.trainer,
+                User.is_active == True,
+                User.verification_status == VerificationStatus.verified,
+            )
         )
-    )
-    return result.scalars().all()
+        return [TrainerListResponse.model_validate(u) for u in result.scalars().all()]
+
+    return await shared_response(request, "users:trainers", build, TRAINERS_CACHE_POLICY)
 
 
 @router.get("/trainer/{trainer_id}", response_model=UserResponse)
-async def get_trainer(trainer_id: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(User).where(
-            User.id == trainer_id,
-            User.user_type == UserType.trainer,
+async def get_trainer(trainer_id: str, request: Request, db: AsyncSession = Depends(get_readonly_db)):
+    async def build():
+        result = await db.execute(
+            select(User).where(
+                User.id == trainer_id,
+                User.user_type == UserType.trainer,
+            )
         )
-    )
-    trainer = result.scalar_one_or_none()
-    if not trainer:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trainer tapilmadi")
-    return trainer
+        trainer = result.scalar_one_or_none()
+        if not trainer:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trainer tapilmadi")
+        return UserResponse.model_validate(trainer)
+
+    return await shared_response(request, f"users:trainer:{trainer_id}", build, TRAINERS_CACHE_POLICY)
 
 
 @router.post("/assign-trainer/{trainer_id}", response_model=UserResponse)
@@ -106,8 +130,8 @@ async def unassign_trainer(
 
 @router.get("/my-students", response_model=list[UserResponse])
 async def get_my_students(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     if current_user.user_type != UserType.trainer:
         raise HTTPException(
@@ -124,7 +148,7 @@ async def get_my_students(
 @router.post("/assign-student/{student_id}", response_model=UserResponse)
 async def assign_student_to_trainer(
     student_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Trainer oz telebesi ucun trainer_id set edir (trainer terefinden)."""
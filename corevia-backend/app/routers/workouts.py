@@ -3,11 +3,10 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_readonly_db
 from app.models.workout import Workout, WorkoutCategory
 from app.schemas.workout import WorkoutCreate, WorkoutUpdate, WorkoutResponse
-from app.utils.security import get_current_user
+from app.utils.security import AuthUser, get_auth_user
 
 router = APIRouter(prefix="/api/v1/workouts", tags=["Workouts"])
 
@@ -15,7 +14,7 @@ router = APIRouter(prefix="/api/v1/workouts", tags=["Workouts"])
 @router.post("/", response_model=WorkoutResponse, status_code=status.HTTP_201_CREATED)
 async def create_workout(
     workout_data: WorkoutCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     workout = Workout(
@@ -38,8 +37,8 @@ async def create_workout(
 
 @router.get("/", response_model=list[WorkoutResponse])
 async def get_workouts(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
     category: WorkoutCategory | None = None,
     is_completed: bool | None = None,
     date_from: datetime | None = None,
@@ -63,8 +62,8 @@ async def get_workouts(
 
 @router.get("/today", response_model=list[WorkoutResponse])
 async def get_today_workouts(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + timedelta(days=1)
@@ -79,8 +78,8 @@ async def get_today_workouts(
 
 @router.get("/stats")
 async def get_workout_stats(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=today_start.weekday())
@@ -127,8 +126,8 @@ async def get_workout_stats(
 @router.get("/{workout_id}", response_model=WorkoutResponse)
 async def get_workout(
     workout_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     result = await db.execute(
         select(Workout).where(Workout.id == workout_id, Workout.user_id == current_user.id)
@@ -143,7 +142,7 @@ async def get_workout(
 async def update_workout(
     workout_id: str,
     workout_data: WorkoutUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -162,7 +161,7 @@ async def update_workout(
 @router.patch("/{workout_id}/toggle", response_model=WorkoutResponse)
 async def toggle_workout(
     workout_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -179,7 +178,7 @@ async def toggle_workout(
 @router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workout(
     workout_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_auth_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
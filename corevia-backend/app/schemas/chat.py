@@ -20,6 +20,13 @@ class ChatMessageResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ChatHistoryPage(BaseModel):
+    """Cursor pagination: en yeni mesajlar birinci, novbeti sehife ucun before=next_cursor."""
+    messages: list[ChatMessageResponse]
+    has_more: bool
+    next_cursor: str | None = None
+
+
 class ChatConversation(BaseModel):
     user_id: str
     user_name: str
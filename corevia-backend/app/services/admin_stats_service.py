@@ -0,0 +1,171 @@
+"""
+Admin statistikası — şərti aqreqatlar + arxa fonda yenilənən snapshot
+
+/admin/stats və /admin/metrics hər açılışda cədvəlləri skan etmir:
+nəticə prosesdaxili snapshot-dan verilir, scheduler onu vaxtaşırı yeniləyir.
+Snapshot köhnəldikdə köhnə dəyər dərhal qaytarılır və tək bir yeniləmə
+arxa fonda başladılır (stale-while-revalidate).
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import read_session
+from app.models.chat import ChatMessage
+from app.models.review import Review
+from app.models.subscription import Subscription
+from app.models.user import User, UserType, VerificationStatus
+from app.services.cohort_analytics_service import get_active_users_summary, get_retention_summary
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+SIGNUP_MONTHS = 6
+
+
+def _months_back(month_start: datetime, months: int) -> datetime:
+    year, month = divmod(month_start.year * 12 + month_start.month - 1 - months, 12)
+    return month_start.replace(year=year, month=month + 1)
+
+
+async def compute_admin_stats(db: AsyncSession) -> dict:
+    """/admin/stats + premium conversion üçün saylar — 2 sorğu."""
+    now = datetime.utcnow()
+    week_ago = now - timedelta(days=7)
+    month_ago = now - timedelta(days=30)
+    is_trainer = User.user_type == UserType.trainer
+
+    users = (
+        await db.execute(
+            select(
+                func.count(User.id).label("total_users"),
+                func.count(User.id).filter(User.user_type == UserType.client).label("total_clients"),
+                func.count(User.id).filter(is_trainer).label("total_trainers"),
+                func.count(User.id).filter(
+                    is_trainer, User.verification_status == VerificationStatus.verified
+                ).label("verified_trainers"),
+                func.count(User.id).filter(
+                    is_trainer, User.verification_status == VerificationStatus.pending
+                ).label("pending_verifications"),
+                func.count(User.id).filter(User.is_premium == True).label("premium_users"),
+                func.count(User.id).filter(User.created_at >= week_ago).label("new_users_this_week"),
+                func.count(User.id).filter(User.created_at >= month_ago).label("new_users_this_month"),
+            )
+        )
+    ).one()
+
+    others = (
+        await db.execute(
+            select(
+                select(func.count(Subscription.id))
+                .where(Subscription.is_active == True)
+                .scalar_subquery()
+                .label("active_subscriptions"),
+                select(func.count(Review.id)).scalar_subquery().label("total_reviews"),
+                select(func.count(ChatMessage.id)).scalar_subquery().label("total_messages"),
+                select(func.avg(Review.rating)).scalar_subquery().label("avg_review_rating"),
+            )
+        )
+    ).one()
+
+    return {
+        "total_users": users.total_users,
+        "total_clients": users.total_clients,
+        "total_trainers": users.total_trainers,
+        "verified_trainers": users.verified_trainers,
+        "pending_verifications": users.pending_verifications,
+        "premium_users": users.premium_users,
+        "active_subscriptions": others.active_subscriptions,
+        "total_reviews": others.total_reviews,
+        "total_messages": others.total_messages,
+        "avg_review_rating": round(float(others.avg_review_rating), 2) if others.avg_review_rating else None,
+        "new_users_this_week": users.new_users_this_week,
+        "new_users_this_month": users.new_users_this_month,
+    }
+
+
+async def compute_monthly_signups(db: AsyncSession, months: int = SIGNUP_MONTHS) -> list[dict]:
+    """Son `months` təqvim ayı üzrə qeydiyyat — bir GROUP BY date_trunc('month')."""
+    current_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    first_month = _months_back(current_month, months - 1)
+
+    bucket = func.date_trunc("month", User.created_at)
+    result = await db.execute(
+        select(bucket.label("month"), func.count(User.id))
+        .where(User.created_at >= first_month)
+        .group_by(bucket)
+    )
+    counts = {month.replace(tzinfo=None): count for month, count in result.all()}
+
+    return [
+        {"month": month.strftime("%b %Y"), "signups": counts.get(month, 0)}
+        for month in (_months_back(current_month, i) for i in range(months - 1, -1, -1))
+    ]
+
+
+class AdminStatsSnapshot:
+    """Son hesablanmış admin statistikası (worker başına), single-flight yeniləmə ilə."""
+
+    def __init__(self, max_age_seconds: int):
+        self.max_age_seconds = max_age_seconds
+        self.stats: dict | None = None
+        self.monthly_signups: list[dict] = []
+        self.active_users: dict = {}
+        self.retention: list[dict] = []
+        self.generated_at: datetime | None = None
+        self._refreshed_monotonic = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    def is_fresh(self) -> bool:
+        return (
+            self.stats is not None
+            and time.monotonic() - self._refreshed_monotonic < self.max_age_seconds
+        )
+
+    def start_refresh(self) -> asyncio.Task:
+        """Yeniləməni başlat — artıq işləyirsə eyni task qaytarılır (single-flight)."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._compute())
+            self._refresh_task.add_done_callback(_log_refresh_failure)
+        return self._refresh_task
+
+    async def get(self) -> "AdminStatsSnapshot":
+        if self.stats is None:
+            await asyncio.shield(self.start_refresh())
+        elif not self.is_fresh():
+            # Köhnə snapshot dərhal qaytarılır, yeniləmə arxa fonda
+            self.start_refresh()
+        return self
+
+    async def _compute(self) -> None:
+        started = time.perf_counter()
+        async with read_session() as db:
+            stats = await compute_admin_stats(db)
+            monthly_signups = await compute_monthly_signups(db)
+            active_users = await get_active_users_summary(db)
+            retention = await get_retention_summary(db)
+        self.stats, self.monthly_signups = stats, monthly_signups
+        self.active_users, self.retention = active_users, retention
+        self.generated_at = datetime.utcnow()
+        self._refreshed_monotonic = time.monotonic()
+        logger.info(f"Admin stats snapshot yeniləndi ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Admin stats snapshot xetasi: {task.exception()}")
+
+
+# Global instance
+admin_stats_snapshot = AdminStatsSnapshot(max_age_seconds=settings.admin_stats_refresh_seconds)
+
+
+async def refresh_admin_stats_snapshot() -> None:
+    """Scheduler job-u — snapshot-u admin sorğusunu gözləmədən yenilə."""
+    await asyncio.wait([admin_stats_snapshot.start_refresh()])
@@ -0,0 +1,161 @@
+"""
+Chat real-time push — user kanalları üzrə pub/sub fan-out
+
+Hər worker öz WebSocket abunəçilərini (user_id -> növbələr) saxlayır.
+Hadisələr commit-dən sonra dərc olunur:
+
+- memory: yalnız cari prosesə çatdırılır (testlər, tək worker)
+- redis:  Redis PUBLISH ilə bütün worker-lərə yayılır, hər worker
+          yalnız özünə qoşulmuş user-lərə çatdırır
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "chat:user:"
+QUEUE_SIZE = 100
+
+
+class InMemoryChatBroker:
+    """Prosesdaxili fan-out — user_id üzrə abunəçi növbələri."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+
+    async def publish(self, user_id: str, payload: dict) -> None:
+        self._deliver(user_id, payload)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._subscribers[user_id].add(queue)
+        await self._on_subscribe()
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def close(self) -> None:
+        self._subscribers.clear()
+
+    async def _on_subscribe(self) -> None:
+        pass
+
+    def _deliver(self, user_id: str, payload: dict) -> None:
+        for queue in self._subscribers.get(user_id, ()):
+            if queue.full():
+                # Yavaş client — ən köhnə hadisə atılır, bağlantı bloklanmır
+                queue.get_nowait()
+                logger.warning(f"Chat push növbəsi dolub, köhnə hadisə atıldı: user={user_id}")
+            queue.put_nowait(payload)
+
+
+class RedisChatBroker(InMemoryChatBroker):
+    """Redis pub/sub — worker-lər arası fan-out, lokal çatdırılma InMemoryChatBroker ilə."""
+
+    def __init__(self, redis_url: str) -> None:
+        super().__init__()
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, user_id: str, payload: dict) -> None:
+        await self._redis.publish(f"{CHANNEL_PREFIX}{user_id}", json.dumps(payload, default=str))
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._redis.aclose()
+        await super().close()
+
+    async def _on_subscribe(self) -> None:
+        # Oxuyucu task ilk abunəçi ilə başlayır (worker başına bir Redis bağlantısı)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    user_id = message["channel"][len(CHANNEL_PREFIX):]
+                    if user_id in self._subscribers:
+                        self._deliver(user_id, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Chat pub/sub bağlantısı kəsildi, yenidən qoşulur: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+def _build_broker() -> InMemoryChatBroker:
+    if settings.chat_pubsub_backend == "redis":
+        return RedisChatBroker(settings.redis_url)
+    return InMemoryChatBroker()
+
+
+# Global instance
+chat_broker = _build_broker()
+
+
+# ============================================================
+# Commit-dən sonra dərc — rollback olan mesajlar push edilmir
+# ============================================================
+
+_PENDING_KEY = "chat_push_events"
+_publish_tasks: set[asyncio.Task] = set()
+
+
+def queue_chat_event(session: Session, user_ids: list[str], payload: dict) -> None:
+    """Hadisəni sessiyaya əlavə et — yalnız commit uğurlu olduqda dərc olunur."""
+    session.info.setdefault(_PENDING_KEY, []).append((user_ids, payload))
+
+
+async def _publish_all(events: list[tuple[list[str], dict]]) -> None:
+    for user_ids, payload in events:
+        for user_id in user_ids:
+            try:
+                await chat_broker.publish(user_id, payload)
+            except Exception as e:
+                logger.error(f"Chat push dərc olunmadı: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_events(session: Session) -> None:
+    events = session.info.pop(_PENDING_KEY, None)
+    if not events:
+        return
+    task = asyncio.get_running_loop().create_task(_publish_all(events))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
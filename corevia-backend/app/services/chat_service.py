@@ -0,0 +1,168 @@
+"""
+Chat conversation summary — inbox ucun her cut uzre saxlanilan xulase
+
+send_message son mesaji upsert edir ve qarsi terefin unread sayini artirir,
+read receipt-ler ise oxunmus mesaj sayi qeder azaldir. Inbox belelikle
+mesajlarin sayindan asili olmayan tek indexli sorgudur.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import case, select, tuple_, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.chat import ChatConversationSummary, ChatMessage, DailyMessageCount
+from app.models.user import User
+
+
+def conversation_pair(user_id: str, other_id: str) -> tuple[str, str]:
+    """Cut her zaman (kicik, boyuk) sirasi ile saxlanilir."""
+    return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+
+def _insert(db: AsyncSession, model=ChatConversationSummary):
+    dialect = db.get_bind().dialect.name
+    return (sqlite.insert if dialect == "sqlite" else postgresql.insert)(model)
+
+
+# ============================================================
+# Gunluk mesaj limiti
+# ============================================================
+
+def quota_date() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%d")
+
+
+async def consume_message_quota(db: AsyncSession, user_id: str, limit: int) -> int | None:
+    """Gunluk saygaci atomik artir ve yeni deyeri qaytar; limit dolubsa None.
+
+    Tek INSERT .. ON CONFLICT DO UPDATE .. WHERE count < limit RETURNING count —
+    eyni anda gonderilen mesajlar limiti kece bilmir. Tranzaksiya rollback olsa
+    artim da geri qaytarilir.
+    """
+    stmt = _insert(db, DailyMessageCount).values(
+        id=str(uuid.uuid4()), user_id=user_id, date=quota_date(), count=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailyMessageCount.user_id, DailyMessageCount.date],
+        set_={"count": DailyMessageCount.count + 1},
+        where=DailyMessageCount.count < limit,
+    ).returning(DailyMessageCount.count)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def get_message_quota_used(db: AsyncSession, user_id: str) -> int:
+    """Bu gun gonderilen mesaj sayi (consume_message_quota ile eyni saygac)."""
+    result = await db.execute(
+        select(DailyMessageCount.count).where(
+            DailyMessageCount.user_id == user_id,
+            DailyMessageCount.date == quota_date(),
+        )
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def record_message(db: AsyncSession, message: ChatMessage) -> None:
+    """Yeni mesaji xulaseye yaz: son mesaj + alicinin unread sayi +1 (tek upsert)."""
+    user_a, user_b = conversation_pair(message.sender_id, message.receiver_id)
+    receiver_is_a = message.receiver_id == user_a
+    now = datetime.utcnow()
+
+    stmt = _insert(db).values(
+        id=str(uuid.uuid4()),
+        user_a_id=user_a,
+        user_b_id=user_b,
+        last_message_id=message.id,
+        last_message=message.message,
+        last_message_time=message.created_at,
+        last_sender_id=message.sender_id,
+        unread_a=1 if receiver_is_a else 0,
+        unread_b=0 if receiver_is_a else 1,
+        updated_at=now,
+    )
+    summary = ChatConversationSummary
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[summary.user_a_id, summary.user_b_id],
+            set_={
+                "last_message_id": stmt.excluded.last_message_id,
+                "last_message": stmt.excluded.last_message,
+                "last_message_time": stmt.excluded.last_message_time,
+                "last_sender_id": stmt.excluded.last_sender_id,
+                "unread_a": summary.unread_a + stmt.excluded.unread_a,
+                "unread_b": summary.unread_b + stmt.excluded.unread_b,
+                "updated_at": now,
+            },
+        )
+    )
+
+
+async def decrement_unread(db: AsyncSession, reader_id: str, sender_id: str, count: int) -> None:
+    """reader terefinin unread sayini `count` qeder azalt (0-dan asagi dusmur)."""
+    if count <= 0:
+        return
+    user_a, user_b = conversation_pair(reader_id, sender_id)
+    summary = ChatConversationSummary
+    column = summary.unread_a if reader_id == user_a else summary.unread_b
+    await db.execute(
+        update(summary)
+        .where(summary.user_a_id == user_a, summary.user_b_id == user_b)
+        .values({column.key: case((column > count, column - count), else_=0)})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _inbox_side(user_id: str, is_a: bool, limit: int, cursor: tuple[datetime, str] | None):
+    summary = ChatConversationSummary
+    own, other, unread = (
+        (summary.user_a_id, summary.user_b_id, summary.unread_a)
+        if is_a
+        else (summary.user_b_id, summary.user_a_id, summary.unread_b)
+    )
+    query = select(
+        summary.id,
+        other.label("other_id"),
+        summary.last_message,
+        summary.last_message_time,
+        unread.label("unread_count"),
+    ).where(own == user_id)
+    if cursor is not None:
+        query = query.where(tuple_(summary.last_message_time, summary.id) < tuple_(*cursor))
+    return query.order_by(summary.last_message_time.desc(), summary.id.desc()).limit(limit)
+
+
+async def load_inbox(
+    db: AsyncSession, user_id: str, limit: int, before: str | None = None
+) -> list:
+    """Istifadecinin sohbetleri (en yenisi birinci) qarsi terefin adi/sekli ile.
+
+    `before` — evvelki sehifenin son sohbetinin qarsi teref user id-si.
+    Her teref (user_a / user_b) oz indexi uzre LIMIT ile oxunur.
+    """
+    cursor = None
+    if before:
+        user_a, user_b = conversation_pair(user_id, before)
+        result = await db.execute(
+            select(ChatConversationSummary.last_message_time, ChatConversationSummary.id).where(
+                ChatConversationSummary.user_a_id == user_a,
+                ChatConversationSummary.user_b_id == user_b,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return []
+        cursor = (row.last_message_time, row.id)
+
+    side_a = _inbox_side(user_id, True, limit, cursor).subquery()
+    side_b = _inbox_side(user_id, False, limit, cursor).subquery()
+    merged = union_all(select(side_a), select(side_b)).subquery()
+    result = await db.execute(
+        select(merged, User.name, User.profile_image_url)
+        .join(User, User.id == merged.c.other_id)
+        .order_by(merged.c.last_message_time.desc(), merged.c.id.desc())
+        .limit(limit)
+    )
+    return list(result.all())
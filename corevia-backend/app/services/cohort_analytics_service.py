@@ -0,0 +1,297 @@
+"""
+Cohort analytics — retention və DAU/WAU/MAU üçün gündəlik inkremental rollup
+
+Gündə bir dəfə (scheduler) yalnız dünənki aktivlik oxunur:
+
+1. user_activity_days  — həmin gün aktiv olan user-lər (workout, qida, post, chat)
+2. activity_daily_rollups — DAU / WAU / MAU (user_activity_days üzərindən)
+3. cohort_retention    — qeydiyyat həftəsi/ayı kohortları üzrə aktiv user sayı
+
+Admin oxuması yalnız rollup cədvəllərindən edilir — O(kohort), aktivlik
+tarixçəsi yenidən skan olunmur. Buraxılmış günlər növbəti işə salınmada
+tamamlanır (watermark = son rollup günü).
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, cast, func, literal, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import async_session
+from app.models.analytics import ActivityRollup, CohortRetention, UserActivityDay
+from app.models.chat import ChatMessage
+from app.models.food_entry import FoodEntry
+from app.models.social import Post
+from app.models.user import User
+from app.models.workout import Workout
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Aktivlik mənbələri: (user sütunu, vaxt sütunu)
+ACTIVITY_SOURCES = (
+    (Workout.user_id, Workout.created_at),
+    (FoodEntry.user_id, FoodEntry.created_at),
+    (Post.user_id, Post.created_at),
+    (ChatMessage.sender_id, ChatMessage.created_at),
+)
+
+# Kohort pəncərəsi: neçə həftə / ay geriyə izlənilir
+RETENTION_WEEKS = 12
+RETENTION_MONTHS = 6
+
+# Admin panelində göstərilən dövrlər: (label, period_type, period_index)
+RETENTION_PERIODS = (
+    ("Week 1", "week", 1),
+    ("Week 2", "week", 2),
+    ("Week 3", "week", 3),
+    ("Week 4", "week", 4),
+    ("Month 2", "month", 2),
+    ("Month 3", "month", 3),
+)
+
+# Bir neçə worker eyni anda işə salsa yalnız biri hesablayır
+_ROLLUP_LOCK_ID = 7_301_337
+
+
+def _month_index(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+def _month_start(index: int) -> date:
+    year, month = divmod(index, 12)
+    return date(year, month + 1, 1)
+
+
+def _period_window(day: date, period_type: str) -> tuple[date, date]:
+    """`day`-i əhatə edən təqvim həftəsi (bazar ertəsi) və ya ayı: [start, end)."""
+    if period_type == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    index = _month_index(day)
+    return _month_start(index), _month_start(index + 1)
+
+
+def _period_offset(cohort_start: date, window_start: date, period_type: str) -> int:
+    if period_type == "week":
+        return (window_start - cohort_start).days // 7
+    return _month_index(window_start) - _month_index(cohort_start)
+
+
+async def record_activity_day(db: AsyncSession, day: date) -> None:
+    """Həmin gün aktiv olan user-ləri user_activity_days-ə yaz (yalnız o günün sətirləri oxunur)."""
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=1)
+    active_users = union(
+        *(
+            select(user_col.label("user_id")).where(ts_col >= start, ts_col < end)
+            for user_col, ts_col in ACTIVITY_SOURCES
+        )
+    ).subquery()
+    await db.execute(
+        insert(UserActivityDay)
+        .from_select(["user_id", "day"], select(active_users.c.user_id, literal(day, Date)))
+        .on_conflict_do_nothing()
+    )
+
+
+async def rollup_active_users(db: AsyncSession, day: date) -> None:
+    """DAU / WAU / MAU — `day` daxil olmaqla son 1 / 7 / 30 gün."""
+    counts = (
+        await db.execute(
+            select(
+                func.count(func.distinct(UserActivityDay.user_id)).filter(UserActivityDay.day == day),
+                func.count(func.distinct(UserActivityDay.user_id)).filter(
+                    UserActivityDay.day > day - timedelta(days=7)
+                ),
+                func.count(func.distinct(UserActivityDay.user_id)),
+            ).where(
+                UserActivityDay.day > day - timedelta(days=30),
+                UserActivityDay.day <= day,
+            )
+        )
+    ).one()
+    stmt = insert(ActivityRollup).values(
+        day=day, dau=counts[0], wau=counts[1], mau=counts[2], computed_at=datetime.utcnow()
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ActivityRollup.day],
+            set_={
+                "dau": stmt.excluded.dau,
+                "wau": stmt.excluded.wau,
+                "mau": stmt.excluded.mau,
+                "computed_at": stmt.excluded.computed_at,
+            },
+        )
+    )
+
+
+async def update_cohort_retention(db: AsyncSession, day: date, period_type: str) -> None:
+    """`day`-in düşdüyü həftə/ay üçün hər kohortun aktiv user sayını yenilə."""
+    window_start, window_end = _period_window(day, period_type)
+    if period_type == "week":
+        earliest = window_start - timedelta(weeks=RETENTION_WEEKS)
+    else:
+        earliest = _month_start(_month_index(window_start) - RETENTION_MONTHS)
+
+    active_in_window = select(UserActivityDay.user_id).where(
+        UserActivityDay.day >= window_start,
+        UserActivityDay.day < window_end,
+    )
+    cohort = cast(func.date_trunc(period_type, User.created_at), Date).label("cohort")
+    result = await db.execute(
+        select(
+            cohort,
+            func.count(User.id),
+            func.count(User.id).filter(User.id.in_(active_in_window)),
+        )
+        .where(
+            User.created_at >= datetime.combine(earliest, time.min),
+            User.created_at < datetime.combine(window_end, time.min),
+        )
+        .group_by(cohort)
+    )
+    rows = [
+        {
+            "cohort_start": cohort_start,
+            "period_type": period_type,
+            "period_index": _period_offset(cohort_start, window_start, period_type),
+            "cohort_size": size,
+            "active_users": active,
+            "updated_at": datetime.utcnow(),
+        }
+        for cohort_start, size, active in result.all()
+    ]
+    if not rows:
+        return
+
+    stmt = insert(CohortRetention).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                CohortRetention.cohort_start,
+                CohortRetention.period_type,
+                CohortRetention.period_index,
+            ],
+            set_={
+                "cohort_size": stmt.excluded.cohort_size,
+                "active_users": stmt.excluded.active_users,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def process_day(db: AsyncSession, day: date) -> None:
+    await record_activity_day(db, day)
+    await rollup_active_users(db, day)
+    await update_cohort_retention(db, day, "week")
+    await update_cohort_retention(db, day, "month")
+
+
+async def run_activity_rollup(until: date | None = None) -> int:
+    """Watermark-dan sonrakı bütün tam günləri emal et (default: dünənə qədər). Emal olunan gün sayı."""
+    until = until or datetime.utcnow().date() - timedelta(days=1)
+
+    async with async_session() as db:
+        try:
+            locked = (await db.execute(select(func.pg_try_advisory_xact_lock(_ROLLUP_LOCK_ID)))).scalar()
+            if not locked:
+                logger.info("Activity rollup artıq başqa worker-də işləyir")
+                return 0
+
+            last_day = (await db.execute(select(func.max(ActivityRollup.day)))).scalar()
+            day = (
+                last_day + timedelta(days=1)
+                if last_day
+                else until - timedelta(days=settings.activity_rollup_backfill_days - 1)
+            )
+            processed = 0
+            while day <= until:
+                await process_day(db, day)
+                day += timedelta(days=1)
+                processed += 1
+
+            await db.commit()
+            logger.info(f"Activity rollup: {processed} gün emal olundu (son gün {until})")
+            return processed
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Activity rollup xetasi: {e}")
+            return 0
+
+
+# ============================================================
+# Admin oxumaları — yalnız rollup cədvəlləri
+# ============================================================
+
+async def get_active_users_summary(db: AsyncSession) -> dict:
+    """Son rollup günü üzrə DAU/WAU/MAU və 30 gün əvvəlki MAU (artım üçün)."""
+    latest = (
+        await db.execute(select(ActivityRollup).order_by(ActivityRollup.day.desc()).limit(1))
+    ).scalar_one_or_none()
+    if latest is None:
+        return {"as_of": None, "dau": 0, "wau": 0, "mau": 0, "mau_30d_ago": None}
+
+    previous_mau = (
+        await db.execute(
+            select(ActivityRollup.mau).where(ActivityRollup.day == latest.day - timedelta(days=30))
+        )
+    ).scalar_one_or_none()
+    return {
+        "as_of": latest.day,
+        "dau": latest.dau,
+        "wau": latest.wau,
+        "mau": latest.mau,
+        "mau_30d_ago": previous_mau,
+    }
+
+
+async def get_retention_summary(db: AsyncSession, today: date | None = None) -> list[dict]:
+    """Hər dövr üçün tamamlanmış kohortlar üzrə çəkili retention faizi."""
+    today = today or datetime.utcnow().date()
+    week_indexes = [index for _, period_type, index in RETENTION_PERIODS if period_type == "week"]
+    month_indexes = [index for _, period_type, index in RETENTION_PERIODS if period_type == "month"]
+
+    result = await db.execute(
+        select(CohortRetention).where(
+            (
+                (CohortRetention.period_type == "week")
+                & CohortRetention.period_index.in_(week_indexes)
+                & (CohortRetention.cohort_start >= today - timedelta(weeks=RETENTION_WEEKS))
+            )
+            | (
+                (CohortRetention.period_type == "month")
+                & CohortRetention.period_index.in_(month_indexes)
+                & (CohortRetention.cohort_start >= _month_start(_month_index(today) - RETENTION_MONTHS))
+            )
+        )
+    )
+
+    totals: dict[tuple[str, int], list[int]] = {}
+    for cell in result.scalars().all():
+        # Yalnız pəncərəsi bitmiş (tam) dövrlər hesablanır
+        if cell.period_type == "week":
+            window_end = cell.cohort_start + timedelta(weeks=cell.period_index + 1)
+        else:
+            window_end = _month_start(_month_index(cell.cohort_start) + cell.period_index + 1)
+        if window_end > today or cell.cohort_size == 0:
+            continue
+        total = totals.setdefault((cell.period_type, cell.period_index), [0, 0, 0])
+        total[0] += cell.active_users
+        total[1] += cell.cohort_size
+        total[2] += 1
+
+    retention = []
+    for label, period_type, index in RETENTION_PERIODS:
+        active, size, cohorts = totals.get((period_type, index), (0, 0, 0))
+        retention.append({
+            "period": label,
+            "rate": round(active / size * 100, 1) if size else 0,
+            "cohorts": cohorts,
+        })
+    return retention
@@ -2,45 +2,156 @@
 Fitness News Service - Fitness xəbərləri (lokal mock data)
 
 Cloud AI servisi istifadə olunmur — bütün xəbərlər lokal mock data-dan gəlir.
+
+Keş worker-lər arası paylaşılır (shared_cache): bir worker yeniləyir, digərləri
+eyni siyahını oxuyur. Köhnəlmiş siyahı yenilənənə qədər verilir
+(stale-while-revalidate), yeniləmə hər worker-də tək task-dır və worker-lər
+arası lock ilə bir dəfə işləyir. Hər worker id -> article indeksi saxlayır.
 """
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-import logging
+
+from app.utils.shared_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
+NEWS_CACHE_KEY = "news:articles"
+NEWS_REFRESH_LOCK_KEY = "news:refresh-lock"
+NEWS_FORCE_REFRESH_KEY = "news:force-refresh-cooldown"
+
 
 class FitnessNewsService:
     """Fitness xəbərləri toplayan service (lokal mock data)"""
 
-    # Cache
-    _cached_news: List[Dict[str, Any]] = []
-    _cache_time: datetime = None
-    CACHE_DURATION = timedelta(hours=2)  # 2 saat cache
+    CACHE_DURATION = timedelta(hours=2)  # 2 saat təzə sayılır
+    STALE_DURATION = timedelta(hours=24)  # bu müddətə qədər köhnə siyahı verilir, arxa fonda yenilənir
+    FORCE_REFRESH_COOLDOWN = timedelta(minutes=5)  # məcburi yeniləmələr arası minimum (bütün worker-lər)
+    SYNC_INTERVAL_SECONDS = 30  # lokal kopyanın shared keşlə yoxlanma intervalı
+    REFRESH_LOCK_SECONDS = 30
+    LOCK_POLL_SECONDS = 0.1
 
-    def __init__(self):
+    def __init__(self, cache=shared_cache):
         self.client = None
+        self._cache = cache
+        self._articles: List[Dict[str, Any]] = []
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: datetime | None = None
+        self._synced_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
         logger.info("FitnessNewsService initialized (local mock data)")
 
     async def get_fitness_news(self, limit: int = 10, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Fitness xəbərləri gətir (cache ilə)
         """
-        # Cache yoxla
-        if not force_refresh and self._cached_news and self._cache_time:
-            if datetime.now() - self._cache_time < self.CACHE_DURATION:
-                logger.info("Returning cached fitness news")
-                return self._cached_news[:limit]
+        articles, _ = await self.get_news_with_status(limit=limit, force_refresh=force_refresh)
+        return articles
+
+    async def get_news_with_status(
+        self, limit: int = 10, force_refresh: bool = False
+    ) -> tuple[List[Dict[str, Any]], str]:
+        """Xəbərlər + keş statusu: "fresh" (indi yeniləndi), "cached" və ya "stale"."""
+        if force_refresh and await self.refresh():
+            return self._articles[:limit], "fresh"
+
+        status = await self._ensure_loaded()
+        return self._articles[:limit], status
+
+    async def get_article(self, article_id: str) -> Dict[str, Any] | None:
+        """id -> article (lokal indeksdən, O(1))"""
+        await self._ensure_loaded()
+        return self._index.get(article_id)
+
+    async def refresh(self) -> bool:
+        """Məcburi yeniləmə — cooldown ərzində (bütün worker-lər üzrə) edilmir, False qaytarır."""
+        cooldown = self.FORCE_REFRESH_COOLDOWN.total_seconds()
+        if not await self._cache.add(NEWS_FORCE_REFRESH_KEY, 1, cooldown):
+            logger.info("News force refresh cooldown aktivdir, keşdən verilir")
+            return False
+        await self._refresh()
+        return True
 
-        # Yeni xəbərlər topla
-        logger.info("Fetching fresh fitness news from web")
-        news = await self._fetch_news_with_ai()
+    @property
+    def version(self) -> str | None:
+        """Cari siyahının versiyası (ETag üçün) — yeniləndikdə dəyişir."""
+        return self._fetched_at.isoformat() if self._fetched_at else None
 
-        # Cache-ə yaz
-        self._cached_news = news
-        self._cache_time = datetime.now()
+    def _age(self) -> timedelta | None:
+        return datetime.utcnow() - self._fetched_at if self._fetched_at else None
 
-        return news[:limit]
+    async def _ensure_loaded(self) -> str:
+        await self._sync_from_shared()
+
+        age = self._age()
+        if age is None or age > self.STALE_DURATION:
+            await self._refresh()
+            return "fresh"
+        if age > self.CACHE_DURATION:
+            # Köhnə siyahı dərhal qaytarılır, yeniləmə arxa fonda
+            self._start_refresh()
+            return "stale"
+        return "cached"
+
+    async def _sync_from_shared(self, force: bool = False) -> None:
+        """Başqa worker yeniləyibsə lokal kopyanı və indeksi yenilə."""
+        now = time.monotonic()
+        if not force and self._articles and now - self._synced_at < self.SYNC_INTERVAL_SECONDS:
+            return
+        self._synced_at = now
+        entry = await self._cache.get(NEWS_CACHE_KEY)
+        if entry is None:
+            return
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        if fetched_at != self._fetched_at:
+            self._apply(entry["articles"], fetched_at)
+
+    def _apply(self, articles: List[Dict[str, Any]], fetched_at: datetime) -> None:
+        self._articles = articles
+        self._index = {article["id"]: article for article in articles}
+        self._fetched_at = fetched_at
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Worker daxilində single-flight — eyni anda bir yeniləmə task-ı."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+            self._refresh_task.add_done_callback(_log_refresh_failure)
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        await asyncio.shield(self._start_refresh())
+
+    async def _do_refresh(self) -> None:
+        # Worker-lər arası: yalnız lock-u alan mənbədən çəkir
+        locked = await self._cache.add(NEWS_REFRESH_LOCK_KEY, 1, self.REFRESH_LOCK_SECONDS)
+        if not locked:
+            # Başqa worker yeniləyir — nəticəsini gözlə (lock bitənə qədər)
+            previous = self._fetched_at
+            deadline = time.monotonic() + self.REFRESH_LOCK_SECONDS
+            while time.monotonic() < deadline:
+                await self._sync_from_shared(force=True)
+                if self._fetched_at != previous or await self._cache.get(NEWS_REFRESH_LOCK_KEY) is None:
+                    break
+                await asyncio.sleep(self.LOCK_POLL_SECONDS)
+            if self._articles:
+                return
+
+        try:
+            logger.info("Fetching fresh fitness news from web")
+            news = await self._fetch_news_with_ai()
+            fetched_at = datetime.utcnow()
+            await self._cache.set(
+                NEWS_CACHE_KEY,
+                {"fetched_at": fetched_at.isoformat(), "articles": news},
+                self.STALE_DURATION.total_seconds(),
+            )
+            self._apply(news, fetched_at)
+            self._synced_at = time.monotonic()
+        finally:
+            if locked:
+                await self._cache.delete(NEWS_REFRESH_LOCK_KEY)
 
     async def _fetch_news_with_ai(self) -> List[Dict[str, Any]]:
         """Lokal mock data qaytarır (cloud AI istifadə olunmur)"""
@@ -204,5 +315,10 @@ class FitnessNewsService:
         ]
 
 
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"News refresh xetasi: {task.exception()}")
+
+
 # Singleton instance
 fitness_news_service = FitnessNewsService()
@@ -1,7 +1,8 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,7 +19,9 @@ from app.services.notification_service import (
 
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+# Job saatlari UTC ile verilir (host-un lokal saat qurşagından asılı olmasın);
+# CronTrigger oz timezone-unu scheduler-den almir, ona gore her birine verilir
+scheduler = AsyncIOScheduler(timezone="UTC")
 
 
 async def _get_user_active_tokens(db: AsyncSession, user_id: str) -> list[str]:
@@ -191,7 +194,7 @@ def init_scheduler():
     # Mesq xatirlatmasi - her gun saat 18:00 UTC (Baki: 22:00)
     scheduler.add_job(
         send_workout_reminders,
-        CronTrigger(hour=18, minute=0),
+        CronTrigger(hour=18, minute=0, timezone="UTC"),
         id="workout_reminders",
         replace_existing=True,
     )
@@ -199,13 +202,13 @@ def init_scheduler():
     # Yemek xatirlatmasi - her gun saat 12:00 ve 19:00 UTC
     scheduler.add_job(
         send_meal_reminders,
-        CronTrigger(hour=12, minute=0),
+        CronTrigger(hour=12, minute=0, timezone="UTC"),
         id="meal_reminders_noon",
         replace_existing=True,
     )
     scheduler.add_job(
         send_meal_reminders,
-        CronTrigger(hour=19, minute=0),
+        CronTrigger(hour=19, minute=0, timezone="UTC"),
         id="meal_reminders_evening",
         replace_existing=True,
     )
@@ -213,7 +216,7 @@ def init_scheduler():
     # Heftelik hesabat - her bazar gunu saat 10:00 UTC
     scheduler.add_job(
         send_weekly_reports,
-        CronTrigger(day_of_week="sun", hour=10, minute=0),
+        CronTrigger(day_of_week="sun", hour=10, minute=0, timezone="UTC"),
         id="weekly_reports",
         replace_existing=True,
     )
@@ -221,10 +224,32 @@ def init_scheduler():
     # Bitmis abunelikleri yoxla - her gun saat 00:30 UTC
     scheduler.add_job(
         check_expired_subscriptions,
-        CronTrigger(hour=0, minute=30),
+        CronTrigger(hour=0, minute=30, timezone="UTC"),
         id="check_subscriptions",
         replace_existing=True,
     )
 
+    # Retention / DAU-WAU-MAU rollup - her gun saat 00:15 UTC (dunenki gun),
+    # ve startup-da bir defe (deploy-dan sonra metrikler ilk geceni gozlemesin)
+    from app.services.cohort_analytics_service import run_activity_rollup
+    scheduler.add_job(
+        run_activity_rollup,
+        CronTrigger(hour=0, minute=15, timezone="UTC"),
+        id="activity_rollup",
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
+    # Admin statistika snapshot-u - admin_stats_refresh_seconds-da bir
+    from app.config import get_settings
+    from app.services.admin_stats_service import refresh_admin_stats_snapshot
+    scheduler.add_job(
+        refresh_admin_stats_snapshot,
+        IntervalTrigger(seconds=get_settings().admin_stats_refresh_seconds),
+        id="admin_stats_snapshot",
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
     scheduler.start()
-    logger.info("APScheduler basladildi - 5 job elave olundu")
+    logger.info("APScheduler basladildi - 7 job elave olundu")
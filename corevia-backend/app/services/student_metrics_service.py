@@ -0,0 +1,152 @@
+"""
+Student metrics — trainer dashboard və AI tövsiyələri üçün tələbə statistikası
+
+Tələbə sayından asılı olmayaraq sabit sayda GROUP BY sorğusu işlədilir
+(workout, training plan, meal plan, opsional kalori), N tələbə üçün 4N COUNT yox.
+Qarşısında qısa TTL-li opsional keş durur (student_metrics_cache_ttl_seconds).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.food_entry import FoodEntry
+from app.models.meal_plan import MealPlan
+from app.models.training_plan import TrainingPlan
+from app.models.workout import Workout
+
+settings = get_settings()
+
+
+@dataclass(slots=True)
+class StudentMetrics:
+    total_workouts: int = 0
+    week_workouts: int = 0  # Workout.date >= since
+    week_logged_workouts: int = 0  # Workout.created_at >= since
+    training_plans: int = 0
+    completed_training_plans: int = 0
+    meal_plans: int = 0
+    completed_meal_plans: int = 0
+    total_calories: int = 0
+
+    @property
+    def active_training_plans(self) -> int:
+        return self.training_plans - self.completed_training_plans
+
+    @property
+    def active_meal_plans(self) -> int:
+        return self.meal_plans - self.completed_meal_plans
+
+
+class StudentMetricsCache:
+    """(trainer, tələbələr, parametrlər) -> metriklər, qısa TTL ilə."""
+
+    def __init__(self, ttl_seconds: int = 0, max_size: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._store: dict[tuple, tuple[float, dict[str, StudentMetrics]]] = {}
+
+    def window_key(self, since: datetime) -> int:
+        """`since` TTL addımına yuvarlaqlaşdırılmış — eyni pəncərə (now - 7 gün) TTL ərzində
+        eyni açarı verir, fərqli pəncərələr fərqli açar alır."""
+        return int(since.timestamp()) // max(self.ttl_seconds, 1)
+
+    def get(self, key: tuple) -> dict[str, StudentMetrics] | None:
+        if self.ttl_seconds <= 0:
+            return None
+        entry = self._store.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key: tuple, metrics: dict[str, StudentMetrics]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._store) >= self.max_size:
+            self._store = {k: v for k, v in self._store.items() if v[0] >= now}
+            if len(self._store) >= self.max_size:
+                self._store.clear()
+        self._store[key] = (now + self.ttl_seconds, metrics)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# Global instance
+student_metrics_cache = StudentMetricsCache(ttl_seconds=settings.student_metrics_cache_ttl_seconds)
+
+
+async def _plan_counts(db: AsyncSession, model, student_ids: list[str], trainer_id: str | None):
+    query = select(
+        model.assigned_student_id,
+        func.count(model.id),
+        func.count(model.id).filter(model.is_completed == True),
+    ).where(model.assigned_student_id.in_(student_ids))
+    if trainer_id is not None:
+        query = query.where(model.trainer_id == trainer_id)
+    result = await db.execute(query.group_by(model.assigned_student_id))
+    return result.all()
+
+
+async def get_student_metrics(
+    db: AsyncSession,
+    student_ids: list[str],
+    since: datetime,
+    trainer_id: str | None = None,
+    with_calories: bool = False,
+) -> dict[str, StudentMetrics]:
+    """student_id -> StudentMetrics (tələbə sayından asılı olmayaraq 3-4 sorğu).
+
+    trainer_id verilərsə plan sayları yalnız həmin trainer-in planlarıdır.
+    """
+    if not student_ids:
+        return {}
+
+    cache_key = (
+        trainer_id, tuple(sorted(student_ids)), student_metrics_cache.window_key(since), with_calories
+    )
+    cached = student_metrics_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    metrics = {student_id: StudentMetrics() for student_id in student_ids}
+
+    workouts = await db.execute(
+        select(
+            Workout.user_id,
+            func.count(Workout.id),
+            func.count(Workout.id).filter(Workout.date >= since),
+            func.count(Workout.id).filter(Workout.created_at >= since),
+        )
+        .where(Workout.user_id.in_(student_ids))
+        .group_by(Workout.user_id)
+    )
+    for user_id, total, week, week_logged in workouts.all():
+        m = metrics[user_id]
+        m.total_workouts, m.week_workouts, m.week_logged_workouts = total, week, week_logged
+
+    for student_id, total, completed in await _plan_counts(db, TrainingPlan, student_ids, trainer_id):
+        m = metrics[student_id]
+        m.training_plans, m.completed_training_plans = total, completed
+
+    for student_id, total, completed in await _plan_counts(db, MealPlan, student_ids, trainer_id):
+        m = metrics[student_id]
+        m.meal_plans, m.completed_meal_plans = total, completed
+
+    if with_calories:
+        calories = await db.execute(
+            select(FoodEntry.user_id, func.coalesce(func.sum(FoodEntry.calories), 0))
+            .where(FoodEntry.user_id.in_(student_ids))
+            .group_by(FoodEntry.user_id)
+        )
+        for user_id, total in calories.all():
+            metrics[user_id].total_calories = int(total or 0)
+
+    student_metrics_cache.set(cache_key, metrics)
+    return metrics
@@ -0,0 +1,117 @@
+"""
+Auth user cache — get_current_user-in hər sorğuda `select(User)` etməsinin qarşısını alır.
+
+JWT identifikasiyanı (sub) verir; hesabın auth üçün lazım olan vəziyyəti
+(is_active, user_type, is_premium) qısa TTL ilə prosesdaxili keşdə saxlanılır.
+User sətri dəyişib commit olunduqda (profil, premium, trainer, silinmə) həmin
+user-in keşi avtomatik təmizlənir — session event-ləri ilə.
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.user import User, UserType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """Autentifikasiya olunmuş user-in yüngül təsviri (ORM obyekti deyil)."""
+
+    id: str
+    user_type: UserType
+    is_premium: bool
+    is_active: bool = True
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthUser":
+        return cls(
+            id=user.id,
+            user_type=user.user_type,
+            is_premium=bool(user.is_premium),
+            is_active=bool(user.is_active),
+        )
+
+
+class AuthUserCache:
+    """user_id -> AuthUser, TTL və maksimum ölçü ilə."""
+
+    def __init__(self, ttl_seconds: int = 60, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._store: dict[str, tuple[float, AuthUser]] = {}
+
+    def get(self, user_id: str) -> AuthUser | None:
+        if self.ttl_seconds <= 0:
+            return None
+        entry = self._store.get(user_id)
+        if entry is None:
+            return None
+        expires_at, auth_user = entry
+        if expires_at < time.monotonic():
+            self._store.pop(user_id, None)
+            return None
+        return auth_user
+
+    def set(self, auth_user: AuthUser) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._store) >= self.max_size:
+            self._evict(now)
+        self._store[auth_user.id] = (now + self.ttl_seconds, auth_user)
+
+    def invalidate(self, user_id: str) -> None:
+        self._store.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def _evict(self, now: float) -> None:
+        """Əvvəlcə vaxtı keçənləri, sonra ən köhnə yarını sil."""
+        expired = [key for key, (expires_at, _) in self._store.items() if expires_at < now]
+        for key in expired:
+            del self._store[key]
+        if len(self._store) >= self.max_size:
+            oldest = sorted(self._store.items(), key=lambda item: item[1][0])
+            for key, _ in oldest[: len(oldest) // 2]:
+                del self._store[key]
+
+
+def _build_cache() -> AuthUserCache:
+    from app.config import get_settings
+    return AuthUserCache(ttl_seconds=get_settings().auth_user_cache_ttl_seconds)
+
+
+# Global instance
+auth_user_cache = _build_cache()
+
+
+# ============================================================
+# Invalidation — User dəyişiklikləri commit olunduqda keşi təmizlə
+# ============================================================
+
+_PENDING_KEY = "auth_cache_invalidate"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id:
+            session.info.setdefault(_PENDING_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        auth_user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_users(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,195 @@
+"""
+HTTP conditional caching — ETag / If-None-Match (304) və Cache-Control
+
+Nadir dəyişən GET endpoint-ləri üçün (xəbərlər, planlar, trainer profilləri ...):
+
+- cache_response()  — cavabı JSON-a çevirir, ETag-i məzmundan (güclü) və ya
+  verilmiş versiya damğasından (zəif, W/"...") hesablayır; If-None-Match
+  uyğundursa gövdəsiz 304 qaytarır. Cache-Control route-a görə verilir.
+- shared_response() — hamı üçün eyni olan (anonim / paylaşılan) cavablar üçün
+  server tərəfli keş: gövdə + ETag shared_cache-də saxlanılır, DB sorğusu
+  yalnız keş boş olduqda işləyir.
+- invalidate_on_commit() — model dəyişikliyi commit olunduqda həmin
+  shared_response açarlarını silir (session event-ləri ilə).
+- invalidate_keys_on_commit() — ORM obyekti olmayan yazılar (bulk update())
+  üçün açarları sessiyaya əl ilə qeyd edir; commit-dən sonra silinir.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+from app.config import get_settings
+from app.utils.responses import render_json
+from app.utils.shared_cache import shared_cache
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_PREFIX = "http:"
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Route üçün Cache-Control: max_age=0 — client hər dəfə ETag ilə yoxlayır."""
+
+    max_age: int = 0
+    private: bool = True
+    stale_while_revalidate: int = 0
+
+    @property
+    def header(self) -> str:
+        parts = ["private" if self.private else "public", f"max-age={self.max_age}"]
+        if self.stale_while_revalidate:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(parts)
+
+
+def content_etag(body: bytes) -> str:
+    """Gövdədən güclü ETag."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def version_etag(*parts: Any) -> str:
+    """Versiya damğasından (updated_at, fetched_at, parametrlər ...) zəif ETag."""
+    raw = "|".join(str(part) for part in parts).encode()
+    return 'W/"' + hashlib.blake2b(raw, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match müqayisəsi (zəif müqayisə, RFC 9110 13.1.2)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+
+def not_modified(etag: str, policy: CachePolicy) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": policy.header})
+
+
+def _render(content: Any) -> bytes:
+    return render_json(content)
+
+
+def cache_response(
+    request: Request,
+    content: Any,
+    policy: CachePolicy,
+    etag: str | None = None,
+) -> Response:
+    """content -> JSON cavab (ETag + Cache-Control) və ya 304.
+
+    etag verilərsə (version_etag) 304 halında gövdə heç serializasiya olunmur.
+    """
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag, policy)
+
+    body = _render(content)
+    etag = etag or content_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag, policy)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": policy.header},
+    )
+
+
+async def shared_response(
+    request: Request,
+    key: str,
+    build: Callable[[], Awaitable[Any]],
+    policy: CachePolicy,
+    ttl_seconds: int | None = None,
+) -> Response:
+    """Paylaşılan cavab — server keşindən (gövdə + ETag), yoxdursa build() ilə.
+
+    Yalnız user-dən asılı olmayan cavablar üçün istifadə edin.
+    """
+    ttl = settings.http_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+    entry = await shared_cache.get(HTTP_CACHE_PREFIX + key) if ttl > 0 else None
+    if entry is None:
+        body = _render(await build())
+        entry = {"etag": content_etag(body), "body": body.decode()}
+        if ttl > 0:
+            await shared_cache.set(HTTP_CACHE_PREFIX + key, entry, ttl)
+
+    if etag_matches(request, entry["etag"]):
+        return not_modified(entry["etag"], policy)
+    return Response(
+        content=entry["body"],
+        media_type="application/json",
+        headers={"ETag": entry["etag"], "Cache-Control": policy.header},
+    )
+
+
+async def invalidate(*keys: str) -> None:
+    for key in keys:
+        await shared_cache.delete(HTTP_CACHE_PREFIX + key)
+
+
+# ============================================================
+# Invalidation — model dəyişiklikləri commit olunduqda server keşini təmizlə
+# ============================================================
+
+_PENDING_KEY = "http_cache_invalidate"
+_invalidators: dict[type, Callable[[Any], Iterable[str]]] = {}
+_invalidate_tasks: set[asyncio.Task] = set()
+
+
+def invalidate_on_commit(model: type, keys: Callable[[Any], Iterable[str]]) -> None:
+    """`model` sətri yaranıb/dəyişib/silinib commit olunduqda keys(obj) açarlarını sil."""
+    _invalidators[model] = keys
+
+
+def invalidate_keys_on_commit(db: AsyncSession, *keys: str) -> None:
+    """Açarları bu sessiya commit olunduqda sil (bulk update() session event-lərindən keçmir)."""
+    db.sync_session.info.setdefault(_PENDING_KEY, set()).update(keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_objects(session: Session, flush_context) -> None:
+    if not _invalidators:
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        keys = _invalidators.get(type(obj))
+        if keys is not None:
+            session.info.setdefault(_PENDING_KEY, set()).update(keys(obj))
+
+
+async def _invalidate_logged(keys: set[str]) -> None:
+    try:
+        await invalidate(*keys)
+    except Exception as e:
+        logger.error(f"HTTP cache invalidation xətası: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEY, None)
+    if not keys:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # sinxron skriptlər — keş TTL ilə köhnəlir
+    task = loop.create_task(_invalidate_logged(keys))
+    _invalidate_tasks.add(task)
+    task.add_done_callback(_invalidate_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
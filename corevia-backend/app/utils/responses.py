@@ -0,0 +1,66 @@
+"""
+Fast JSON response — orjson / pydantic-core ilə serializasiya (opt-in)
+
+İki istifadə yolu:
+
+1. Router səviyyəsində — json.dumps əvəzinə orjson:
+
+       router = APIRouter(..., default_response_class=FastJSONResponse)
+
+2. Ağır route-larda cavabı birbaşa qaytarmaq — FastAPI-nin response_model
+   üzrə təkrar validasiyası və jsonable_encoder addımı atlanır:
+
+       return FastJSONResponse(FeedResponse(...))
+
+   Pydantic model (və ya modellər siyahısı) pydantic-core-un Rust serializer-i
+   ilə birbaşa JSON-a yazılır — response_model yolu ilə eyni çıxış. Digər
+   məzmun orjson ilə yazılır: datetime/date, UUID, Enum nativdir, Decimal /
+   set / iç-içə model jsonable_encoder ilə eyni formada çevrilir.
+   Yalnız artıq sxemə çevrilmiş məzmun qaytarın (ORM obyekti yox) —
+   response_model burada sahələri süzmür.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any
+
+import orjson
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """orjson-un bilmədiyi tiplər — jsonable_encoder ilə eyni nəticə."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    return jsonable_encoder(obj)
+
+
+def render_json(content: Any) -> bytes:
+    if isinstance(content, BaseModel) or (
+        isinstance(content, list) and content and all(isinstance(item, BaseModel) for item in content)
+    ):
+        return pydantic_core.to_json(content, by_alias=True)
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse, json.dumps əvəzinə orjson / pydantic-core ilə."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import bcrypt
 from jose import JWTError, jwt
@@ -6,22 +8,56 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.config import get_settings
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, readonly_session, request_user_id
+from app.models.user import User, UserType
+from app.utils.auth_cache import AuthUser, auth_user_cache
 
 settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+# bcrypt CPU-ağır əməliyyatdır (~100-300 ms) — event loop-u bloklamamaq üçün
+# async handler-lər ayrıca, ölçüsü məhdud thread pool-dan istifadə edir.
+# bcrypt C kodu GIL-i buraxır, ona görə thread-lər paralel işləyir.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Hash konfiqurasiya olunmuş bcrypt cost ilə yaradılmayıbsa True.
+
+    Format: $2b$<cost>$<salt+hash>
+    """
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.bcrypt_rounds
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
@@ -36,10 +72,14 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def get_auth_user(token: str = Depends(oauth2_scheme)) -> AuthUser:
+    """Dependency: JWT + keşlənmiş auth vəziyyəti, tam ORM User yüklənmir.
+
+    Yalnız id / user_type / is_premium lazım olan endpoint-lər üçündür.
+    Keş boşdursa ya token claim-lərinə güvənilir (auth_trust_token_claims),
+    ya da users cədvəlindən yalnız 4 sütun oxunur — qısa ömürlü sessiya ilə,
+    bağlantı endpoint-in öz sessiyasına qədər saxlanmır.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -54,13 +94,83 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None or not user.is_active:
+    auth_user = auth_user_cache.get(user_id)
+    if auth_user is None:
+        auth_user = _auth_user_from_claims(payload) if settings.auth_trust_token_claims else None
+        if auth_user is None:
+            async with readonly_session() as db:
+                result = await db.execute(
+                    select(User.id, User.user_type, User.is_premium, User.is_active)
+                    .where(User.id == user_id)
+                )
+                row = result.one_or_none()
+            if row is None:
+                raise credentials_exception
+            auth_user = AuthUser(
+                id=row.id,
+                user_type=row.user_type,
+                is_premium=bool(row.is_premium),
+                is_active=bool(row.is_active),
+            )
+        auth_user_cache.set(auth_user)
+
+    if not auth_user.is_active:
         raise credentials_exception
+    request_user_id.set(auth_user.id)
+    return auth_user
+
+
+def _auth_user_from_claims(payload: dict) -> AuthUser | None:
+    try:
+        return AuthUser(
+            id=payload["sub"],
+            user_type=UserType(payload["user_type"]),
+            is_premium=bool(payload["is_premium"]),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+async def get_current_user(
+    auth_user: AuthUser = Depends(get_auth_user),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Dependency: tam ORM User — profil sahələri lazım olan və ya User-i dəyişən endpoint-lər üçün."""
+    user = await db.get(User, auth_user.id)
+    if user is None or not user.is_active:
+        auth_user_cache.invalidate(auth_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    auth_user_cache.set(AuthUser.from_user(user))
     return user
 
 
+def _ensure_premium(current_user: User | AuthUser) -> None:
+    if not current_user.is_premium:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bu funksiya yalniz Premium istifadeciler ucundur. Premium abuneliq alin.",
+        )
+
+
+def _ensure_premium_or_trainer(current_user: User | AuthUser) -> None:
+    """Trainer-ler premium olmadan da istifade ede bilir, client-ler ucun premium teleb olunur."""
+    if current_user.user_type == UserType.trainer:
+        return
+    _ensure_premium(current_user)
+
+
+def _ensure_trainer(current_user: User | AuthUser) -> None:
+    if current_user.user_type != UserType.trainer:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bu funksiya yalniz trainer-ler ucundur.",
+        )
+
+
 async def get_premium_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -68,11 +178,7 @@ async def get_premium_user(
 
     Defense in depth — always checks the DB field, not just the JWT claim.
     """
-    if not current_user.is_premium:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Bu funksiya yalniz Premium istifadeciler ucundur. Premium abuneliq alin.",
-        )
+    _ensure_premium(current_user)
     return current_user
 
 
@@ -81,14 +187,7 @@ async def get_premium_or_trainer(
 ) -> User:
     """Dependency: trainer-ler premium olmadan da istifade ede bilir,
     amma client-ler ucun premium teleb olunur."""
-    from app.models.user import UserType
-    if current_user.user_type == UserType.trainer:
-        return current_user
-    if not current_user.is_premium:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Bu funksiya yalniz Premium istifadeciler ucundur. Premium abuneliq alin.",
-        )
+    _ensure_premium_or_trainer(current_user)
     return current_user
 
 
@@ -96,10 +195,28 @@ async def require_trainer(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """Dependency: only trainers can access."""
-    from app.models.user import UserType
-    if current_user.user_type != UserType.trainer:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Bu funksiya yalniz trainer-ler ucundur.",
-        )
+    _ensure_trainer(current_user)
+    return current_user
+
+
+# ── AuthUser variantları — ORM User yükləmədən eyni yoxlamalar ────────────
+
+async def get_premium_auth_user(
+    current_user: AuthUser = Depends(get_auth_user),
+) -> AuthUser:
+    _ensure_premium(current_user)
+    return current_user
+
+
+async def get_premium_or_trainer_auth_user(
+    current_user: AuthUser = Depends(get_auth_user),
+) -> AuthUser:
+    _ensure_premium_or_trainer(current_user)
+    return current_user
+
+
+async def require_trainer_auth_user(
+    current_user: AuthUser = Depends(get_auth_user),
+) -> AuthUser:
+    _ensure_trainer(current_user)
     return current_user
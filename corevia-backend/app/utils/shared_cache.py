@@ -0,0 +1,93 @@
+"""
+Shared cache — worker-lər arası paylaşılan sadə key/value keş
+
+cache_backend=redis olduqda bütün uvicorn worker-ləri eyni Redis-i görür;
+memory (default) yalnız cari proses üçündür (tək worker, testlər).
+Dəyərlər JSON-a çevrilə bilən olmalıdır. `add` yalnız açar yoxdursa yazır —
+worker-lər arası lock / cooldown üçün istifadə olunur.
+"""
+
+import json
+import logging
+import time
+from typing import Any
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class InMemorySharedCache:
+    """Prosesdaxili backend — açar -> (bitmə vaxtı, dəyər)."""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._store: dict[str, tuple[float, Any]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        now = time.monotonic()
+        if len(self._store) >= self.max_size:
+            self._store = {k: v for k, v in self._store.items() if v[0] >= now}
+        self._store[key] = (now + ttl_seconds, value)
+
+    async def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    async def close(self) -> None:
+        self._store.clear()
+
+
+class RedisSharedCache:
+    """Redis backend — bütün worker-lər eyni dəyəri görür."""
+
+    def __init__(self, redis_url: str, prefix: str = "corevia:cache:"):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._redis.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self._redis.set(self.prefix + key, json.dumps(value, default=str), px=int(ttl_seconds * 1000))
+
+    async def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        return bool(
+            await self._redis.set(
+                self.prefix + key, json.dumps(value, default=str), px=int(ttl_seconds * 1000), nx=True
+            )
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self.prefix + key)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def _build_cache() -> InMemorySharedCache | RedisSharedCache:
+    settings = get_settings()
+    if settings.cache_backend == "redis":
+        return RedisSharedCache(settings.redis_url)
+    return InMemorySharedCache()
+
+
+# Global instance
+shared_cache = _build_cache()
@@ -0,0 +1,199 @@
+"""
+JSON Response Benchmark for CoreVia Backend
+Measures per-request latency of the heaviest payloads: FastAPI default JSONResponse
+vs FastJSONResponse as response_class vs FastJSONResponse returned directly
+
+Uses the real response schemas (analytics dashboard, social feed, marketplace
+list) plus a 500-row map payload without response_model (UUID / Decimal / Enum /
+datetime — the Menzilim /listings/map shape), served by a minimal FastAPI app
+through ASGI so the full FastAPI serialization path is included. All variants
+must produce identical JSON — checked before timing.
+
+Usage (from corevia-backend/):
+    python -m tests.load.bench_json_responses --requests 300 --page-size 50
+"""
+
+import argparse
+import asyncio
+import enum
+import json
+import os
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+os.environ.setdefault("SECRET_KEY", "bench-" + "x" * 64)
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.schemas.analytics import (  # noqa: E402
+    AnalyticsDashboardResponse,
+    NutritionTrend,
+    ProgressTrend,
+    WeeklyStatsResponse,
+    WorkoutTrend,
+)
+from app.schemas.marketplace import MarketplaceListResponse, ProductAuthor, ProductResponse  # noqa: E402
+from app.schemas.social import FeedResponse, PostAuthor, PostResponse  # noqa: E402
+from app.utils.responses import FastJSONResponse  # noqa: E402
+
+
+class ListingType(str, enum.Enum):
+    SALE = "sale"
+    RENT = "rent"
+
+
+def _dashboard() -> AnalyticsDashboardResponse:
+    today = date.today()
+    days = [today - timedelta(days=i) for i in range(30)]
+    return AnalyticsDashboardResponse(
+        current_week=WeeklyStatsResponse(
+            week_start=today - timedelta(days=6), week_end=today, workouts_completed=5,
+            total_workout_minutes=240, calories_burned=2100, calories_consumed=14000,
+            distance_km=21.5, avg_daily_calories_burned=300, avg_daily_calories_consumed=2000,
+            weight_change_kg=-0.4, workout_consistency_percent=71,
+        ),
+        weight_trend=[ProgressTrend(date=d, value=80 - i * 0.05, change_from_previous=-0.05) for i, d in enumerate(days)],
+        workout_trend=[WorkoutTrend(date=d, workouts_count=1, minutes=45, calories=350) for d in days],
+        nutrition_trend=[NutritionTrend(date=d, calories=2000, protein=120.5, carbs=210.0, fats=70.2) for d in days],
+        total_workouts_30d=22, total_minutes_30d=990, total_calories_burned_30d=7700,
+        avg_daily_calories=2000, workout_streak_days=4,
+    )
+
+
+def _feed(page_size: int) -> FeedResponse:
+    now = datetime.utcnow()
+    posts = [
+        PostResponse(
+            id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), post_type="workout",
+            content="Bu gün 10 km qaçdım və 3 set squat etdim 💪 " * 3,
+            image_url=f"/uploads/posts/{uuid.uuid4()}.jpg", workout_id=str(uuid.uuid4()),
+            food_entry_id=None, likes_count=i * 3, comments_count=i, is_public=True,
+            created_at=now - timedelta(minutes=i), updated_at=now,
+            author=PostAuthor(id=str(uuid.uuid4()), name=f"İstifadəçi {i}", profile_image_url=None, user_type="client"),
+            is_liked=i % 2 == 0,
+        )
+        for i in range(page_size)
+    ]
+    return FeedResponse(posts=posts, total=1000, page=1, page_size=page_size, has_more=True)
+
+
+def _marketplace(page_size: int) -> MarketplaceListResponse:
+    now = datetime.utcnow()
+    products = [
+        ProductResponse(
+            id=str(uuid.uuid4()), seller_id=str(uuid.uuid4()), product_type="workout_plan",
+            title=f"12 həftəlik güc proqramı #{i}", description="Detallı proqram, video izahlarla. " * 5,
+            price=19.99 + i, currency="AZN", cover_image_url=f"/uploads/products/{uuid.uuid4()}.jpg",
+            preview_video_url=None, sales_count=i * 7, rating=4.6, reviews_count=i,
+            is_published=True, created_at=now, updated_at=now,
+            seller=ProductAuthor(id=str(uuid.uuid4()), name=f"Trainer {i}", rating=4.8),
+        )
+        for i in range(page_size)
+    ]
+    return MarketplaceListResponse(products=products, total=500, page=1, page_size=page_size, has_more=True)
+
+
+def _map_rows(rows: int = 500) -> list[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "price": Decimal("125000.00") + i,
+            "listing_type": ListingType.SALE if i % 2 else ListingType.RENT,
+            "latitude": 40.37 + i * 1e-4,
+            "longitude": 49.83 + i * 1e-4,
+            "rooms": i % 5 + 1,
+            "is_boosted": i % 7 == 0,
+            "created_at": now,
+        }
+        for i in range(rows)
+    ]
+
+
+def _endpoints(payload):
+    # Closure — default arg olsaydı FastAPI onu query parametri sayıb hər sorğuda deepcopy edərdi
+    async def std():
+        return payload
+
+    async def direct():
+        return FastJSONResponse(payload)
+
+    return std, direct
+
+
+def build_app(page_size: int) -> FastAPI:
+    payloads = {
+        "dashboard": (_dashboard(), AnalyticsDashboardResponse),
+        "feed": (_feed(page_size), FeedResponse),
+        "marketplace": (_marketplace(page_size), MarketplaceListResponse),
+        "map": (_map_rows(), None),
+    }
+    app = FastAPI()
+    for name, (payload, model) in payloads.items():
+        std, direct = _endpoints(payload)
+        app.add_api_route(f"/std/{name}", std, methods=["GET"], response_model=model)
+        app.add_api_route(
+            f"/orjson/{name}", std, methods=["GET"],
+            response_model=model, response_class=FastJSONResponse,
+        )
+        app.add_api_route(f"/direct/{name}", direct, methods=["GET"], response_model=model)
+    return app
+
+
+# std = FastAPI default, orjson = response_class, direct = route returns FastJSONResponse(...)
+VARIANTS = ("std", "orjson", "direct")
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    samples = sorted(samples)
+    return samples[max(int(len(samples) * pct) - 1, 0)]
+
+
+async def run(client: httpx.AsyncClient, path: str, requests: int) -> tuple[list[float], int]:
+    for _ in range(20):  # warm-up
+        await client.get(path)
+    latencies = []
+    size = 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(path)
+        latencies.append((time.perf_counter() - start) * 1000)
+        size = len(response.content)
+    return latencies, size
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    app = build_app(args.page_size)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print("=" * 100)
+        print(f"requests={args.requests}  page_size={args.page_size}")
+        print("=" * 100)
+        for name in ("dashboard", "feed", "marketplace", "map"):
+            expected = json.loads((await client.get(f"/std/{name}")).content)
+            for variant in VARIANTS[1:]:
+                got = json.loads((await client.get(f"/{variant}/{name}")).content)
+                assert got == expected, f"{name}/{variant}: output differs"
+
+            std_lat, size = await run(client, f"/std/{name}", args.requests)
+            line = f"{name:<12} {size / 1024:6.1f} KB  std p50={statistics.median(std_lat):6.2f} p99={_percentile(std_lat, 0.99):6.2f}"
+            for variant in VARIANTS[1:]:
+                lat, _ = await run(client, f"/{variant}/{name}", args.requests)
+                line += (
+                    f" | {variant} p50={statistics.median(lat):6.2f}"
+                    f" ({statistics.median(lat) / statistics.median(std_lat):.2f}x)"
+                    f" p99={_percentile(lat, 0.99):6.2f}"
+                )
+            print(line + " ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
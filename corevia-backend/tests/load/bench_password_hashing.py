@@ -0,0 +1,78 @@
+"""
+Password Hashing Benchmark for CoreVia Backend
+Measures login throughput and event loop stalls: sync bcrypt vs bounded executor
+
+Usage (from corevia-backend/):
+    python -m tests.load.bench_password_hashing --logins 50 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("SECRET_KEY", "bench-" + "x" * 64)
+
+from app.utils import security  # noqa: E402
+
+PASSWORD = "LoadTest123!"
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.01):
+    """Event loop gecikməsini ölç — bloklanma olduqda lag böyüyür"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def _login_sync(hashed: str) -> bool:
+    return security.verify_password(PASSWORD, hashed)
+
+
+async def _login_async(hashed: str) -> bool:
+    return await security.verify_password_async(PASSWORD, hashed)
+
+
+async def run_burst(name: str, login, hashed: str, logins: int) -> None:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login(hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+    assert all(results)
+
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+    print(
+        f"{name:<22} {logins / elapsed:8.1f} logins/s  "
+        f"loop lag p50={statistics.median(lags) if lags else 0.0:7.1f}ms "
+        f"p99={p99:7.1f}ms max={max(lags, default=0.0):7.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=security.settings.bcrypt_rounds)
+    args = parser.parse_args()
+
+    security.settings.bcrypt_rounds = args.rounds
+    hashed = security.hash_password(PASSWORD)
+
+    print("=" * 60)
+    print(f"bcrypt cost={args.rounds}  logins={args.logins}  "
+          f"workers={security.settings.password_hash_workers}")
+    print("=" * 60)
+    await run_burst("sync (event loop)", _login_sync, hashed, args.logins)
+    await run_burst("async (executor)", _login_async, hashed, args.logins)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
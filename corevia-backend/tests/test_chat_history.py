@@ -0,0 +1,261 @@
+"""
+Chat history pagination and read receipts
+/api/v1/chat/messages/{user_id} merges the two directions of a conversation
+(one LIMIT per direction, then a union); paging with before=next_cursor must
+walk the whole conversation without gaps or duplicates. Marking read must
+touch only the peer's messages up to the cursor.
+
+Runs against the database in DATABASE_URL; every test seeds its own users
+and messages and removes them afterwards.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, or_, select
+
+from app.database import async_session, engine
+from app.main import app
+from app.models.chat import ChatConversationSummary, ChatMessage
+from app.models.user import User, UserType
+from app.utils.security import create_access_token
+
+
+async def _seed_conversation() -> dict:
+    """Trainer <-> client conversation plus a third user writing to the trainer.
+
+    Messages alternate direction irregularly and several share a created_at,
+    so the page boundary falls between directions and inside timestamp ties.
+    """
+    suffix = uuid.uuid4().hex[:12]
+    trainer = User(
+        name="Chat Trainer", email=f"chat-trainer-{suffix}@test.com",
+        hashed_password="!", user_type=UserType.trainer,
+    )
+    client = User(
+        name="Chat Client", email=f"chat-client-{suffix}@test.com",
+        hashed_password="!", user_type=UserType.client, is_premium=True,
+    )
+    outsider = User(
+        name="Chat Outsider", email=f"chat-outsider-{suffix}@test.com",
+        hashed_password="!", user_type=UserType.client, is_premium=True,
+    )
+    users = [trainer, client, outsider]
+
+    base = datetime.utcnow() - timedelta(days=1)
+    async with async_session() as session:
+        session.add_all(users)
+        await session.flush()
+        messages = []
+        for i in range(37):
+            sender, receiver = (trainer, client) if i % 5 in (0, 2) else (client, trainer)
+            messages.append(ChatMessage(
+                sender_id=sender.id,
+                receiver_id=receiver.id,
+                message=f"message {i}",
+                # Odd messages share a timestamp with the one before
+                created_at=base + timedelta(seconds=i - i % 2),
+            ))
+        outsider_messages = [
+            ChatMessage(
+                sender_id=outsider.id, receiver_id=trainer.id,
+                message=f"outsider {i}", created_at=base + timedelta(seconds=i * 4),
+            )
+            for i in range(5)
+        ]
+        session.add_all(messages + outsider_messages)
+        await session.commit()
+
+    return {
+        "trainer": trainer,
+        "client": client,
+        "outsider": outsider,
+        "user_ids": [user.id for user in users],
+        "messages": messages,
+        "outsider_messages": outsider_messages,
+    }
+
+
+async def _cleanup(seed: dict) -> None:
+    user_ids = seed["user_ids"]
+    async with async_session() as session:
+        await session.execute(delete(ChatMessage).where(
+            or_(ChatMessage.sender_id.in_(user_ids), ChatMessage.receiver_id.in_(user_ids))
+        ))
+        await session.execute(delete(ChatConversationSummary).where(
+            or_(ChatConversationSummary.user_a_id.in_(user_ids),
+                ChatConversationSummary.user_b_id.in_(user_ids))
+        ))
+        await session.execute(delete(User).where(User.id.in_(user_ids)))
+        await session.commit()
+    # Each test has its own event loop; pooled connections must not outlive it
+    await engine.dispose()
+
+
+def _headers(user: User) -> dict:
+    token = create_access_token({
+        "sub": user.id,
+        "user_type": user.user_type.value,
+        "is_premium": user.is_premium,
+    })
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _client() -> AsyncClient:
+    # Own RateLimitMiddleware bucket per test: paging with limit=1 alone is ~40 requests
+    client_ip = f"10.{uuid.uuid4().int % 250}.{uuid.uuid4().int % 250}.{uuid.uuid4().int % 250}"
+    return AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"X-Forwarded-For": client_ip},
+    )
+
+
+def _newest_first(messages: list[ChatMessage]) -> list[str]:
+    return [m.id for m in sorted(messages, key=lambda m: (m.created_at, m.id), reverse=True)]
+
+
+async def _read_ids(message_ids: list[str]) -> set[str]:
+    async with async_session() as session:
+        result = await session.execute(
+            select(ChatMessage.id).where(ChatMessage.id.in_(message_ids), ChatMessage.is_read == True)
+        )
+        return set(result.scalars().all())
+
+
+class TestChatHistoryPagination:
+    """Cursor paging across both directions of a conversation"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [1, 4, 5, 7, 50])
+    async def test_pages_have_no_gaps_or_duplicates(self, limit):
+        seed = await _seed_conversation()
+        try:
+            async with _client() as client:
+                seen, before, pages = [], None, 0
+                while True:
+                    params = {"limit": limit} if before is None else {"limit": limit, "before": before}
+                    response = await client.get(
+                        f"/api/v1/chat/messages/{seed['client'].id}",
+                        params=params,
+                        headers=_headers(seed["trainer"]),
+                    )
+                    assert response.status_code == 200
+                    page = response.json()
+                    assert len(page["messages"]) <= limit
+                    seen.extend(m["id"] for m in page["messages"])
+                    pages += 1
+                    if not page["has_more"]:
+                        assert page["next_cursor"] is None
+                        break
+                    assert page["next_cursor"] == page["messages"][-1]["id"]
+                    before = page["next_cursor"]
+                    assert pages <= len(seed["messages"])
+
+                # Every message of the pair exactly once, newest first; none of the outsider's
+                assert seen == _newest_first(seed["messages"])
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_both_participants_see_the_same_history(self):
+        seed = await _seed_conversation()
+        try:
+            async with _client() as client:
+                histories = []
+                for user, other in ((seed["trainer"], seed["client"]), (seed["client"], seed["trainer"])):
+                    response = await client.get(
+                        f"/api/v1/chat/messages/{other.id}",
+                        params={"limit": 100},
+                        headers=_headers(user),
+                    )
+                    assert response.status_code == 200
+                    histories.append([m["id"] for m in response.json()["messages"]])
+
+                assert histories[0] == histories[1] == _newest_first(seed["messages"])
+        finally:
+            await _cleanup(seed)
+
+
+class TestChatReadReceipts:
+    """Only the peer's messages up to the cursor are marked read"""
+
+    @pytest.mark.asyncio
+    async def test_read_up_to_marks_only_peer_messages_up_to_cursor(self):
+        seed = await _seed_conversation()
+        try:
+            trainer, peer = seed["trainer"], seed["client"]
+            ordered = sorted(seed["messages"], key=lambda m: (m.created_at, m.id))
+            incoming = [m for m in ordered if m.sender_id == peer.id]
+            cursor = incoming[len(incoming) // 2]
+
+            async with _client() as client:
+                response = await client.post(
+                    f"/api/v1/chat/read/{peer.id}",
+                    params={"up_to": cursor.id},
+                    headers=_headers(trainer),
+                )
+                assert response.status_code == 200
+
+            expected = {
+                m.id for m in incoming if (m.created_at, m.id) <= (cursor.created_at, cursor.id)
+            }
+            assert response.json()["updated"] == len(expected)
+
+            all_ids = [m.id for m in seed["messages"] + seed["outsider_messages"]]
+            # Not the trainer's own messages, not the outsider's, not the peer's newer ones
+            assert await _read_ids(all_ids) == expected
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_history_page_marks_read_up_to_its_newest_message(self):
+        seed = await _seed_conversation()
+        try:
+            trainer, peer = seed["trainer"], seed["client"]
+            newest_first = sorted(seed["messages"], key=lambda m: (m.created_at, m.id), reverse=True)
+            before = newest_first[9]
+
+            async with _client() as client:
+                response = await client.get(
+                    f"/api/v1/chat/messages/{peer.id}",
+                    params={"limit": 10, "before": before.id},
+                    headers=_headers(trainer),
+                )
+                assert response.status_code == 200
+                page = response.json()["messages"]
+
+            newest_on_page = newest_first[10]
+            assert page[0]["id"] == newest_on_page.id
+            expected = {
+                m.id for m in seed["messages"]
+                if m.sender_id == peer.id
+                and (m.created_at, m.id) <= (newest_on_page.created_at, newest_on_page.id)
+            }
+            all_ids = [m.id for m in seed["messages"] + seed["outsider_messages"]]
+            assert await _read_ids(all_ids) == expected
+
+            # The response reports the state it just wrote
+            for message in page:
+                assert message["is_read"] == (message["id"] in expected)
+        finally:
+            await _cleanup(seed)
+
+    @pytest.mark.asyncio
+    async def test_read_up_to_message_of_another_conversation_returns_404(self):
+        seed = await _seed_conversation()
+        try:
+            async with _client() as client:
+                response = await client.post(
+                    f"/api/v1/chat/read/{seed['client'].id}",
+                    params={"up_to": seed["outsider_messages"][-1].id},
+                    headers=_headers(seed["trainer"]),
+                )
+                assert response.status_code == 404
+
+            all_ids = [m.id for m in seed["messages"] + seed["outsider_messages"]]
+            assert await _read_ids(all_ids) == set()
+        finally:
+            await _cleanup(seed)